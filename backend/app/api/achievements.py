@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, UploadFile, File, Form
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
 from app.core.database import get_session
+from app.core.cache import response_cache
+from app.core import leaderboard, achievement_import
 from app.models import Achievement, User, Event
-from app.schemas.achievements import AchievementCreate, AchievementOut
+from app.schemas.achievements import AchievementCreate, AchievementOut, LeaderboardEntryOut
 from app.api.auth import get_current_user
 
 router = APIRouter(
@@ -11,6 +14,20 @@ router = APIRouter(
     tags=["Achievements"]
 )
 
+# Public listings are identical for every caller, so their serialized bodies are cached
+CACHE_NAMESPACE = "achievements"
+achievement_list_adapter = TypeAdapter(List[AchievementOut])
+
+def cached_json(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+def achievements_query(db: Session):
+    # Users and events are fetched in one extra IN query each, instead of one lazy load per row
+    return db.query(Achievement).options(
+        selectinload(Achievement.user),
+        selectinload(Achievement.event)
+    )
+
 # Helper to enrich response
 def enrich_achievement(ach, user=None, event=None):
     out = AchievementOut.model_validate(ach)
@@ -45,6 +62,7 @@ def create_achievement(
         raise HTTPException(status_code=403, detail="Not authorized to create achievements")
 
     # Validate Event if provided
+    event = None
     if achievement.event_id:
         event = db.query(Event).filter(Event.id == achievement.event_id).first()
         if not event:
@@ -81,44 +99,123 @@ def create_achievement(
         external_event_name=achievement.external_event_name
     )
     db.add(new_achievement)
+    leaderboard.apply_achievement(db, new_achievement, student, event=event)
     db.commit()
     db.refresh(new_achievement)
+    response_cache.invalidate(CACHE_NAMESPACE)
     
     return enrich_achievement(new_achievement, user=student)
 
+@router.post("/import")
+def import_achievements(
+    file: UploadFile = File(...),
+    event_id: int = Form(...),
+    badge: str = Form("Participate"),
+    category: str = Form("Internal"),
+    title: Optional[str] = Form(None),
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Records a whole results sheet for one event (CSV with a registration_number
+    column). Valid rows are inserted together; the rest come back in `errors`.
+    """
+    if current_user.role not in ["faculty", "admin"]:
+        raise HTTPException(status_code=403, detail="Not authorized to create achievements")
+
+    event = db.query(Event).filter(Event.id == event_id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    try:
+        report = achievement_import.import_results(db, event, file.file, badge=badge, category=category, title=title)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not read CSV: {e}")
+    if report["created"]:
+        response_cache.invalidate(CACHE_NAMESPACE)
+    return report
+
 @router.get("/all", response_model=List[AchievementOut])
 def get_all_achievements(
+    request: Request,
     category: Optional[str] = None,
     event_id: Optional[int] = None,
+    branch: Optional[str] = None,
+    year: Optional[int] = None,
+    badge: Optional[str] = None,
     db: Session = Depends(get_session)
 ):
-    query = db.query(Achievement)
+    cache_key = response_cache.make_key(CACHE_NAMESPACE, request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached_json(cached)
+
+    query = achievements_query(db)
     
     if category:
         query = query.filter(Achievement.category == category)
     if event_id:
         query = query.filter(Achievement.event_id == event_id)
+    if badge:
+        query = query.filter(Achievement.badge == badge)
+    if branch or year:
+        # Student filters are pushed into SQL via a join on users
+        query = query.join(User, Achievement.user_id == User.id)
+        if branch:
+            query = query.filter(User.branch == branch)
+        if year:
+            query = query.filter(User.year == year)
         
     # Sort by latest
     achievements = query.order_by(Achievement.created_at.desc()).all()
     
-    return [enrich_achievement(ach) for ach in achievements]
+    items = [enrich_achievement(ach) for ach in achievements]
+    body = response_cache.set(cache_key, achievement_list_adapter.dump_json(items))
+    return cached_json(body)
 
 
 @router.get("/event/{event_id}", response_model=List[AchievementOut])
 def get_event_achievements(
     event_id: int,
+    request: Request,
+    db: Session = Depends(get_session)
+):
+    cache_key = response_cache.make_key(CACHE_NAMESPACE, request)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return cached_json(cached)
+
+    achievements = achievements_query(db).filter(Achievement.event_id == event_id).all()
+    items = [enrich_achievement(ach) for ach in achievements]
+    body = response_cache.set(cache_key, achievement_list_adapter.dump_json(items))
+    return cached_json(body)
+
+@router.get("/leaderboard", response_model=List[LeaderboardEntryOut])
+def get_leaderboard(
+    branch: Optional[str] = None,
+    year: Optional[int] = None,
+    club_id: int = leaderboard.OVERALL,
+    limit: int = 10,
     db: Session = Depends(get_session)
 ):
-    achievements = db.query(Achievement).filter(Achievement.event_id == event_id).all()
-    return [enrich_achievement(ach) for ach in achievements]
+    return leaderboard.top_entries(db, club_id=club_id, branch=branch, year=year, limit=min(limit, 100))
+
+@router.get("/leaderboard/me", response_model=Optional[LeaderboardEntryOut])
+def get_my_rank(
+    branch: Optional[str] = None,
+    year: Optional[int] = None,
+    club_id: int = leaderboard.OVERALL,
+    db: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    return leaderboard.rank_of(db, current_user, club_id=club_id, branch=branch, year=year)
 
 @router.get("/my", response_model=List[AchievementOut])
 def get_my_achievements(
     db: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
-    achievements = db.query(Achievement).filter(Achievement.user_id == current_user.id).order_by(Achievement.created_at.desc()).all()
+    achievements = db.query(Achievement).options(selectinload(Achievement.event)).filter(Achievement.user_id == current_user.id).order_by(Achievement.created_at.desc()).all()
     return [enrich_achievement(ach, user=current_user) for ach in achievements]
 
 @router.delete("/{id}")
@@ -134,6 +231,9 @@ def delete_achievement(
     if not achievement:
         raise HTTPException(status_code=404, detail="Achievement not found")
         
+    if achievement.user:  # the student's account may be gone; nothing left to rank then
+        leaderboard.apply_achievement(db, achievement, achievement.user, sign=-1)
     db.delete(achievement)
     db.commit()
+    response_cache.invalidate(CACHE_NAMESPACE)
     return {"message": "Achievement deleted successfully"}
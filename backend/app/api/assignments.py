@@ -4,19 +4,23 @@ import os
 import uuid
 from pathlib import Path
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form, Query
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, func, case
 from app.core.database import get_session
-from app.models import Assignment, Submission, User
-from app.schemas.assignments import AssignmentCreate, AssignmentRead, SubmissionRead
+from app.core import dashboard_stats, similarity, submission_stats
+from app.core.uploads import upload_dir
+from app.core.visibility import assignment_targets
+from app.models import (
+    Assignment, Submission, SubmissionCount, SubmissionFingerprint, SubmissionLshBucket, SubmissionSimilarity, User
+)
+from app.schemas.assignments import AssignmentCreate, AssignmentRead, AssignmentFeedItem, SubmissionRead, RosterSummary, AssignmentRoster, SimilarityReport
 from app.api.deps import require_faculty, require_student, get_current_active_user
 
 router = APIRouter(prefix="/assignments", tags=["assignments"])
 
-# Ensure uploads directory exists
+# Created on first upload (see app/core/uploads.py)
 UPLOAD_DIR = Path("uploads/assignments")
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 @router.post("/", response_model=AssignmentRead)
 def create_assignment(
@@ -34,7 +38,7 @@ def create_assignment(
     if file:
         file_ext = file.filename.split(".")[-1]
         unique_filename = f"{uuid.uuid4()}.{file_ext}"
-        file_path = UPLOAD_DIR / unique_filename
+        file_path = upload_dir("assignments") / unique_filename
         
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
@@ -62,6 +66,8 @@ def create_assignment(
     session.add(db_assignment)
     session.commit()
     session.refresh(db_assignment)
+    # Pending counts change for every student in the targeted branch/section
+    dashboard_stats.invalidate_all()
     db_assignment.faculty = current_user
     return db_assignment
 
@@ -74,6 +80,41 @@ def read_assignments(
     assignments = session.execute(query).scalars().all()
     return assignments
 
+@router.get("/feed", response_model=List[AssignmentFeedItem])
+def read_assignment_feed(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(require_student)
+):
+    """
+    Assignments targeted at the caller's branch/section, each annotated with the
+    caller's submission status, upcoming deadlines first.
+    """
+    now = datetime.utcnow()
+
+    # Latest submission per assignment for this student (students may resubmit)
+    my_submissions = select(
+        Submission.assignment_id,
+        func.max(Submission.submitted_at).label("submitted_at")
+    ).where(Submission.student_id == current_user.id)\
+     .group_by(Submission.assignment_id)\
+     .subquery()
+
+    is_past = case((Assignment.deadline < now, 1), else_=0)
+    query = select(Assignment, my_submissions.c.submitted_at)\
+        .outerjoin(my_submissions, my_submissions.c.assignment_id == Assignment.id)\
+        .options(joinedload(Assignment.faculty))\
+        .where(assignment_targets(current_user))\
+        .order_by(is_past.asc(), Assignment.deadline.asc())
+
+    feed = []
+    for assignment, submitted_at in session.execute(query).all():
+        item = AssignmentFeedItem.model_validate(assignment)
+        item.is_submitted = submitted_at is not None
+        item.submitted_at = submitted_at
+        item.is_overdue = submitted_at is None and assignment.deadline < now
+        feed.append(item)
+    return feed
+
 @router.delete("/{assignment_id}")
 def delete_assignment(
     assignment_id: int,
@@ -86,9 +127,13 @@ def delete_assignment(
     if assignment.faculty_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this assignment")
     
+    for model in (SubmissionSimilarity, SubmissionLshBucket, SubmissionFingerprint):
+        session.query(model).filter(model.assignment_id == assignment_id).delete()
     session.query(Submission).filter(Submission.assignment_id == assignment_id).delete()
+    session.query(SubmissionCount).filter(SubmissionCount.assignment_id == assignment_id).delete()
     session.delete(assignment)
     session.commit()
+    dashboard_stats.invalidate_all()
     return {"message": "Assignment deleted successfully"}
 
 @router.get("/me/submissions", response_model=List[SubmissionRead])
@@ -102,6 +147,7 @@ def get_my_submissions(
 @router.post("/{assignment_id}/submit", response_model=SubmissionRead)
 async def submit_assignment(
     assignment_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     reg_no: str = Form(...),
     branch: str = Form(...),
@@ -142,6 +188,7 @@ async def submit_assignment(
     else:
          static_url = "/static/" + relative_path
          
+    submission_stats.record_submission(session, assignment, current_user, datetime.utcnow())
     db_submission = Submission(
         assignment_id=assignment_id,
         student_id=current_user.id,
@@ -151,8 +198,14 @@ async def submit_assignment(
         section=section
     )
     session.add(db_submission)
+    session.flush()
+    similarity.enqueue(session, db_submission)
     session.commit()
     session.refresh(db_submission)
+    dashboard_stats.invalidate_user(current_user.id, "student")
+    dashboard_stats.invalidate_user(faculty_id, "faculty")
+    # Fingerprint it after the response; the periodic sweep catches anything missed
+    background_tasks.add_task(similarity.process_pending)
     return db_submission
 
 @router.get("/{assignment_id}/submissions", response_model=List[SubmissionRead])
@@ -183,3 +236,43 @@ def read_submissions(
         response.append(sub_dict)
         
     return response
+
+def _owned_assignment(session: Session, assignment_id: int, user: User) -> Assignment:
+    assignment = session.query(Assignment).filter(Assignment.id == assignment_id).first()
+    if not assignment:
+        raise HTTPException(status_code=404, detail="Assignment not found")
+    if assignment.faculty_id != user.id and user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized to view these submissions")
+    return assignment
+
+@router.get("/{assignment_id}/roster/summary", response_model=RosterSummary)
+def read_roster_summary(
+    assignment_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(require_faculty)
+):
+    """Submitted / late / missing counts per section, from the counts kept on submit."""
+    assignment = _owned_assignment(session, assignment_id, current_user)
+    return submission_stats.summary(session, assignment)
+
+@router.get("/{assignment_id}/roster", response_model=AssignmentRoster)
+def read_roster(
+    assignment_id: int,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(require_faculty)
+):
+    """Every student the assignment targets, split into on time, late and missing."""
+    assignment = _owned_assignment(session, assignment_id, current_user)
+    return submission_stats.roster(session, assignment)
+
+@router.get("/{assignment_id}/similarity", response_model=SimilarityReport)
+def read_similarity_report(
+    assignment_id: int,
+    min_score: float = Query(similarity.REPORT_THRESHOLD, ge=similarity.REPORT_THRESHOLD, le=1),
+    limit: int = Query(200, ge=1, le=1000),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(require_faculty)
+):
+    """Pairs of submissions from different students with a large share of identical text, most similar first."""
+    assignment = _owned_assignment(session, assignment_id, current_user)
+    return similarity.report(session, assignment, min_score=min_score, limit=limit)
@@ -1,25 +1,54 @@
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 from app.core.database import get_session
-from app.core.security import create_access_token, get_password_hash, verify_password
-from app.models import User, OTP
-from app.schemas.auth import Token, UserCreate, UserOut, OTPRequest, PasswordReset
-from app.api.deps import get_current_user
+from jose import jwt
+from app.core.security import create_access_token, get_password_hash, verify_password, SECRET_KEY, ALGORITHM
+from app.models import User
+from app.schemas.auth import Token, UserCreate, UserOut, OTPRequest, PasswordReset, RefreshRequest, LogoutRequest
+from app.api.deps import get_current_user, require_admin, oauth2_scheme
 from app.core.email_utils import generate_otp, print_otp_to_console, send_email_otp
+from app.core import otp_store as otp
+from app.core.rate_limit import token_bucket
+from app.core.login_guard import login_guard
+from app.core import refresh_tokens
+from app.core.revocation import revocation_list
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# OTP request limits: a short burst, then one code per minute per email / two per minute per IP
+otp_email_limiter = token_bucket("otp-email", capacity=3, refill_per_second=1 / 60)
+otp_ip_limiter = token_bucket("otp-ip", capacity=10, refill_per_second=1 / 30)
+
+def rate_limited(retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many OTP requests. Please wait before trying again.",
+        headers={"Retry-After": str(int(retry_after) + 1)},
+    )
+
 @router.post("/login", response_model=Token)
-def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), session: Session = Depends(get_session)):
+def login_for_access_token(http_request: Request, form_data: OAuth2PasswordRequestForm = Depends(), session: Session = Depends(get_session)):
     # Strip whitespace and normalize case
     email_clean = form_data.username.strip().lower()
+    client_ip = http_request.client.host if http_request.client else "unknown"
+
+    # Locked-out IPs / accounts are turned away before any DB or bcrypt work
+    retry_after = login_guard.check(client_ip, email_clean)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts. Please try again later.",
+            headers={"Retry-After": str(int(retry_after) + 1)},
+        )
 
     user = session.execute(select(User).where(User.email == email_clean)).scalars().first()
     
     if not user:
+        login_guard.record_failure(client_ip, email_clean)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
@@ -27,52 +56,97 @@ def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), ses
         )
         
     if not verify_password(form_data.password, user.password_hash):
+        login_guard.record_failure(client_ip, email_clean)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    login_guard.record_success(client_ip, email_clean)
+    refresh_token, _ = refresh_tokens.issue(session, user)
+    session.commit()
+    return {"access_token": issue_access_token(user), "token_type": "bearer", "refresh_token": refresh_token}
+
+def issue_access_token(user: User) -> str:
     # Add extra claims to token
     claims = {
         "role": user.role,
         "id": user.id,
         "branch": user.branch,
         "section": user.section,
-        "section": user.section,
         "year": user.year
     }
-    
-    access_token = create_access_token(subject=user.email, additional_claims=claims)
-    return {"access_token": access_token, "token_type": "bearer"}
+    return create_access_token(subject=user.email, additional_claims=claims)
+
+@router.post("/refresh", response_model=Token)
+def refresh_access_token(data: RefreshRequest, session: Session = Depends(get_session)):
+    """
+    Swaps a refresh token for a new access token + refresh token (rotation).
+    Each refresh token works once; replaying an old one revokes the whole login.
+    """
+    user, refresh_token = refresh_tokens.rotate(session, data.refresh_token)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return {"access_token": issue_access_token(user), "token_type": "bearer", "refresh_token": refresh_token}
+
+@router.post("/logout")
+def logout(
+    data: Optional[LogoutRequest] = None,
+    token: str = Depends(oauth2_scheme),
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session)
+):
+    """Revokes the current access token and the given refresh token (or all of them)."""
+    data = data or LogoutRequest()
+    if data.all_devices:
+        refresh_tokens.revoke_all(session, current_user.id)
+    elif data.refresh_token:
+        row = refresh_tokens.find(session, data.refresh_token)
+        if row and row.user_id == current_user.id:
+            refresh_tokens.revoke_family(session, row.family_id)
+    session.commit()
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    if payload.get("jti"):
+        revocation_list.revoke(session, payload["jti"], datetime.utcfromtimestamp(payload["exp"]))
+    return {"message": "Logged out successfully."}
+
+@router.get("/login-guard/metrics")
+def login_guard_metrics(admin: User = Depends(require_admin)):
+    """Login guard counters for this worker (attempts, rejections, lockouts)."""
+    return login_guard.metrics()
 
 @router.post("/send-otp")
-def send_otp(request: OTPRequest, session: Session = Depends(get_session)):
+def send_otp(request: OTPRequest, http_request: Request):
     """
-    Generates a 6-digit OTP, stores it in DB, and sends email Synchronously.
-    Waits for SMTP confirmation before returning success.
+    Generates a 6-digit OTP, keeps it in the OTP store (expires after 5 minutes),
+    and sends email Synchronously. Rate limited per email and per client IP.
     """
-    # 1. Check if user already exists (For registration flow we might allow it? 
-    # Usually we check duplicates at end, or warn here. 
-    # For now, we allow sending OTP to anyone to verify email ownership).
-    
-    # 2. Generate OTP
+    # Same key however the address is typed, or case/whitespace variants would each get their own limit and code
+    email = request.email.strip().lower()
+
+    # 1. Rate limits (no DB work for flooded requests)
+    client_ip = http_request.client.host if http_request.client else "unknown"
+    allowed, retry_after = otp_ip_limiter.take(client_ip)
+    if not allowed:
+        raise rate_limited(retry_after)
+    allowed, retry_after = otp_email_limiter.take(email)
+    if not allowed:
+        raise rate_limited(retry_after)
+    
+    # 2. Generate OTP and store it (replaces any previous code for this email)
     code = generate_otp()
-    # expires_at removed, calculated from created_at
-    
-    # 3. Store in DB (Invalidate old OTPs for this email?)
-    # Optional: Delete old OTPs
-    session.query(OTP).filter(OTP.email == request.email).delete()
+    otp.otp_store.put(email, code, request.reason)
     
-    # Fix: Use correct model fields (otp instead of code, purpose instead of default)
-    otp_entry = OTP(email=request.email, otp=code, purpose=request.reason)
-    session.add(otp_entry)
-    session.commit()
-    
-    # 4. Send Email Synchronously - STRICT CHECK
+    # 3. Send Email Synchronously - STRICT CHECK
     # This will BLOCK until email is sent or fails.
-    print(f"DEBUG: Attempting to send OTP email to {request.email}...")
-    success = send_email_otp(request.email, code, request.reason)
+    print(f"DEBUG: Attempting to send OTP email to {email}...")
+    success = send_email_otp(email, code, request.reason)
     print(f"DEBUG: Result of send_email_otp: {success}")
     
     
@@ -84,42 +158,31 @@ def send_otp(request: OTPRequest, session: Session = Depends(get_session)):
     
     return {"message": "OTP sent successfully."}
 
-def verify_otp_logic(session: Session, email: str, code: str):
+def verify_otp_logic(email: str, code: str):
     """
     Helper to verify OTP. Raises HTTPException if invalid.
+    `email` must be normalized (stripped, lowercased) like in send_otp.
+    A code is consumed on success; too many wrong guesses discard it.
     """
-    otp_entry = session.execute(
-        select(OTP).where(OTP.email == email).order_by(OTP.created_at.desc())
-    ).scalars().first()
+    result = otp.otp_store.verify(email, code)
     
-    if not otp_entry:
-        raise HTTPException(status_code=400, detail="No OTP found for this email.")
-        
-    # Fix: Check against 'otp' field
-    if otp_entry.otp != code:
+    if result == otp.NOT_FOUND:
+        raise HTTPException(status_code=400, detail="No OTP found for this email or it has expired. Please request a new one.")
+    if result == otp.TOO_MANY_ATTEMPTS:
+        raise HTTPException(status_code=400, detail="Too many incorrect attempts. Please request a new OTP.")
+    if result == otp.INVALID:
         raise HTTPException(status_code=400, detail="Invalid OTP code.")
-        
-    # Fix: Calculate expiration dynamically (5 mins)
-    if otp_entry.created_at + timedelta(minutes=5) < datetime.utcnow():
-        raise HTTPException(status_code=400, detail="OTP has expired. Please request a new one.")
-        
-    # Fix: Check 'is_verified' instead of 'is_used'
-    if otp_entry.is_verified:
-         raise HTTPException(status_code=400, detail="OTP already used.")
-         
-    # Mark as verified
-    otp_entry.is_verified = True
-    session.add(otp_entry)
-    session.commit()
     return True
 
 @router.post("/register", response_model=UserOut)
 def register_user(user_in: UserCreate, session: Session = Depends(get_session)):
+    email = user_in.email.strip().lower()  # as in send_otp and login
+
     # 1. Verify OTP first
-    verify_otp_logic(session, user_in.email, user_in.otp)
+    verify_otp_logic(email, user_in.otp)
 
     # 2. Check if user exists (Email)
-    existing_user = session.execute(select(User).where(User.email == user_in.email)).scalars().first()
+    existing_user = session.execute(select(User).where(User.email == email)).scalars().first()
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
@@ -134,7 +197,7 @@ def register_user(user_in: UserCreate, session: Session = Depends(get_session)):
     # Force role to student and save details
     user = User(
         name=user_in.name,
-        email=user_in.email,
+        email=email,
         password_hash=hashed_password,
         role="student", # Forced
         registration_number=user_in.registration_number,
@@ -150,17 +213,21 @@ def register_user(user_in: UserCreate, session: Session = Depends(get_session)):
 
 @router.post("/reset-password")
 def reset_password(data: PasswordReset, session: Session = Depends(get_session)):
+    email = data.email.strip().lower()  # as in send_otp and login
+
     # 1. Verify OTP
-    verify_otp_logic(session, data.email, data.otp)
+    verify_otp_logic(email, data.otp)
     
     # 2. Get User
-    user = session.execute(select(User).where(User.email == data.email)).scalars().first()
+    user = session.execute(select(User).where(User.email == email)).scalars().first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
         
     # 3. Update Password
     user.password_hash = get_password_hash(data.new_password)
     session.add(user)
+    # Sign out every other session
+    refresh_tokens.revoke_all(session, user.id)
     session.commit()
     
     return {"message": "Password updated successfully. You can now login."}
@@ -0,0 +1,80 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, model_serializer
+
+from app.api import assignments, auth, clubs, college_announcements, college_events
+from app.api.deps import get_current_active_user, get_viewer
+from app.core import dashboard_stats
+from app.core.bundle import gather_sections
+from app.core.visibility import ViewerContext
+from app.models import User
+from app.schemas.assignments import AssignmentRead
+from app.schemas.auth import UserOut
+from app.schemas.content import AnnouncementRead, EventRead
+
+# One request per page instead of one per widget: the sections of a bundle are
+# built concurrently, each on its own pooled connection, after a single auth check.
+router = APIRouter(prefix="/bundles", tags=["bundles"])
+
+class ClubPageBundle(BaseModel):
+    club: clubs.ClubRead
+    members: List[clubs.ClubMemberRead]
+    events: List[EventRead]
+    announcements: List[AnnouncementRead]
+
+class DashboardStats(BaseModel):
+    # Keys depend on the role (see app/core/dashboard_stats.py); the others are left out,
+    # so this serializes like /dashboard/stats
+    users: Optional[int] = None  # admin
+    events: Optional[int] = None
+    announcements: Optional[int] = None
+    assignments_created: Optional[int] = None  # faculty
+    submissions_received: Optional[int] = None
+    submissions_this_week: Optional[int] = None
+    pending_assignments: Optional[int] = None  # student
+    events_registered: Optional[int] = None
+    registrations_this_week: Optional[int] = None  # admin and student
+
+    @model_serializer(mode="wrap")
+    def _drop_unset(self, handler):
+        return {key: value for key, value in handler(self).items() if value is not None}
+
+class DashboardBundle(BaseModel):
+    me: UserOut
+    stats: DashboardStats
+    assignments: List[AssignmentRead]
+    college_events: List[EventRead]
+    college_announcements: List[AnnouncementRead]
+
+@router.get("/clubs/{club_id}", response_model=ClubPageBundle)
+async def club_page_bundle(club_id: int, current_user: User = Depends(get_current_active_user)):
+    """Everything ClubDetail needs for first paint: /clubs/{id} + members + events + announcements."""
+    user_id = current_user.id
+    return await gather_sections({
+        "club": (lambda session: clubs.club_detail(session, club_id, user_id), clubs.ClubRead),
+        "members": (lambda session: clubs.club_members(session, club_id), List[clubs.ClubMemberRead]),
+        "events": (lambda session: clubs.club_events(session, club_id, user_id), List[EventRead]),
+        "announcements": (lambda session: clubs.club_announcements(session, club_id), List[AnnouncementRead]),
+    })
+
+@router.get("/dashboard", response_model=DashboardBundle)
+async def dashboard_bundle(
+    current_user: User = Depends(get_current_active_user),
+    viewer: ViewerContext = Depends(get_viewer)
+):
+    """/auth/me + /dashboard/stats + /assignments + /college/events + /college/announcements in one round trip."""
+    # Sections run on other threads: they get the id and reload the user in their
+    # own session instead of sharing this request's session and its instances
+    user_id = current_user.id
+
+    def user(session):
+        return session.get(User, user_id)
+
+    return await gather_sections({
+        "me": (lambda session: auth.read_users_me(user(session), session), UserOut),
+        "stats": (lambda session: dashboard_stats.get_stats(session, user(session)), DashboardStats),
+        "assignments": (lambda session: assignments.read_assignments(session, user(session)), List[AssignmentRead]),
+        "college_events": (lambda session: college_events.college_events_for(session, viewer), List[EventRead]),
+        "college_announcements": (lambda session: college_announcements.college_announcements_for(session, viewer), List[AnnouncementRead]),
+    })
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_active_user, get_viewer
+from app.core import feed_version, ics, schedule
+from app.core.database import get_session
+from app.core.visibility import ViewerContext, viewer_from_user
+from app.models import EventRegistration, Submission, TeamMember, User
+
+router = APIRouter(prefix="/calendar", tags=["calendar"])
+
+MAX_WINDOW = timedelta(days=366)
+
+def _naive_utc(value: datetime) -> datetime:
+    """Dates are stored as naive UTC; an offset in the query converts, no offset means UTC already."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class CalendarItem(BaseModel):
+    kind: str # "college_event", "club_event" or "deadline"
+    id: int
+    title: str
+    start: datetime
+    club_id: Optional[int] = None
+    location: Optional[str] = None
+    event_type: Optional[str] = None
+    is_registered: bool = False # events
+    submitted: bool = False # deadlines (students)
+
+
+@router.get("", response_model=List[CalendarItem])
+def read_calendar(
+    start: datetime = Query(..., alias="from"),
+    end: datetime = Query(..., alias="to"),
+    session: Session = Depends(get_session),
+    viewer: ViewerContext = Depends(get_viewer)
+):
+    """
+    Everything on the caller's calendar in [from, to): visible college events,
+    events of their clubs and their assignment deadlines, in date order.
+    Each source is one range scan on its date index, so a month view reads a month.
+    """
+    start, end = _naive_utc(start), _naive_utc(end)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="'to' must be after 'from'")
+    if end - start > MAX_WINDOW:
+        raise HTTPException(status_code=400, detail="Calendar window is limited to one year")
+
+    events = schedule.college_events(session, viewer, start, end) + schedule.club_events(session, viewer.user_id, start, end)
+    assignments = schedule.deadlines(session, viewer, start, end)
+
+    # Flags for the whole window in one IN query each
+    registered, submitted = set(), set()
+    if events:
+        event_ids = [e.id for e in events]
+        registered = {event_id for (event_id,) in session.query(EventRegistration.event_id).filter(
+            EventRegistration.student_id == viewer.user_id, EventRegistration.event_id.in_(event_ids)
+        )} | {event_id for (event_id,) in session.query(TeamMember.event_id).filter(
+            TeamMember.user_id == viewer.user_id, TeamMember.event_id.in_(event_ids)
+        )}
+    if assignments and viewer.is_student:
+        submitted = {assignment_id for (assignment_id,) in session.query(Submission.assignment_id).filter(
+            Submission.student_id == viewer.user_id, Submission.assignment_id.in_([a.id for a in assignments])
+        )}
+
+    items = [CalendarItem(
+        kind="club_event" if e.club_id else "college_event",
+        id=e.id, title=e.title, start=e.date, club_id=e.club_id,
+        location=e.venue or e.location, event_type=e.event_type,
+        is_registered=e.id in registered,
+    ) for e in events]
+    items += [CalendarItem(
+        kind="deadline", id=a.id, title=a.title, start=a.deadline,
+        submitted=a.id in submitted,
+    ) for a in assignments]
+    items.sort(key=lambda item: item.start)
+    return items
+
+
+def feed_urls(request: Request, token: str) -> dict:
+    url = str(request.url_for("calendar_feed", token=token))
+    return {"url": url, "webcal_url": "webcal://" + url.split("://", 1)[1]}
+
+
+@router.get("/feed-url")
+def get_feed_url(
+    request: Request,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Personal subscription URL for calendar apps (Google Calendar, Outlook, iOS)."""
+    return feed_urls(request, ics.feed_token(session, current_user))
+
+
+@router.post("/feed-url/rotate")
+def rotate_feed_url(
+    request: Request,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    # For a leaked link: every URL issued before stops working
+    return feed_urls(request, ics.feed_token(session, current_user, rotate=True))
+
+
+@router.get("/feed/{token}.ics", name="calendar_feed")
+def calendar_feed(token: str, request: Request, response: Response, session: Session = Depends(get_session)):
+    """
+    College events, joined-club events, registered events and assignment
+    deadlines as iCalendar. Calendar apps poll this; an unchanged feed costs
+    two queries (token owner + one version stamp) and a 304.
+    """
+    user = ics.user_for_token(session, token)
+    if not user:
+        raise HTTPException(status_code=404, detail="Calendar feed not found")
+    viewer = viewer_from_user(user)
+
+    window = ics.feed_window(datetime.utcnow())
+    versions = ics.versions(session, viewer)
+    etag = ics.etag_for(viewer, window, versions)
+    cached = feed_version.not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    body = ics.build_feed(session, viewer, f"University Portal - {user.name}", window, versions)
+    return Response(
+        content=body,
+        media_type="text/calendar; charset=utf-8",
+        headers={"ETag": etag, "Cache-Control": feed_version.CACHE_CONTROL},
+    )
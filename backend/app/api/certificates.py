@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api.deps import require_faculty
+from app.core import certificates
+from app.core.cache import response_cache
+from app.core.database import get_session
+from app.models import Event
+
+router = APIRouter(prefix="/certificates", tags=["certificates"])
+
+
+def get_event(event_id: int, session: Session) -> Event:
+    event = session.query(Event).filter(Event.id == event_id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return event
+
+
+@router.post("/events/{event_id}", dependencies=[Depends(require_faculty)])
+def generate_certificates(event_id: int, session: Session = Depends(get_session)):
+    """
+    (Re)generates winner and participation certificates for everyone with an
+    achievement or a registration for the event.
+    """
+    event = get_event(event_id, session)
+    report = certificates.generate(session, event)
+    if report["achievements_linked"]:
+        response_cache.invalidate("achievements")
+    return report
+
+
+@router.get("/events/{event_id}/zip", dependencies=[Depends(require_faculty)])
+def download_certificates(event_id: int, session: Session = Depends(get_session)):
+    event = get_event(event_id, session)
+    everyone = certificates.recipients(session, event)
+    if not everyone:
+        raise HTTPException(status_code=404, detail="No certificates for this event")
+    return StreamingResponse(
+        certificates.zip_stream(event, everyone),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="certificates-event-{event.id}.zip"'},
+    )
@@ -1,11 +1,12 @@
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from typing import List, Optional
 from pydantic import BaseModel
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import func
-import json # Added json import
+from sqlalchemy.exc import IntegrityError
 from app.core.database import get_session
+from app.core import dashboard_stats, feed_version, teams
 from app.models import Club, ClubMembership, User, Event, Announcement, EventRegistration
 from app.api.deps import get_current_active_user, require_faculty
 from app.schemas.auth import UserOut
@@ -93,6 +94,9 @@ def read_club(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
+    return club_detail(session, club_id, current_user.id)
+
+def club_detail(session: Session, club_id: int, user_id: int) -> ClubRead:
     club = session.query(Club).filter(Club.id == club_id).first()
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
@@ -100,7 +104,7 @@ def read_club(
     member_count = session.query(func.count(ClubMembership.id)).filter(ClubMembership.club_id == club.id).scalar()
     membership = session.query(ClubMembership).filter(
         ClubMembership.club_id == club_id, 
-        ClubMembership.student_id == current_user.id
+        ClubMembership.student_id == user_id
     ).first()
     is_joined = membership is not None
     my_role = membership.role if membership else None
@@ -249,7 +253,9 @@ def read_club_members(
     club = session.query(Club).filter(Club.id == club_id).first()
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
-        
+    return club_members(session, club_id)
+
+def club_members(session: Session, club_id: int) -> List[dict]:
     members_with_roles = []
     results = session.query(User, ClubMembership.role).join(ClubMembership).filter(ClubMembership.club_id == club_id).all()
     for user, role in results:
@@ -306,16 +312,26 @@ def read_club_events(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
+    return club_events(session, club_id, current_user.id)
+
+def club_events(session: Session, club_id: int, user_id: int) -> List[EventRead]:
     events = session.query(Event).filter(Event.club_id == club_id).order_by(Event.date).all()
+    event_ids = [event.id for event in events]
+
+    # Registration counts and the caller's registrations in two queries, not two per event
+    reg_counts = {}
+    registered_ids = set()
+    if event_ids:
+        reg_counts = dict(session.query(EventRegistration.event_id, func.count(EventRegistration.id)).filter(
+            EventRegistration.event_id.in_(event_ids)
+        ).group_by(EventRegistration.event_id).all())
+        registered_ids = {event_id for (event_id,) in session.query(EventRegistration.event_id).filter(
+            EventRegistration.event_id.in_(event_ids),
+            EventRegistration.student_id == user_id
+        )}
+
     results = []
-    
     for event in events:
-        reg_count = session.query(func.count(EventRegistration.id)).filter(EventRegistration.event_id == event.id).scalar()
-        is_reg = session.query(EventRegistration).filter(
-            EventRegistration.event_id == event.id,
-            EventRegistration.student_id == current_user.id
-        ).first() is not None
-        
         # Convert to Pydantic
         event_dict = EventRead(
             id=event.id,
@@ -330,8 +346,8 @@ def read_club_events(
             min_team_size=event.min_team_size,
             max_team_size=event.max_team_size,
             created_by=event.created_by,
-            registration_count=reg_count,
-            is_registered=is_reg
+            registration_count=reg_counts.get(event.id, 0),
+            is_registered=event.id in registered_ids
         )
         results.append(event_dict)
 
@@ -384,16 +400,32 @@ def register_for_event(
     
     if registration:
         raise HTTPException(status_code=400, detail="Already registered")
+
+    members = []
+    if event.participation_type == "team":
+        if not reg_in.team_name:
+            raise HTTPException(status_code=400, detail="Team Name is required for team events")
+        try:
+            members = teams.build_team(session, event, current_user, reg_in.member_details)
+        except teams.TeamError as e:
+            raise HTTPException(status_code=400, detail=str(e))
     
     new_reg = EventRegistration(
         event_id=event_id, 
         student_id=current_user.id,
         team_name=reg_in.team_name,
-        team_size=reg_in.team_size,
-        member_details=reg_in.member_details
+        team_size=len(members) if members else reg_in.team_size,
+        member_details=reg_in.member_details,
+        members=members
     )
     session.add(new_reg)
-    session.commit()
+    try:
+        session.commit()
+    except IntegrityError:
+        # Lost a race on uq_team_members_event_reg_no
+        session.rollback()
+        raise HTTPException(status_code=400, detail="A team member just registered with another team; please check your team")
+    dashboard_stats.invalidate_user(current_user.id, "student")
     return {"message": "Registered successfully", "is_registered": True}
 
 # Unregister from Event
@@ -418,6 +450,7 @@ def unregister_from_event(
         
     session.delete(registration)
     session.commit()
+    dashboard_stats.invalidate_user(current_user.id, "student")
     return {"message": "Unregistered", "is_registered": False}
 
 # Get Event Registrations (For Leads/Faculty)
@@ -439,11 +472,15 @@ def read_event_registrations(
     if not (is_faculty or is_lead):
         raise HTTPException(status_code=403, detail="Not authorized to view registrations")
 
-    registrations = session.query(EventRegistration).filter(EventRegistration.event_id == event_id).all()
+    # Students and team members in one IN query each, not one lookup per registration
+    registrations = session.query(EventRegistration).options(
+        selectinload(EventRegistration.student),
+        selectinload(EventRegistration.members)
+    ).filter(EventRegistration.event_id == event_id).all()
     results = []
     
     for reg in registrations:
-        student = session.query(User).filter(User.id == reg.student_id).first()
+        student = reg.student
         results.append({
             "id": reg.id,
             "student_id": student.id,
@@ -455,7 +492,8 @@ def read_event_registrations(
             "registered_at": reg.registered_at,
             "team_name": reg.team_name,
             "team_size": reg.team_size,
-            "member_details": reg.member_details
+            "member_details": reg.member_details,
+            "members": reg.members
         })
         
     return results
@@ -484,8 +522,7 @@ def create_club_announcement(
         raise HTTPException(status_code=403, detail="Not authorized to post announcements")
         
     ann_data = announcement_in.dict()
-    attachments_list = ann_data.pop('attachments', [])
-    ann_data['attachments'] = json.dumps(attachments_list) if attachments_list else "[]"
+    ann_data['attachments'] = ann_data.get('attachments') or []
     
     db_announcement = Announcement(**ann_data)
     db_announcement.created_by = current_user.id
@@ -495,18 +532,28 @@ def create_club_announcement(
     session.commit()
     session.refresh(db_announcement)
     
-    # Manually construct response to handle attachments correctly
-    response_dict = db_announcement.__dict__.copy()
-    response_dict['attachments'] = attachments_list
-    return response_dict
+    return db_announcement
 
 # List Club Announcements
 @router.get("/{club_id}/announcements", response_model=List[AnnouncementRead])
 def read_club_announcements(
     club_id: int,
+    request: Request,
+    response: Response,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
+    # Same list for every viewer of the club; 304 if the client's copy is current
+    version = feed_version.stamp(session, feed_version.versioned(
+        Announcement, Announcement.club_id == club_id, timestamp=Announcement.published_at
+    ))
+    cached = feed_version.not_modified(request, response, feed_version.make_etag("club-announcements", club_id, version))
+    if cached:
+        return cached
+
+    return club_announcements(session, club_id)
+
+def club_announcements(session: Session, club_id: int) -> List[dict]:
     announcements = session.query(Announcement).filter(
         Announcement.club_id == club_id
     ).order_by(Announcement.published_at.desc()).all()
@@ -521,19 +568,13 @@ def read_club_announcements(
             "priority": ann.priority,
             "published_at": ann.published_at,
             "created_by": ann.created_by,
-            "club_id": ann.club_id
+            "club_id": ann.club_id,
+            "attachments": ann.attachments or []
         }
-        
-        # Parse attachments
-        try:
-            ann_dict["attachments"] = json.loads(ann.attachments) if ann.attachments else []
-        except:
-            ann_dict["attachments"] = []
             
         results.append(ann_dict)
         
     return results
-    return announcements
 
 # Delete Club Announcement
 @router.delete("/{club_id}/announcements/{announcement_id}")
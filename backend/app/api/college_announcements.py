@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, Unicode
-import json
 
 from app.core.database import get_session
+from app.core import broker, feed_version
 from app.models import Announcement, User
-from app.api.deps import get_current_active_user
+from app.api.deps import get_current_active_user, get_viewer
+from app.core.visibility import ANNOUNCEMENT_AUDIENCE, ViewerContext
 from app.schemas.content import AnnouncementCreate, AnnouncementRead
 
 router = APIRouter(prefix="/college/announcements", tags=["college-announcements"])
@@ -28,21 +29,10 @@ def create_college_announcement(
     data = announcement_in.dict()
     data["club_id"] = None
     
-    # Handle JSON fields serialization
-    if "attachments" in data and data["attachments"]:
-         data["attachments"] = json.dumps(data["attachments"])
-    else:
-         data["attachments"] = None
-
-    if "target_departments" in data and data["target_departments"]:
-         data["target_departments"] = json.dumps(data["target_departments"])
-    else:
-         data["target_departments"] = None
-         
-    if "images" in data and data["images"]:
-         data["images"] = json.dumps(data["images"])
-    else:
-        data["images"] = None
+    # JSON columns are encoded by the column type; store empty lists as NULL like before
+    for field in ("attachments", "target_departments", "images"):
+        if not data.get(field):
+            data[field] = None
 
     db_announcement = Announcement(**data)
     db_announcement.created_by = current_user.id
@@ -51,83 +41,69 @@ def create_college_announcement(
     session.commit()
     session.refresh(db_announcement)
     
-    # Construct response manually to handle JSON fields
     response_dict = db_announcement.__dict__.copy()
-    try:
-        response_dict['attachments'] = json.loads(db_announcement.attachments) if db_announcement.attachments else []
-        response_dict['target_departments'] = json.loads(db_announcement.target_departments) if db_announcement.target_departments else []
-        response_dict['images'] = json.loads(db_announcement.images) if db_announcement.images else []
-    except:
-        pass
-        
+    response_dict['attachments'] = db_announcement.attachments or []
+    response_dict['target_departments'] = db_announcement.target_departments or []
+    response_dict['images'] = db_announcement.images or []
+
+    # Push to open /stream/feed connections (filtered per subscriber)
+    broker.publish("announcement", AnnouncementRead.model_validate(response_dict).model_dump(mode="json"))
     return response_dict
 
 @router.get("", response_model=List[AnnouncementRead])
 def read_college_announcements(
+    request: Request,
+    response: Response,
     category: Optional[str] = None,
     department: Optional[str] = None,
     limit: int = 50,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user)
+    viewer: ViewerContext = Depends(get_viewer)
 ):
+    # Most polls see the same content: answer 304 after one aggregate lookup
+    version = feed_version.stamp(session, feed_version.versioned(
+        Announcement, Announcement.club_id == None, timestamp=Announcement.published_at
+    ))
+    etag = feed_version.make_etag("college-announcements", version, viewer.role, viewer.branch, viewer.year_key, category, department, limit)
+    cached = feed_version.not_modified(request, response, etag)
+    if cached:
+        return cached
+    return college_announcements_for(session, viewer, category, department, limit)
+
+def college_announcements_for(
+    session: Session,
+    viewer: ViewerContext,
+    category: Optional[str] = None,
+    department: Optional[str] = None,
+    limit: int = 50
+) -> List[dict]:
     query = session.query(Announcement).filter(Announcement.club_id == None)
     
     if category:
         query = query.filter(Announcement.category == category)
         
-    # Department filter logic:
-    # If a department is specified, show announcements that target ALL (None) or target that specific dept
-    if department:
-        # Note: querying JSON with LIKE is a simple hack. Ideally use JSON operators if DB supports it reliably.
-        # For simplicity: filter in python or use simple text search if column is Text
-        pass 
-        
     # Sort: Pinned first, then Newest
     query = query.order_by(desc(Announcement.is_pinned), desc(Announcement.published_at))
     
     announcements = query.limit(limit).all()
+
+    # Department / Year targeting (app/core/visibility.py); admins see everything
+    announcements = ANNOUNCEMENT_AUDIENCE.filter(viewer, announcements)
     
     results = []
-    current_year_str = str(current_user.year) if current_user.year else None
-
     for ann in announcements:
-        # Check Department visibility
-        target_depts = []
-        try:
-             target_depts = json.loads(ann.target_departments) if ann.target_departments else []
-        except:
-             pass
-        
-        # Check Year visibility
-        target_years = []
-        try:
-             target_years = json.loads(ann.target_years) if ann.target_years else []
-        except:
-             pass
+        target_depts = ann.target_departments or []
 
-        # Filter for Students
-        if current_user.role == "student":
-             # 1. Department Filter
-             if department and target_depts:
-                 if department not in target_depts:
-                     continue
-             # 2. Year Filter
-             if target_years:
-                 if current_year_str not in target_years:
-                     continue
+        # Optional page filter: announcements for everyone or for that department
+        if department and target_depts and department not in target_depts:
+            continue
 
         # Convert to Read Schema
         ann_dict = ann.__dict__.copy()
-        try:
-            ann_dict['attachments'] = json.loads(ann.attachments) if ann.attachments else []
-            ann_dict['target_departments'] = target_depts
-            ann_dict['target_years'] = target_years
-            ann_dict['images'] = json.loads(ann.images) if ann.images else []
-        except:
-            ann_dict['attachments'] = []
-            ann_dict['target_departments'] = []
-            ann_dict['target_years'] = []
-            ann_dict['images'] = []
+        ann_dict['attachments'] = ann.attachments or []
+        ann_dict['target_departments'] = target_depts
+        ann_dict['target_years'] = ann.target_years or []
+        ann_dict['images'] = ann.images or []
             
         results.append(ann_dict)
         
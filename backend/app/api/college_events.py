@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
-import json
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import desc, func, select
 from datetime import datetime
 
 from app.core.database import get_session
+from app.core import dashboard_stats, broker, feed_version, teams
 from app.models import Event, EventRegistration, User
-from app.api.deps import get_current_active_user
+from app.api.deps import get_current_active_user, get_viewer
+from app.core.visibility import EVENT_AUDIENCE, ViewerContext
 from app.schemas.content import EventCreate, EventRead, EventRegistrationCreate, EventRegistrationRead
 
 router = APIRouter(prefix="/college/events", tags=["college-events"])
@@ -27,22 +29,10 @@ def create_college_event(
     data = event_in.dict()
     data["club_id"] = None
     
-    # Handle JSON fields
-    # Handle JSON fields
-    if data.get("eligibility") is not None:
-        data["eligibility"] = json.dumps(data["eligibility"])
-    else:
-        data["eligibility"] = json.dumps([])
-
-    if data.get("attachments") is not None:
-        data["attachments"] = json.dumps(data["attachments"])
-    else:
-        data["attachments"] = json.dumps([])
-
-    if data.get("target_departments") is not None:
-        data["target_departments"] = json.dumps(data["target_departments"])
-    else:
-        data["target_departments"] = json.dumps([])
+    # JSON columns are encoded by the column type; just normalise missing lists
+    for field in ("eligibility", "attachments", "target_departments"):
+        if data.get(field) is None:
+            data[field] = []
 
     db_event = Event(**data)
     db_event.created_by = current_user.id
@@ -50,61 +40,61 @@ def create_college_event(
     session.add(db_event)
     session.commit()
     session.refresh(db_event)
+
+    # Push to open /stream/feed connections (filtered per subscriber)
+    broker.publish("event", EventRead.model_validate(db_event).model_dump(mode="json"))
     
-    # Manually construct response
-    response_dict = db_event.__dict__.copy()
-    try:
-        response_dict['eligibility'] = json.loads(db_event.eligibility) if db_event.eligibility else []
-        response_dict['attachments'] = json.loads(db_event.attachments) if db_event.attachments else []
-        response_dict['target_departments'] = json.loads(db_event.target_departments) if db_event.target_departments else []
-    except:
-        pass
-        
-    return response_dict
+    return db_event
 
 @router.get("", response_model=List[EventRead])
 def read_college_events(
+    request: Request,
+    response: Response,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user)
+    viewer: ViewerContext = Depends(get_viewer)
 ):
+    # Events + their registrations (counts, is_registered) in one aggregate lookup;
+    # per user because is_registered differs between viewers
+    college_event_ids = select(Event.id).where(Event.club_id == None)
+    version = feed_version.stamp(
+        session,
+        feed_version.versioned(Event, Event.club_id == None),
+        feed_version.versioned(EventRegistration, EventRegistration.event_id.in_(college_event_ids)),
+    )
+    etag = feed_version.make_etag("college-events", version, viewer.user_id, viewer.role, viewer.branch, viewer.year_key)
+    cached = feed_version.not_modified(request, response, etag)
+    if cached:
+        return cached
+    return college_events_for(session, viewer)
+
+def college_events_for(session: Session, viewer: ViewerContext) -> List[dict]:
     # Fetch events where club_id is NULL (College Events)
     events = session.query(Event).filter(Event.club_id == None).order_by(Event.date).all()
     
-    results = []
-    current_year_str = str(current_user.year) if current_user.year else None
+    # Branch / Year targeting (app/core/visibility.py); admins see everything
+    events = EVENT_AUDIENCE.filter(viewer, events)
+    event_ids = [event.id for event in events]
+
+    # Registration counts and the viewer's own registrations in two queries, not two per event
+    reg_counts = {}
+    registered_ids = set()
+    if event_ids:
+        reg_counts = dict(session.query(EventRegistration.event_id, func.count(EventRegistration.id)).filter(
+            EventRegistration.event_id.in_(event_ids)
+        ).group_by(EventRegistration.event_id).all())
+        registered_ids = {event_id for (event_id,) in session.query(EventRegistration.event_id).filter(
+            EventRegistration.event_id.in_(event_ids),
+            EventRegistration.student_id == viewer.user_id
+        )}
     
+    results = []
     for event in events:
-        # 1. Eligibility Filter (Semesters)
-        try:
-             eligibility_list = json.loads(event.eligibility) if event.eligibility else []
-        except:
-             eligibility_list = []
-        
-        # If student and eligibility is restricted (not empty), check if semester matches
-        if current_user.role == "student" and eligibility_list:
-            # Assume eligibility_list contains strings of semesters e.g. ["1", "3", "5"]
-            if current_year_str not in eligibility_list:
-                continue
-
-        # Count registrations
-        reg_count = session.query(func.count(EventRegistration.id)).filter(EventRegistration.event_id == event.id).scalar()
-        is_registered = session.query(EventRegistration).filter(
-            EventRegistration.event_id == event.id, 
-            EventRegistration.student_id == current_user.id
-        ).first() is not None
-        
         event_dict = event.__dict__.copy()
-        event_dict['registration_count'] = reg_count or 0
-        event_dict['is_registered'] = is_registered
-        
-        try:
-             event_dict['eligibility'] = eligibility_list
-             event_dict['attachments'] = json.loads(event.attachments) if event.attachments else []
-             event_dict['target_departments'] = json.loads(event.target_departments) if event.target_departments else []
-        except:
-             event_dict['eligibility'] = []
-             event_dict['attachments'] = []
-             event_dict['target_departments'] = []
+        event_dict['registration_count'] = reg_counts.get(event.id, 0)
+        event_dict['is_registered'] = event.id in registered_ids
+        event_dict['eligibility'] = event.eligibility or []
+        event_dict['attachments'] = event.attachments or []
+        event_dict['target_departments'] = event.target_departments or []
 
         results.append(event_dict)
     
@@ -137,18 +127,23 @@ def register_for_college_event(
     if existing:
         raise HTTPException(status_code=400, detail="You are already registered")
 
-    # Construct Registration
-    reg_data = registration_in.dict()
+    # Construct Registration (year is only on the form; the column is taken from the profile)
+    reg_data = registration_in.dict(exclude={"year"})
     
     # Force auto-fields from User Profile if not provided
     if not reg_data.get('student_email'):
         reg_data['student_email'] = current_user.email
         
     # Logic: if team event, ensure team details
+    members = []
     if event.participation_type == 'team':
         if not reg_data.get('team_name'):
              raise HTTPException(status_code=400, detail="Team Name is required for team events")
-        # Validate team size if possible (min/max)
+        try:
+            members = teams.build_team(session, event, current_user, reg_data.get('member_details'))
+        except teams.TeamError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        reg_data['team_size'] = len(members)
         
     try:
         db_reg = EventRegistration(**reg_data)
@@ -159,10 +154,16 @@ def register_for_college_event(
         db_reg.registration_number = reg_data.get('registration_number') or current_user.registration_number
         db_reg.branch = reg_data.get('branch') or current_user.branch
         db_reg.section = reg_data.get('section') or current_user.section
+        db_reg.members = members
         
         session.add(db_reg)
         session.commit()
         session.refresh(db_reg)
+        dashboard_stats.invalidate_user(current_user.id, "student")
+    except IntegrityError:
+        # Lost a race on uq_team_members_event_reg_no
+        session.rollback()
+        raise HTTPException(status_code=400, detail="A team member just registered with another team; please check your team")
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -195,5 +196,6 @@ def get_event_registrations(
     if not is_staff(current_user):
         raise HTTPException(status_code=403, detail="Permission denied")
         
-    registrations = session.query(EventRegistration).filter(EventRegistration.event_id == event_id).all()
+    registrations = session.query(EventRegistration).options(selectinload(EventRegistration.members))\
+        .filter(EventRegistration.event_id == event_id).all()
     return registrations
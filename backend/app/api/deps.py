@@ -5,6 +5,8 @@ from jose import jwt, JWTError
 from sqlalchemy.orm import Session
 from app.core.database import get_session
 from app.core.security import SECRET_KEY, ALGORITHM
+from app.core.revocation import revocation_list
+from app.core.visibility import ViewerContext, viewer_from_user
 from app.models import User
 from app.schemas.auth import TokenData
 
@@ -23,6 +25,10 @@ def get_current_user(
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
+        # In-memory denylist (logout); no DB lookup for tokens that aren't revoked
+        jti = payload.get("jti")
+        if jti and revocation_list.is_revoked(jti):
+            raise credentials_exception
         token_data = TokenData(email=email)
     except JWTError:
         raise credentials_exception
@@ -38,6 +44,10 @@ def get_current_active_user(current_user: User = Depends(get_current_user)) -> U
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
+def get_viewer(current_user: User = Depends(get_current_active_user)) -> ViewerContext:
+    # FastAPI caches dependencies per request, so this is built once however many deps use it
+    return viewer_from_user(current_user)
+
 # RBAC Dependencies
 def require_student(user: User = Depends(get_current_active_user)) -> User:
     if user.role != "student" and user.role != "admin": 
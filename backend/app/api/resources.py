@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form, Request, Response
 from fastapi.staticfiles import StaticFiles
 import shutil
 import os
@@ -8,14 +8,16 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import select
 from app.core.database import get_session
+from app.core.uploads import upload_dir
+from app.core import feed_version
 from app.models import Note, User
-from app.api.deps import get_current_active_user
+from app.api.deps import get_current_active_user, get_viewer
+from app.core.visibility import ViewerContext, note_targets
 
 router = APIRouter(prefix="/notes", tags=["notes"])
 
-# Verify uploads directory exists
+# Created on first upload (see app/core/uploads.py)
 UPLOAD_DIR = "uploads/notes"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 class UploaderInfo(BaseModel):
     name: str
@@ -58,7 +60,7 @@ def upload_note(
     # 2. Save File
     file_ext = file.filename.split(".")[-1]
     unique_filename = f"{uuid.uuid4()}.{file_ext}"
-    file_path = os.path.join(UPLOAD_DIR, unique_filename)
+    file_path = os.path.join(upload_dir("notes"), unique_filename)
     
     with open(file_path, "wb") as buffer:
         shutil.copyfileobj(file.file, buffer)
@@ -85,15 +87,22 @@ def upload_note(
 
 @router.get("/", response_model=List[NoteRead])
 def read_notes(
+    request: Request,
+    response: Response,
     session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_active_user)
+    viewer: ViewerContext = Depends(get_viewer)
 ):
+    # Version of exactly the notes this viewer can see; 304 if unchanged
+    version = feed_version.stamp(session, feed_version.versioned(Note, note_targets(viewer), timestamp=Note.uploaded_at))
+    # The viewer is part of the tag: two viewers can see different notes at the same version
+    etag = feed_version.make_etag("notes", version, viewer.role, viewer.branch, viewer.section, viewer.year_key)
+    cached = feed_version.not_modified(request, response, etag)
+    if cached:
+        return cached
+
     # Use distinct to avoid duplicates if joins behave unexpectedly, though joinedload shouldn't cause them here.
-    query = select(Note).options(joinedload(Note.uploaded_by)).order_by(Note.uploaded_at.desc())
-    
-    if current_user.role == "student":
-         # Filter: semester matches or is null (shared)
-         query = query.filter((Note.year == None) | (Note.year == current_user.year))
+    # Students: year matches or is null (shared) -- pushed down into the WHERE clause
+    query = select(Note).options(joinedload(Note.uploaded_by)).where(note_targets(viewer)).order_by(Note.uploaded_at.desc())
          
     notes = session.execute(query).scalars().unique().all()
     return notes
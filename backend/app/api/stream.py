@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from jose import JWTError, jwt
+
+from app.api.deps import get_current_user
+from app.core.broker import broker, backend
+from app.core.database import SessionLocal
+from app.core.revocation import revocation_list
+from app.core.security import ALGORITHM, SECRET_KEY
+from app.core.visibility import viewer_from_user
+
+router = APIRouter(prefix="/stream", tags=["stream"])
+
+HEARTBEAT_SECONDS = 25  # keeps proxies from closing idle connections
+
+
+def authenticate(token: str):
+    # EventSource can't send headers, so the token comes in the query string.
+    # The session is closed right away: a stream must not hold a pooled connection.
+    with SessionLocal() as session:
+        user = get_current_user(token=token, session=session)
+        if not user.is_active:
+            raise HTTPException(status_code=400, detail="Inactive user")
+        return viewer_from_user(user)
+
+
+def token_still_valid(token: str) -> bool:
+    """Expiry and logout checks for an open stream; in memory, no database."""
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return False  # includes expiry
+    jti = payload.get("jti")
+    return not (jti and revocation_list.is_revoked(jti))
+
+
+def sse(kind: str, data: dict) -> str:
+    return f"event: {kind}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("/feed")
+async def feed_stream(token: str = Query(...)):
+    """
+    Server-sent events for newly created college events and announcements,
+    already filtered for the caller's department / year.
+    Events: `event`, `announcement` (data = same shape as the feed endpoints).
+    The stream closes once the token expires or is revoked (logout); the
+    client's reconnect then fails authentication.
+    """
+    viewer = await asyncio.to_thread(authenticate, token)
+    backend.start()
+    queue = broker.subscribe(viewer)
+
+    async def events():
+        loop = asyncio.get_running_loop()
+        checked = loop.time()
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    message = None
+                # Re-checked every heartbeat interval, busy stream or idle
+                if loop.time() - checked >= HEARTBEAT_SECONDS:
+                    if not token_still_valid(token):
+                        return
+                    checked = loop.time()
+                if message is None:
+                    yield ": ping\n\n"
+                    continue
+                yield sse(message["kind"], message["data"])
+        finally:
+            broker.unsubscribe(viewer, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -4,11 +4,11 @@ import shutil
 import os
 import uuid
 from app.api.deps import get_current_active_user
+from app.core.uploads import upload_dir
 
 router = APIRouter(prefix="/upload", tags=["upload"])
 
-UPLOAD_DIR = "uploads/general"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+UPLOAD_DIR = "uploads/general" # Created on first upload
 
 @router.post("/file")
 async def upload_file(
@@ -18,7 +18,7 @@ async def upload_file(
     try:
         file_ext = file.filename.split(".")[-1]
         unique_filename = f"{uuid.uuid4()}.{file_ext}"
-        file_path = os.path.join(UPLOAD_DIR, unique_filename)
+        file_path = os.path.join(upload_dir("general"), unique_filename)
         
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
@@ -1,10 +1,11 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from pydantic import BaseModel
 from app.core.database import get_session
 from app.core.security import get_password_hash
+from app.core import dashboard_stats, leaderboard, student_import
 from app.models import User, Assignment, Submission, Event, Announcement
 from app.api.deps import require_admin, get_current_active_user, get_current_user
 from app.schemas.auth import UserOut
@@ -27,22 +28,12 @@ class UserUpdate(BaseModel):
 router = APIRouter(prefix="", tags=["users"])
 
 @router.get("/dashboard/stats")
-async def get_dashboard_stats(
+def get_dashboard_stats(
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
-    stats = {}
-    if current_user.role == "admin":
-        stats["users"] = session.query(func.count(User.id)).scalar()
-        stats["events"] = session.query(func.count(Event.id)).scalar()
-        stats["announcements"] = session.query(func.count(Announcement.id)).scalar()
-    elif current_user.role == "faculty":
-        stats["assignments_created"] = session.query(func.count(Assignment.id)).filter(Assignment.faculty_id == current_user.id).scalar()
-        stats["submissions_received"] = 0 
-    elif current_user.role == "student":
-        stats["pending_assignments"] = 0 
-        
-    return stats
+    # Served from precomputed per-role aggregates (see app/core/dashboard_stats.py)
+    return dashboard_stats.get_stats(session, current_user)
 
 @router.get("/users", response_model=List[UserOut],  dependencies=[Depends(require_admin)])
 def read_users(session: Session = Depends(get_session), skip: int = 0, limit: int = 100):
@@ -74,6 +65,21 @@ def create_user_by_admin(user_in: AdminUserCreate, session: Session = Depends(ge
     session.refresh(user)
     return user
 
+@router.post("/users/admin/import-students", dependencies=[Depends(require_admin)])
+def import_students(file: UploadFile = File(...), session: Session = Depends(get_session)):
+    """
+    Bulk-creates students from a CSV upload (header row: name, email,
+    registration_number, branch, section, year, password). Valid rows are
+    created; the rest come back in `errors` with their line number.
+    """
+    try:
+        report = student_import.import_students(session, file.file)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not read CSV: {e}")
+    if report["created"]:
+        dashboard_stats.invalidate_all()
+    return report
+
 @router.put("/users/me", response_model=UserOut)
 def update_user_me(user_update: UserUpdate, session: Session = Depends(get_session), current_user: User = Depends(get_current_active_user)):
     if user_update.name:
@@ -88,8 +94,13 @@ def update_user_me(user_update: UserUpdate, session: Session = Depends(get_sessi
         current_user.section = user_update.section
     if user_update.password:
         current_user.password_hash = get_password_hash(user_update.password)
+    if user_update.year or user_update.branch:
+        leaderboard.sync_profile(session, current_user)
     
     session.add(current_user)
     session.commit()
+    if user_update.year or user_update.branch or user_update.section:
+        # Targeting changed, and with it the pending assignment count
+        dashboard_stats.invalidate_user(current_user.id, current_user.role)
     session.refresh(current_user)
     return current_user
@@ -0,0 +1,118 @@
+import csv
+import io
+from datetime import datetime
+from typing import IO, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core import leaderboard
+from app.models import Achievement, Event, User
+
+REQUIRED_COLUMNS = {"registration_number"}
+IN_CHUNK = 1000  # keep IN lists well under driver/packet limits
+
+
+def _clean(row: dict) -> dict:
+    return {(key or "").strip().lower(): (value or "").strip() for key, value in row.items()}
+
+
+def _chunks(values: list):
+    for start in range(0, len(values), IN_CHUNK):
+        yield values[start:start + IN_CHUNK]
+
+
+def _students_by_reg_number(session: Session, reg_numbers: set) -> dict:
+    students = {}
+    for chunk in _chunks(sorted(reg_numbers)):
+        for student in session.query(User).filter(User.registration_number.in_(chunk)):
+            students[student.registration_number] = student
+    return students
+
+
+def _already_awarded(session: Session, event_id: int, user_ids: set) -> set:
+    awarded = set()
+    for chunk in _chunks(sorted(user_ids)):
+        awarded.update(user_id for (user_id,) in session.query(Achievement.user_id).filter(
+            Achievement.event_id == event_id,
+            Achievement.user_id.in_(chunk)
+        ))
+    return awarded
+
+
+def import_results(
+    session: Session,
+    event: Event,
+    file: IO[bytes],
+    badge: str = "Participate",
+    category: str = "Internal",
+    title: Optional[str] = None,
+) -> dict:
+    """
+    Records achievements for one event from a results sheet (CSV with a
+    registration_number column; title, badge, category, description,
+    certificate_url and image_url may override the sheet-wide defaults).
+    Students are resolved in one IN query and existing (event, student)
+    achievements in another; everything is inserted in one transaction.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    header = {(name or "").strip().lower() for name in (reader.fieldnames or [])}
+    missing = REQUIRED_COLUMNS - header
+    if missing:
+        raise ValueError(f"CSV is missing columns: {', '.join(sorted(missing))}")
+
+    rows = [(line, _clean(row)) for line, row in enumerate(reader, start=2)]  # line 1 is the header
+    errors = []
+
+    students = _students_by_reg_number(session, {row.get("registration_number") for _, row in rows if row.get("registration_number")})
+    awarded = _already_awarded(session, event.id, {student.id for student in students.values()})
+
+    now = datetime.utcnow()
+    created, seen = [], set()
+    for line, row in rows:
+        reg_number = row.get("registration_number")
+        student = students.get(reg_number)
+        row_badge = row.get("badge") or badge
+        if not reg_number:
+            message = "Missing registration_number"
+        elif student is None:
+            message = "Student not found"
+        elif student.id in seen:
+            message = "Duplicate registration number in file"
+        elif student.id in awarded:
+            message = "Student already has an achievement for this event"
+        elif row_badge not in leaderboard.BADGE_WEIGHTS:
+            message = f"Unknown badge {row_badge}"
+        else:
+            message = ""
+        if message:
+            errors.append({"row": line, "registration_number": reg_number or None, "error": message})
+            continue
+
+        seen.add(student.id)
+        created.append(({
+            "event_id": event.id,
+            "user_id": student.id,
+            "title": row.get("title") or title or event.title,
+            "description": row.get("description") or None,
+            "category": row.get("category") or category,
+            "badge": row_badge,
+            "image_url": row.get("image_url") or None,
+            "certificate_url": row.get("certificate_url") or None,
+            "created_at": now,
+        }, student))
+
+    if created:
+        # One transaction: either the whole sheet is recorded or none of it.
+        # Core executemany rather than session.add_all, which on MySQL falls
+        # back to one INSERT per row to read back each primary key.
+        session.execute(insert(Achievement), [values for values, _ in created])
+        leaderboard.apply_achievements(session, [(values["badge"], student) for values, student in created], event)
+        session.commit()
+
+    return {
+        "rows": len(rows),
+        "created": len(created),
+        "failed": len(errors),
+        "errors": errors,
+    }
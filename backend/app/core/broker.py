@@ -0,0 +1,161 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from app.core.cache import get_redis
+from app.core.visibility import ViewerContext, EVENT_AUDIENCE, ANNOUNCEMENT_AUDIENCE
+
+CHANNEL = "portal:feed"
+QUEUE_SIZE = 100  # per subscriber; a client that falls this far behind misses messages
+RETRY_SECONDS = 1  # listener reconnect backoff, doubling up to MAX_RETRY_SECONDS
+MAX_RETRY_SECONDS = 30
+
+# Which targeting rule applies to each kind of pushed item
+AUDIENCES = {
+    "event": EVENT_AUDIENCE,
+    "announcement": ANNOUNCEMENT_AUDIENCE,
+}
+
+
+def _segment(viewer: ViewerContext):
+    return (viewer.role, viewer.branch, viewer.year_key)
+
+
+class Broker:
+    """
+    In-process pub/sub for the SSE feed. Subscribers are grouped by visibility
+    segment (role, branch, year), so a message runs the audience predicate once
+    per segment rather than once per open connection.
+    """
+
+    def __init__(self):
+        self._segments = {}  # segment -> (viewer, {queue: loop})
+        self._lock = threading.Lock()
+
+    def subscribe(self, viewer: ViewerContext) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            _, queues = self._segments.setdefault(_segment(viewer), (viewer, {}))
+            queues[queue] = loop
+        return queue
+
+    def unsubscribe(self, viewer: ViewerContext, queue: asyncio.Queue):
+        segment = _segment(viewer)
+        with self._lock:
+            entry = self._segments.get(segment)
+            if entry is not None:
+                entry[1].pop(queue, None)
+                if not entry[1]:
+                    del self._segments[segment]
+
+    def deliver(self, message: dict) -> int:
+        """Hands a message to every local subscriber allowed to see it. Safe to call from any thread."""
+        audience = AUDIENCES[message["kind"]]
+        item = SimpleNamespace(**message["data"])
+        with self._lock:
+            segments = [(viewer, list(queues.items())) for viewer, queues in self._segments.values()]
+
+        delivered = 0
+        for viewer, queues in segments:
+            if not audience.matcher(viewer)(item):
+                continue
+            for queue, loop in queues:
+                try:
+                    loop.call_soon_threadsafe(_offer, queue, message)
+                    delivered += 1
+                except RuntimeError:
+                    pass  # loop already closed (shutdown)
+        return delivered
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(queues) for _, queues in self._segments.values())
+
+
+def _offer(queue: asyncio.Queue, message: dict):
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        pass  # slow client; it can catch up by reloading the feed
+
+
+class LocalBackend:
+    """Single-worker stand-in: publishing delivers straight to this process's broker."""
+
+    def __init__(self, broker: Broker):
+        self.broker = broker
+
+    def publish(self, message: dict):
+        self.broker.deliver(message)
+
+    def start(self):
+        pass
+
+
+class RedisBackend:
+    """
+    Cross-worker fan-out over Redis pub/sub. Every worker publishes to one channel
+    and runs a listener thread that delivers incoming messages to its own broker.
+    """
+
+    def __init__(self, client, broker: Broker):
+        self.client = client
+        self.broker = broker
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def publish(self, message: dict):
+        self.client.publish(CHANNEL, json.dumps(message, default=str))
+
+    def start(self):
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            self._listener = threading.Thread(target=self._listen, name="feed-listener", daemon=True)
+            self._listener.start()
+
+    def _listen(self):
+        """Runs for the life of the process, resubscribing with backoff whenever Redis goes away."""
+        delay = RETRY_SECONDS
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(CHANNEL)
+                delay = RETRY_SECONDS
+                for raw in pubsub.listen():
+                    self._deliver(raw)
+                print("Feed listener: subscription ended, resubscribing")
+            except Exception as e:
+                # Messages published while disconnected are lost; clients get them on their next feed load
+                print(f"Feed listener disconnected from Redis: {e}; retrying in {delay}s")
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_SECONDS)
+
+    def _deliver(self, raw):
+        try:
+            self.broker.deliver(json.loads(raw["data"]))
+        except Exception as e:
+            print(f"Feed message dropped: {e}")
+
+
+broker = Broker()
+
+
+def _build_backend():
+    client = get_redis()
+    return RedisBackend(client, broker) if client is not None else LocalBackend(broker)
+
+
+backend = _build_backend()
+
+
+def publish(kind: str, data: dict):
+    """Pushes a newly created item to subscribed clients on every worker. `data` must be JSON-safe."""
+    try:
+        backend.publish({"kind": kind, "data": data})
+    except Exception as e:
+        # Push is best effort; clients still get the item on their next feed load
+        print(f"Feed publish failed: {e}")
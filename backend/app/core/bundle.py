@@ -0,0 +1,26 @@
+import asyncio
+from typing import Any, Callable, Dict, Tuple
+
+from pydantic import TypeAdapter
+
+from app.core.database import SessionLocal
+
+
+def _run_section(build: Callable, adapter: TypeAdapter):
+    # Own session = own pooled connection; serialize before it closes
+    with SessionLocal() as session:
+        return adapter.validate_python(build(session), from_attributes=True)
+
+
+async def gather_sections(sections: Dict[str, Tuple[Callable, Any]]) -> dict:
+    """
+    Builds independent page sections concurrently. `sections` maps a name to
+    (build(session) -> data, response type); each runs in the threadpool on
+    its own session. The first section to raise (e.g. a 404) fails the bundle.
+    """
+    names = list(sections)
+    results = await asyncio.gather(*(
+        asyncio.to_thread(_run_section, build, TypeAdapter(response_type))
+        for build, response_type in sections.values()
+    ))
+    return dict(zip(names, results))
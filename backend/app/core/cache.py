@@ -0,0 +1,164 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request
+
+try:
+    import redis  # Optional: shared cache across workers
+except ImportError:
+    redis = None
+
+DEFAULT_TTL_SECONDS = 60
+DEFAULT_MAX_ENTRIES = 512
+
+
+class LocalStore:
+    """
+    In-process LRU store with per-entry TTL.
+    Also used as the stand-in when no shared store (Redis) is configured.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._counters = {}  # kept apart so LRU pressure never evicts them
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, ttl: int):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def get_int(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._counters.clear()
+
+
+class RedisStore:
+    """
+    Shared store so every worker sees the same entries and invalidations.
+    Keys are namespaced with `prefix`, so clear() only touches this store's
+    keys and never OTPs, rate-limit buckets or anything else on the same DB.
+    """
+
+    def __init__(self, client, prefix: str):
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str):
+        return self.client.get(self._key(key))
+
+    def set(self, key: str, value, ttl: int):
+        self.client.set(self._key(key), value, ex=ttl)
+
+    def delete(self, key: str):
+        self.client.delete(self._key(key))
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self._key(key)))
+
+    def get_int(self, key: str) -> int:
+        value = self.client.get(self._key(key))
+        return int(value) if value is not None else 0
+
+    def clear(self):
+        batch = []
+        for key in self.client.scan_iter(match=f"{self.prefix}:*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                self.client.delete(*batch)
+                batch = []
+        if batch:
+            self.client.delete(*batch)
+
+
+class ResponseCache:
+    """
+    Caches serialized response bodies of public endpoints, keyed by route + query string.
+
+    Each namespace carries a generation counter that is part of every key, so
+    invalidating a namespace is a single increment: old entries simply stop
+    being addressed and age out via TTL/LRU.
+    """
+
+    def __init__(self, store, ttl: int = DEFAULT_TTL_SECONDS):
+        self.store = store
+        self.ttl = ttl
+
+    def _generation(self, namespace: str) -> int:
+        return self.store.get_int(f"gen:{namespace}")
+
+    def make_key(self, namespace: str, request: Request) -> str:
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        return f"resp:{namespace}:{self._generation(namespace)}:{request.url.path}?{query}"
+
+    # Callers build the key once, before running the query, and pass it to
+    # both get() and set(): if the namespace is invalidated meanwhile, the
+    # (possibly stale) body lands under the old generation and is never served.
+    def get(self, key: str) -> Optional[bytes]:
+        return self.store.get(key)
+
+    def set(self, key: str, body: bytes) -> bytes:
+        self.store.set(key, body, self.ttl)
+        return body
+
+    def invalidate(self, namespace: str):
+        self.store.incr(f"gen:{namespace}")
+
+
+_redis_client = None
+
+
+def get_redis():
+    """
+    Shared Redis client when REDIS_URL is set and the redis package is installed, else None.
+    Callers fall back to their in-process stand-in (single worker / dev).
+    """
+    global _redis_client
+    url = os.getenv("REDIS_URL")
+    if not url or redis is None:
+        return None
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(url)
+    return _redis_client
+
+
+def _build_store():
+    client = get_redis()
+    return RedisStore(client, prefix="response-cache") if client is not None else LocalStore()
+
+
+response_cache = ResponseCache(_build_store())
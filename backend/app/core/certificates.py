@@ -0,0 +1,218 @@
+import re
+import zipfile
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.pdf import Page
+from app.core.uploads import upload_dir
+from app.core.workers import process_pool
+from app.models import Achievement, Club, Event, EventRegistration, User
+
+WINNER_BADGES = {"Gold", "Silver", "Bronze"}
+RENDER_CHUNK = 64  # certificates per task sent to a worker
+
+# Each template is a list of (y, font, size, text) lines, formatted with the
+# certificate fields; lines that come out empty are skipped.
+TEMPLATES = {
+    "participation": {
+        "color": (0.12, 0.31, 0.62),
+        "lines": [
+            (465, "bold", 34, "CERTIFICATE OF PARTICIPATION"),
+            (400, "regular", 16, "This is to certify that"),
+            (350, "bold", 30, "{name}"),
+            (318, "regular", 14, "{details}"),
+            (270, "regular", 16, "has participated in"),
+            (235, "bold", 22, "{event}"),
+            (200, "regular", 14, "{held}"),
+        ],
+    },
+    "winner": {
+        "color": (0.72, 0.53, 0.04),
+        "lines": [
+            (465, "bold", 34, "CERTIFICATE OF ACHIEVEMENT"),
+            (400, "regular", 16, "This is to certify that"),
+            (350, "bold", 30, "{name}"),
+            (318, "regular", 14, "{details}"),
+            (270, "regular", 16, "has been awarded {title} in"),
+            (235, "bold", 22, "{event}"),
+            (200, "regular", 14, "{held}"),
+        ],
+    },
+}
+
+
+@dataclass
+class Recipient:
+    user_id: int
+    name: str
+    registration_number: Optional[str]
+    branch: Optional[str]
+    kind: str  # template name
+    title: Optional[str] = None  # achievement title, for winners
+    achievement_ids: tuple = ()  # achievements whose certificate_url points at the generated file
+
+
+def render(kind: str, fields: dict) -> bytes:
+    template = TEMPLATES[kind]
+    color = template["color"]
+    page = Page()
+    page.rect(20, 20, page.width - 40, page.height - 40, line_width=4, color=color)
+    page.rect(32, 32, page.width - 64, page.height - 64, line_width=1, color=color)
+
+    for y, font, size, text in template["lines"]:
+        line = text.format(**fields).strip()
+        if not line:
+            continue
+        page.centered_text(y, line, font=font, size=size, color=color if font == "bold" else (0.15, 0.15, 0.15))
+    page.line(page.width / 2 - 180, 340, page.width / 2 + 180, 340, line_width=0.75, color=color)
+
+    # Signature block
+    for x, caption in ((150, fields.get("coordinator") or "Event Coordinator"), (page.width - 150, "Authorized Signatory")):
+        page.line(x - 90, 110, x + 90, 110, line_width=0.75)
+        page.text(x - 90, 92, caption, size=11)
+    return page.to_bytes()
+
+
+def _render_to_file(job) -> str:
+    # Runs in a worker process; writes the file there so only the path travels back
+    path, kind, fields = job
+    with open(path, "wb") as f:
+        f.write(render(kind, fields))
+    return path
+
+
+def _safe(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", value).strip("_") or "student"
+
+
+def recipients(session: Session, event: Event) -> List[Recipient]:
+    """
+    Everyone who gets a certificate for an event: achievement holders (a winner
+    certificate if any of their badges is Gold/Silver/Bronze) plus registered
+    students without an achievement (participation). Two queries.
+    """
+    by_user = {}
+    rows = session.query(Achievement, User).join(User, Achievement.user_id == User.id)\
+        .filter(Achievement.event_id == event.id)\
+        .order_by(Achievement.id).all()
+    for achievement, user in rows:
+        recipient = by_user.get(user.id)
+        if recipient is None:
+            recipient = by_user[user.id] = Recipient(
+                user_id=user.id, name=user.name, registration_number=user.registration_number,
+                branch=user.branch, kind="participation"
+            )
+        if not achievement.certificate_url or achievement.certificate_url.startswith(url_prefix(event.id)):
+            recipient.achievement_ids += (achievement.id,)  # never replace a certificate attached by hand
+        if achievement.badge in WINNER_BADGES and recipient.kind != "winner":
+            recipient.kind, recipient.title = "winner", achievement.title
+
+    registrations = session.query(EventRegistration, User).outerjoin(User, EventRegistration.student_id == User.id)\
+        .filter(EventRegistration.event_id == event.id).all()
+    for registration, user in registrations:
+        if registration.student_id is None or registration.student_id in by_user:
+            continue
+        by_user[registration.student_id] = Recipient(
+            user_id=registration.student_id,
+            name=(user.name if user else None) or registration.student_name or "Student",
+            registration_number=(user.registration_number if user else None) or registration.registration_number,
+            branch=(user.branch if user else None) or registration.branch,
+            kind="participation",
+        )
+    return sorted(by_user.values(), key=lambda r: (r.registration_number or "", r.user_id))
+
+
+def _fields(event: Event, organizer: str, recipient: Recipient) -> dict:
+    details = " - ".join(part for part in (recipient.branch, recipient.registration_number) if part)
+    return {
+        "name": recipient.name,
+        "details": details,
+        "title": recipient.title or "a prize",
+        "event": event.title,
+        "held": f"organized by {organizer} on {event.date:%d %B %Y}",
+        "coordinator": event.coordinator_name or "",
+    }
+
+
+def url_prefix(event_id: int) -> str:
+    return f"/static/certificates/{event_id}/"
+
+
+def certificate_path(event_id: int, user_id: int):
+    directory = upload_dir("certificates", str(event_id))
+    return directory / f"{user_id}.pdf", f"{url_prefix(event_id)}{user_id}.pdf"
+
+
+def generate(session: Session, event: Event) -> dict:
+    """
+    Renders every certificate for an event on the shared process pool, stores
+    them under uploads/certificates/<event_id>/ and points the recipients'
+    achievements at them (only where no certificate was attached by hand).
+    Re-running overwrites the generated files, e.g. after a name fix.
+    """
+    everyone = recipients(session, event)
+    organizer = session.query(Club.name).filter(Club.id == event.club_id).scalar() if event.club_id else None
+    organizer = organizer or "the University"
+
+    jobs, urls = [], {}
+    for recipient in everyone:
+        path, url = certificate_path(event.id, recipient.user_id)
+        jobs.append((str(path), recipient.kind, _fields(event, organizer, recipient)))
+        urls[recipient.user_id] = url
+    for _ in process_pool().map(_render_to_file, jobs, chunksize=RENDER_CHUNK):
+        pass
+
+    changes = [
+        {"id": achievement_id, "certificate_url": urls[recipient.user_id]}
+        for recipient in everyone for achievement_id in recipient.achievement_ids
+    ]
+    if changes:
+        session.execute(update(Achievement), changes)  # executemany by primary key
+        session.commit()
+
+    return {
+        "event_id": event.id,
+        "generated": len(jobs),
+        "winner": sum(1 for r in everyone if r.kind == "winner"),
+        "participation": sum(1 for r in everyone if r.kind == "participation"),
+        "achievements_linked": len(changes),
+    }
+
+
+class _Sink:
+    """Write-only file object for zipfile that hands out what was written so far."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def zip_stream(event: Event, everyone: List[Recipient]) -> Iterator[bytes]:
+    """
+    Streams already generated certificates as a ZIP, one file at a time, so
+    memory stays flat however large the event. PDFs are stored uncompressed:
+    they barely shrink and deflating them only costs CPU.
+    """
+    sink = _Sink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for recipient in everyone:
+            path, _ = certificate_path(event.id, recipient.user_id)
+            if not path.exists():
+                continue
+            name = f"{_safe(recipient.registration_number or str(recipient.user_id))}-{_safe(recipient.name)}.pdf"
+            archive.write(path, arcname=name)
+            yield sink.drain()
+    yield sink.drain()
@@ -0,0 +1,131 @@
+import asyncio
+import json
+from datetime import datetime, timedelta
+from sqlalchemy import func, select, exists
+from sqlalchemy.orm import Session
+from app.core.cache import LocalStore, RedisStore, get_redis
+from app.core.database import SessionLocal
+from app.core.visibility import assignment_targets
+from app.models import User, Event, Announcement, Assignment, Submission, EventRegistration
+
+STATS_TTL_SECONDS = 120
+ADMIN_REFRESH_SECONDS = 60
+
+
+def _build_store():
+    # Shared when Redis is configured, so an invalidation reaches every worker
+    client = get_redis()
+    return RedisStore(client, prefix="dashboard-stats") if client is not None else LocalStore(max_entries=4096)
+
+
+# Precomputed stats per dashboard segment ("admin", "faculty:<id>", "student:<id>"), as JSON
+_store = _build_store()
+
+
+def week_start() -> datetime:
+    return datetime.utcnow() - timedelta(days=7)
+
+
+def compute_admin_stats(session: Session) -> dict:
+    # One round trip: every count is a scalar subquery of a single SELECT
+    row = session.execute(select(
+        select(func.count(User.id)).scalar_subquery(),
+        select(func.count(Event.id)).scalar_subquery(),
+        select(func.count(Announcement.id)).scalar_subquery(),
+        select(func.count(EventRegistration.id)).where(EventRegistration.registered_at >= week_start()).scalar_subquery(),
+    )).one()
+    return {
+        "users": row[0],
+        "events": row[1],
+        "announcements": row[2],
+        "registrations_this_week": row[3],
+    }
+
+
+def compute_faculty_stats(session: Session, user: User) -> dict:
+    row = session.execute(select(
+        select(func.count(Assignment.id)).where(Assignment.faculty_id == user.id).scalar_subquery(),
+        select(func.count(Submission.id))
+            .join(Assignment, Submission.assignment_id == Assignment.id)
+            .where(Assignment.faculty_id == user.id).scalar_subquery(),
+        select(func.count(Submission.id))
+            .join(Assignment, Submission.assignment_id == Assignment.id)
+            .where(Assignment.faculty_id == user.id, Submission.submitted_at >= week_start()).scalar_subquery(),
+    )).one()
+    return {
+        "assignments_created": row[0],
+        "submissions_received": row[1],
+        "submissions_this_week": row[2],
+    }
+
+
+def compute_student_stats(session: Session, user: User) -> dict:
+    submitted = exists().where(
+        Submission.assignment_id == Assignment.id,
+        Submission.student_id == user.id
+    )
+    row = session.execute(select(
+        select(func.count(Assignment.id))
+            .where(assignment_targets(user), Assignment.deadline >= datetime.utcnow(), ~submitted).scalar_subquery(),
+        select(func.count(EventRegistration.id)).where(EventRegistration.student_id == user.id).scalar_subquery(),
+        select(func.count(EventRegistration.id))
+            .where(EventRegistration.student_id == user.id, EventRegistration.registered_at >= week_start()).scalar_subquery(),
+    )).one()
+    return {
+        "pending_assignments": row[0],
+        "events_registered": row[1],
+        "registrations_this_week": row[2],
+    }
+
+
+def segment_key(user: User) -> str:
+    if user.role == "admin":
+        return "admin"
+    return f"{user.role}:{user.id}"
+
+
+def get_stats(session: Session, user: User) -> dict:
+    """Single lookup in the precomputed store; computed (and stored) only on a miss."""
+    key = segment_key(user)
+    cached = _store.get(key)
+    if cached is not None:
+        return json.loads(cached)
+
+    if user.role == "admin":
+        stats = compute_admin_stats(session)
+    elif user.role == "faculty":
+        stats = compute_faculty_stats(session, user)
+    elif user.role == "student":
+        stats = compute_student_stats(session, user)
+    else:
+        stats = {}
+    _store.set(key, json.dumps(stats), STATS_TTL_SECONDS)
+    return stats
+
+
+def invalidate_user(user_id: int, role: str = "student"):
+    """Drop one user's precomputed stats (their next dashboard load recomputes them)."""
+    _store.delete(f"{role}:{user_id}")
+
+
+def invalidate_all():
+    """Used when a write affects many segments at once (e.g. a new assignment for a whole branch)."""
+    _store.clear()
+
+
+def refresh_admin_stats():
+    session = SessionLocal()
+    try:
+        _store.set("admin", json.dumps(compute_admin_stats(session)), STATS_TTL_SECONDS)
+    finally:
+        session.close()
+
+
+async def refresh_periodically():
+    """Background job started from the app lifespan; keeps the admin aggregates warm."""
+    while True:
+        try:
+            await asyncio.to_thread(refresh_admin_stats)
+        except Exception as e:
+            print(f"Dashboard stats refresh failed: {e}")
+        await asyncio.sleep(ADMIN_REFRESH_SECONDS)
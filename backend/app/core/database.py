@@ -4,8 +4,9 @@ from urllib.parse import quote_plus
 
 import os
 from dotenv import load_dotenv
+from app.core.json_type import safe_json_loads
 
-load_dotenv()
+load_dotenv() # Single place .env is loaded; everything else imports this module first
 
 # UPDATE THESE VALUES
 DB_USER = os.getenv("DB_USER")
@@ -25,7 +26,8 @@ DATABASE_URL = (
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
-    echo=True  # set False later
+    json_deserializer=safe_json_loads, # legacy TEXT rows may hold malformed JSON
+    echo=os.getenv("SQL_ECHO") == "1" # logging every statement slows boot and every request
 )
 
 # SessionLocal
@@ -2,12 +2,8 @@ import random
 import string
 from datetime import datetime, timedelta
 
-import smtplib
-from email.utils import formatdate, make_msgid
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.image import MIMEImage
 import os
+from app.core.uploads import upload_dir
 
 def generate_otp(length=6):
     return ''.join(random.choices(string.digits, k=length))
@@ -47,6 +43,13 @@ def send_email_otp(to_email: str, otp_code: str, reason: str = "login"):
     Falls back to Console Print if credentials are missing or connection fails.
     Reason: "signup", "reset", "login"
     """
+    # SMTP/MIME modules are only needed when an email is actually sent, so import them lazily
+    import smtplib
+    from email.utils import formatdate, make_msgid
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.image import MIMEImage
+
     smtp_server = "smtp.gmail.com" # Default to Gmail
     smtp_port = 587
     smtp_user = os.getenv("SMTP_USER")
@@ -69,8 +72,7 @@ def send_email_otp(to_email: str, otp_code: str, reason: str = "login"):
         print(f"⚠️ SMTP Creds not set. Saving preview to backend/uploads/last_email.html")
         
         # Save Preview
-        preview_path = "uploads/last_email.html"
-        os.makedirs("uploads", exist_ok=True)
+        preview_path = upload_dir() / "last_email.html"
         with open(preview_path, "w", encoding="utf-8") as f:
             f.write(html_content)
             
@@ -144,6 +146,51 @@ def send_email_otp(to_email: str, otp_code: str, reason: str = "login"):
         print_otp_to_console(to_email, otp_code)
         return True
 
+def send_plain_emails(messages, before_each=None):
+    """
+    Sends a batch of plain-text emails [(to, subject, body)] over one SMTP
+    connection. `before_each` is called before every message (e.g. to wait on
+    a rate limit). Returns one bool per message. Without credentials the
+    messages are printed instead, like the OTP fallback.
+    """
+    import smtplib
+    from email.utils import formatdate, make_msgid
+    from email.mime.text import MIMEText
+
+    smtp_user = os.getenv("SMTP_USER")
+    smtp_password = os.getenv("SMTP_PASSWORD")
+
+    if not smtp_user or not smtp_password:
+        for to_email, subject, body in messages:
+            if before_each:
+                before_each()
+            print(f"📧 {to_email}: {subject}")
+        return [True] * len(messages)
+
+    results = []
+    try:
+        with smtplib.SMTP("smtp.gmail.com", 587) as server:
+            server.starttls()
+            server.login(smtp_user, smtp_password)
+            for to_email, subject, body in messages:
+                if before_each:
+                    before_each()
+                msg = MIMEText(body, "plain")
+                msg["Subject"] = subject
+                msg["From"] = f"STAMP Portal <{smtp_user}>"
+                msg["To"] = to_email
+                msg["Date"] = formatdate(localtime=True)
+                msg["Message-ID"] = make_msgid(domain="gmail.com")
+                try:
+                    server.sendmail(smtp_user, to_email, msg.as_string())
+                    results.append(True)
+                except smtplib.SMTPRecipientsRefused:
+                    results.append(False)
+    except Exception as e:
+        print(f"❌ FAILED to send email batch via SMTP: {e}")
+    # Anything not reached before the connection dropped counts as failed
+    return results + [False] * (len(messages) - len(results))
+
 def get_modern_email_html(otp_code: str, reason: str = "login"):
     """
     Returns a 'Shining Platinum' HTML email string.
@@ -0,0 +1,46 @@
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+# Clients must revalidate every time, but may reuse their copy on 304
+CACHE_CONTROL = "private, no-cache"
+
+
+def versioned(model, *filters, timestamp=None) -> list:
+    """
+    Version columns of one feed: row count, max id (and max timestamp). Feed rows
+    are only ever inserted or deleted, so any change moves at least one of them.
+    """
+    columns = [func.count(model.id), func.max(model.id)]
+    if timestamp is not None:
+        columns.append(func.max(timestamp))
+    return [select(column).where(*filters).scalar_subquery() for column in columns]
+
+
+def stamp(session: Session, *feeds) -> tuple:
+    """Reads the version of one or more feeds (see versioned) in a single SELECT."""
+    return tuple(session.execute(select(*(column for feed in feeds for column in feed))).one())
+
+
+def make_etag(*parts) -> str:
+    # Weak: the same content may serialize differently between releases
+    return 'W/"%s"' % hashlib.sha1(repr(parts).encode()).hexdigest()[:24]
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Returns a 304 if the client already has this version; otherwise tags the
+    outgoing response so the next poll can revalidate.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        # Weak comparison: W/"x" matches "x"
+        if "*" in candidates or etag in candidates or etag[2:] in candidates:
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return None
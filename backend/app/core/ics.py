@@ -0,0 +1,211 @@
+import hashlib
+import hmac
+import json
+import secrets
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core import feed_version, schedule
+from app.core.cache import LocalStore, RedisStore, get_redis
+from app.core.security import SECRET_KEY
+from app.core.visibility import ViewerContext
+from app.models import Assignment, ClubMembership, Event, EventRegistration, TeamMember, User
+
+PRODID = "-//University Portal//Calendar//EN"
+UID_DOMAIN = "university-portal"
+FEED_PAST_DAYS = 30
+FEED_FUTURE_DAYS = 365
+SEGMENT_TTL = 3600  # rendered segments are keyed by version, so this only bounds memory
+EVENT_DURATION = timedelta(hours=1)  # events only store a start time
+RENDER_VERSION = 2  # part of cache keys and ETags; bump when the VEVENT output changes
+
+
+def _build_store():
+    client = get_redis()
+    return RedisStore(client, prefix="calendar-feed") if client is not None else LocalStore(max_entries=2048)
+
+
+_store = _build_store()
+
+
+# --- Feed URL tokens -----------------------------------------------------------
+# Calendar apps can't log in or refresh a JWT, so the feed URL carries a
+# long-lived token: "<user id>.<HMAC of the id and the user's calendar_key>".
+# Rotating calendar_key revokes every link handed out before.
+
+def _signature(user_id: int, calendar_key: str) -> str:
+    return hmac.new(SECRET_KEY.encode(), f"calendar:{user_id}:{calendar_key}".encode(), hashlib.sha256).hexdigest()[:32]
+
+
+def feed_token(session: Session, user: User, rotate: bool = False) -> str:
+    if rotate or not user.calendar_key:
+        user.calendar_key = secrets.token_hex(16)
+        session.commit()
+    return f"{user.id}.{_signature(user.id, user.calendar_key)}"
+
+
+def user_for_token(session: Session, token: str) -> Optional[User]:
+    user_id, _, signature = token.partition(".")
+    if not user_id.isdigit() or not signature:
+        return None
+    user = session.query(User).filter(User.id == int(user_id)).first()
+    if not user or not user.is_active or not user.calendar_key:
+        return None
+    if not hmac.compare_digest(signature, _signature(user.id, user.calendar_key)):
+        return None
+    return user
+
+
+# --- Rendering -----------------------------------------------------------------
+
+def _escape(text: str) -> str:
+    return (text or "").replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n")
+
+
+def _fold(line: str) -> str:
+    """Lines longer than 75 octets continue on the next line after a space (RFC 5545 3.1)."""
+    raw = line.encode("utf-8")
+    if len(raw) <= 75:
+        return line
+    parts, current = [], b""
+    for char in line:
+        encoded = char.encode("utf-8")
+        if len(current) + len(encoded) > (75 if not parts else 74):
+            parts.append(current.decode("utf-8"))
+            current = b""
+        current += encoded
+    parts.append(current.decode("utf-8"))
+    return "\r\n ".join(parts)
+
+
+def _time(value: datetime) -> str:
+    # Stored dates are naive UTC
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _vevent(uid: str, start: datetime, end: datetime, summary: str, now: datetime,
+            description: str = "", location: str = "", categories: str = "") -> str:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}@{UID_DOMAIN}",
+        f"DTSTAMP:{now.strftime('%Y%m%dT%H%M%SZ')}",
+        f"DTSTART:{_time(start)}",
+        f"DTEND:{_time(end)}",
+        f"SUMMARY:{_escape(summary)}",
+    ]
+    if description:
+        lines.append(f"DESCRIPTION:{_escape(description)}")
+    if location:
+        lines.append(f"LOCATION:{_escape(location)}")
+    if categories:
+        lines.append(f"CATEGORIES:{_escape(categories)}")
+    lines.append("END:VEVENT")
+    return "\r\n".join(_fold(line) for line in lines)
+
+
+def event_entry(event: Event, now: datetime) -> Tuple[str, str]:
+    uid = f"event-{event.id}"
+    return uid, _vevent(
+        uid, event.date, event.date + EVENT_DURATION, event.title, now,
+        description=event.description, location=event.venue or event.location or "",
+        categories="Club Event" if event.club_id else "College Event",
+    )
+
+
+def deadline_entry(assignment: Assignment, now: datetime) -> Tuple[str, str]:
+    uid = f"assignment-{assignment.id}"
+    # A short block ending at the deadline, so it shows up at the right time
+    return uid, _vevent(
+        uid, assignment.deadline - timedelta(minutes=30), assignment.deadline, f"Due: {assignment.title}", now,
+        description=assignment.description, categories="Assignment",
+    )
+
+
+# --- Feed ----------------------------------------------------------------------
+
+def feed_window(now: datetime) -> Tuple[datetime, datetime]:
+    # Day-aligned so the window (and therefore the ETag) changes once a day
+    today = datetime(now.year, now.month, now.day)
+    return today - timedelta(days=FEED_PAST_DAYS), today + timedelta(days=FEED_FUTURE_DAYS)
+
+
+def _segments(viewer: ViewerContext) -> List[tuple]:
+    """
+    (name, cache scope, version columns) for each part of a user's feed.
+    Shared parts are scoped to their visibility segment, so every student of
+    the same branch/year reuses one rendered copy.
+    """
+    user_id = viewer.user_id
+    segments = [
+        ("college", (viewer.role, viewer.branch, viewer.year_key),
+         feed_version.versioned(Event, Event.club_id == None)),
+        ("clubs", (user_id,),
+         feed_version.versioned(Event, Event.club_id.in_(schedule.my_club_ids(user_id)))
+         + feed_version.versioned(ClubMembership, ClubMembership.student_id == user_id)),
+        ("registered", (user_id,),
+         feed_version.versioned(EventRegistration, EventRegistration.student_id == user_id)
+         + feed_version.versioned(TeamMember, TeamMember.user_id == user_id)),
+    ]
+    targets = schedule.deadline_filter(viewer)
+    if targets is not None:
+        scope = (viewer.branch, viewer.section) if viewer.is_student else ("faculty", user_id)
+        segments.append(("deadlines", scope, feed_version.versioned(Assignment, targets)))
+    return segments
+
+
+def versions(session: Session, viewer: ViewerContext) -> dict:
+    """Version of every segment of the feed in one SELECT (see feed_version.stamp)."""
+    segments = _segments(viewer)
+    values = feed_version.stamp(session, *(columns for _, _, columns in segments))
+    result, offset = {}, 0
+    for name, scope, columns in segments:
+        result[name] = (scope, values[offset:offset + len(columns)])
+        offset += len(columns)
+    return result
+
+
+def etag_for(viewer: ViewerContext, window: Tuple[datetime, datetime], segment_versions: dict) -> str:
+    return feed_version.make_etag("ics", RENDER_VERSION, viewer, window[0].date(), sorted(segment_versions.items()))
+
+
+def _render_segment(session: Session, name: str, viewer: ViewerContext, window, now) -> List[list]:
+    start, end = window
+    if name == "college":
+        return [list(event_entry(e, now)) for e in schedule.college_events(session, viewer, start, end)]
+    if name == "clubs":
+        return [list(event_entry(e, now)) for e in schedule.club_events(session, viewer.user_id, start, end)]
+    if name == "registered":
+        return [list(event_entry(e, now)) for e in schedule.registered_events(session, viewer.user_id, start, end)]
+    return [list(deadline_entry(a, now)) for a in schedule.deadlines(session, viewer, start, end)]
+
+
+def build_feed(session: Session, viewer: ViewerContext, name: str, window, segment_versions: dict) -> bytes:
+    now = datetime.utcnow()
+    seen, entries = set(), []
+    for segment, (scope, version) in segment_versions.items():
+        key = f"ics:{RENDER_VERSION}:{segment}:{':'.join(map(str, scope))}:{window[0]:%Y%m%d}:{feed_version.make_etag(*version)}"
+        cached = _store.get(key)
+        if cached is None:
+            rendered = _render_segment(session, segment, viewer, window, now)
+            _store.set(key, json.dumps(rendered), SEGMENT_TTL)
+        else:
+            rendered = json.loads(cached)
+        for uid, vevent in rendered:
+            # An event can be both visible to everyone and one you registered for
+            if uid not in seen:
+                seen.add(uid)
+                entries.append(vevent)
+
+    header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        _fold(f"X-WR-CALNAME:{_escape(name)}"),
+        "X-PUBLISHED-TTL:PT1H",
+        "REFRESH-INTERVAL;VALUE=DURATION:PT1H",
+    ]
+    return "\r\n".join(header + entries + ["END:VCALENDAR", ""]).encode("utf-8")
@@ -0,0 +1,63 @@
+from contextlib import contextmanager
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+
+class StatementRecorder:
+    """Collects every distinct SELECT run on an engine (first parameter set kept for EXPLAIN)."""
+
+    def __init__(self):
+        self.statements = {}  # statement text -> parameters
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and statement not in self.statements:
+            self.statements[statement] = parameters
+
+    @contextmanager
+    def capture(self, engine: Engine):
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        try:
+            yield self
+        finally:
+            event.remove(engine, "before_cursor_execute", self._on_execute)
+
+
+def explain(conn, statement: str, parameters):
+    """Runs EXPLAIN through the raw DBAPI cursor so the recorded paramstyle is reused as-is."""
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        columns = [c[0] for c in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+def full_scans(dialect_name: str, plan):
+    """Returns the plan rows that read a whole table."""
+    flagged = []
+    for row in plan:
+        if dialect_name == "mysql":
+            # type ALL = full table scan, index = full index scan
+            if row.get("type") in ("ALL", "index"):
+                flagged.append(f"{row.get('table')}: type={row.get('type')} key={row.get('key')} rows={row.get('rows')}")
+        else:
+            detail = str(row.get("detail", ""))
+            if detail.startswith("SCAN") and "USING" not in detail and "CONSTANT ROW" not in detail:
+                flagged.append(detail)
+    return flagged
+
+
+def analyze(engine: Engine, recorder: StatementRecorder):
+    """EXPLAINs every recorded statement. Returns [(statement, flagged scans, full plan)]."""
+    report = []
+    with engine.connect() as conn:
+        for statement, parameters in recorder.statements.items():
+            try:
+                plan = explain(conn, statement, parameters)
+            except Exception as e:
+                report.append((statement, [f"EXPLAIN failed: {e}"], []))
+                continue
+            report.append((statement, full_scans(conn.dialect.name, plan), plan))
+    return report
@@ -0,0 +1,46 @@
+import json
+from sqlalchemy import Text
+from sqlalchemy.dialects import mysql
+from sqlalchemy.types import TypeDecorator
+
+
+def safe_json_loads(value):
+    """
+    Tolerant json.loads used for legacy TEXT columns.
+    Malformed values (hand-edited rows, plain strings) decode to None instead of raising.
+    """
+    if value is None or value == "":
+        return None
+    if not isinstance(value, (str, bytes, bytearray)):
+        return value
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class JSONColumn(TypeDecorator):
+    """
+    JSON column stored natively on MySQL (JSON type) and as TEXT elsewhere (SQLite).
+    Values are decoded once when the row is loaded, so ORM instances always expose
+    plain Python lists/dicts and endpoints never have to json.loads them again.
+    """
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(mysql.JSON())
+        return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if dialect.name == "mysql":
+            # mysql.JSON serializes on its own
+            return value
+        return json.dumps(value)
+
+    def process_result_value(self, value, dialect):
+        # On MySQL the native JSON type already decoded the value (via the engine's json_deserializer)
+        return safe_json_loads(value)
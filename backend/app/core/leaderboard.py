@@ -0,0 +1,219 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import delete, func, update
+from sqlalchemy.dialects import mysql, sqlite
+from sqlalchemy.orm import Session
+from app.models import Achievement, Event, LeaderboardEntry, User
+
+# Points per badge (Achievement.badge)
+BADGE_WEIGHTS = {
+    "Gold": 10,
+    "Silver": 6,
+    "Bronze": 3,
+    "Participate": 1,
+}
+
+# Badge -> per-badge counter column on LeaderboardEntry
+BADGE_COLUMNS = {
+    "Gold": "gold",
+    "Silver": "silver",
+    "Bronze": "bronze",
+    "Participate": "participate",
+}
+
+OVERALL = 0 # club_id used for the college-wide board
+
+
+def _scopes(achievement: Achievement, event: Optional[Event] = None):
+    """Every achievement counts overall, and also on its club's board when the event belongs to a club."""
+    scopes = [OVERALL]
+    evt = event or achievement.event
+    if evt and evt.club_id:
+        scopes.append(evt.club_id)
+    return scopes
+
+
+def _filtered(query, club_id: int, branch: Optional[str], year: Optional[int]):
+    query = query.filter(LeaderboardEntry.club_id == club_id)
+    if branch:
+        query = query.filter(LeaderboardEntry.branch == branch)
+    if year:
+        query = query.filter(LeaderboardEntry.year == year)
+    return query
+
+
+COUNTERS = ("score", "gold", "silver", "bronze", "participate")
+
+
+def _upsert(session: Session, rows):
+    """
+    Adds each row's counters onto the existing (user_id, club_id) entry, creating
+    it when missing. A single INSERT ... ON DUPLICATE KEY UPDATE (ON CONFLICT on
+    SQLite), so two first awards for the same student can't both try to insert.
+    """
+    now = datetime.utcnow()
+    if session.get_bind().dialect.name == "mysql":
+        stmt = mysql.insert(LeaderboardEntry)
+        new = stmt.inserted
+        stmt = stmt.on_duplicate_key_update(
+            branch=new.branch, year=new.year, updated_at=now,
+            **{c: getattr(LeaderboardEntry, c) + getattr(new, c) for c in COUNTERS},
+        )
+    else:
+        stmt = sqlite.insert(LeaderboardEntry)
+        new = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "club_id"],
+            set_=dict(branch=new.branch, year=new.year, updated_at=now,
+                      **{c: getattr(LeaderboardEntry, c) + getattr(new, c) for c in COUNTERS}),
+        )
+    session.execute(stmt, [dict(row, updated_at=now) for row in rows])
+
+
+def _row(user_id: int, club_id: int, student: User, score: int, counts: dict):
+    row = dict(user_id=user_id, club_id=club_id, branch=student.branch, year=student.year,
+               score=score, gold=0, silver=0, bronze=0, participate=0)
+    row.update(counts)
+    return row
+
+
+def apply_achievement(session: Session, achievement: Achievement, student: User, sign: int = 1, event: Optional[Event] = None):
+    """
+    Adds (sign=1) or removes (sign=-1) one achievement from the leaderboard.
+    Runs inside the caller's transaction, so it commits together with the achievement itself.
+    """
+    weight = BADGE_WEIGHTS.get(achievement.badge, 0)
+    column = BADGE_COLUMNS.get(achievement.badge)
+    scopes = _scopes(achievement, event)
+
+    if sign > 0:
+        _upsert(session, [_row(student.id, club_id, student, weight, {column: 1} if column else {}) for club_id in scopes])
+        return
+
+    # Removing never creates a row; atomic decrements, then drop rows with no badges left
+    mine = (LeaderboardEntry.user_id == student.id, LeaderboardEntry.club_id.in_(scopes))
+    values = {"score": LeaderboardEntry.score - weight, "branch": student.branch, "year": student.year}
+    if column:
+        values[column] = getattr(LeaderboardEntry, column) - 1
+    session.execute(update(LeaderboardEntry).where(*mine).values(**values))
+    session.execute(delete(LeaderboardEntry).where(
+        *mine,
+        LeaderboardEntry.gold + LeaderboardEntry.silver + LeaderboardEntry.bronze + LeaderboardEntry.participate <= 0,
+    ))
+
+
+def apply_achievements(session: Session, awarded, event: Event):
+    """
+    Batch form of apply_achievement for many new achievements of one event
+    (`awarded` is a list of (badge, student)): one upsert executemany for all of them.
+    """
+    deltas = {}  # (user_id, club_id) -> [score, {column: count}, student]
+    scopes = [OVERALL, event.club_id] if event.club_id else [OVERALL]
+    for badge, student in awarded:
+        column = BADGE_COLUMNS.get(badge)
+        for club_id in scopes:
+            delta = deltas.setdefault((student.id, club_id), [0, {}, student])
+            delta[0] += BADGE_WEIGHTS.get(badge, 0)
+            if column:
+                delta[1][column] = delta[1].get(column, 0) + 1
+    if not deltas:
+        return
+    _upsert(session, [
+        _row(user_id, club_id, student, score, counts)
+        for (user_id, club_id), (score, counts, student) in deltas.items()
+    ])
+
+
+def sync_profile(session: Session, user: User):
+    """
+    Copies a user's branch/year onto their leaderboard rows after a profile
+    change, so segment filters follow it. Runs in the caller's transaction.
+    """
+    session.execute(
+        update(LeaderboardEntry).where(LeaderboardEntry.user_id == user.id)
+        .values(branch=user.branch, year=user.year)
+    )
+
+
+def top_entries(session: Session, club_id: int = OVERALL, branch: Optional[str] = None, year: Optional[int] = None, limit: int = 10):
+    """Top-K rows served from the (club_id, branch, year, score) index, with competition ranking (1, 2, 2, 4)."""
+    query = session.query(LeaderboardEntry, User.name, User.registration_number)\
+        .join(User, LeaderboardEntry.user_id == User.id)
+    rows = _filtered(query, club_id, branch, year)\
+        .order_by(LeaderboardEntry.score.desc(), LeaderboardEntry.user_id.asc())\
+        .limit(limit)\
+        .all()
+
+    results = []
+    previous_score, previous_rank = None, 0
+    for position, (entry, name, reg_no) in enumerate(rows, start=1):
+        rank = previous_rank if entry.score == previous_score else position
+        previous_score, previous_rank = entry.score, rank
+        results.append(to_dict(entry, rank, name, reg_no))
+    return results
+
+
+def rank_of(session: Session, user: User, club_id: int = OVERALL, branch: Optional[str] = None, year: Optional[int] = None):
+    """A user's rank is 1 + the number of rows scoring strictly higher: a single index range count."""
+    entry = session.query(LeaderboardEntry).filter(
+        LeaderboardEntry.user_id == user.id,
+        LeaderboardEntry.club_id == club_id
+    ).first()
+    if not entry:
+        return None
+    # Outside the requested segment: no rank there
+    if (branch and entry.branch != branch) or (year and entry.year != year):
+        return None
+
+    higher = _filtered(session.query(func.count(LeaderboardEntry.id)), club_id, branch, year)\
+        .filter(LeaderboardEntry.score > entry.score)\
+        .scalar()
+    return to_dict(entry, (higher or 0) + 1, user.name, user.registration_number)
+
+
+def to_dict(entry: LeaderboardEntry, rank: int, name: Optional[str], reg_no: Optional[str]):
+    return {
+        "rank": rank,
+        "user_id": entry.user_id,
+        "student_name": name,
+        "registration_number": reg_no,
+        "branch": entry.branch,
+        "year": entry.year,
+        "score": entry.score,
+        "gold": entry.gold,
+        "silver": entry.silver,
+        "bronze": entry.bronze,
+        "participate": entry.participate,
+    }
+
+
+def rebuild(session: Session) -> int:
+    """
+    Recomputes the whole leaderboard from achievements (backfills, weight changes).
+    One grouped query; the caller commits. Returns the number of rows written.
+    """
+    rows = session.query(
+        Achievement.user_id, Event.club_id, Achievement.badge, User.branch, User.year, func.count(Achievement.id)
+    ).join(User, Achievement.user_id == User.id)\
+     .outerjoin(Event, Achievement.event_id == Event.id)\
+     .group_by(Achievement.user_id, Event.club_id, Achievement.badge, User.branch, User.year)\
+     .all()
+
+    entries = {}
+    for user_id, club_id, badge, branch, year, count in rows:
+        for scope in ([OVERALL, club_id] if club_id else [OVERALL]):
+            entry = entries.get((user_id, scope))
+            if entry is None:
+                entry = LeaderboardEntry(
+                    user_id=user_id, club_id=scope, branch=branch, year=year,
+                    score=0, gold=0, silver=0, bronze=0, participate=0
+                )
+                entries[(user_id, scope)] = entry
+            entry.score += BADGE_WEIGHTS.get(badge, 0) * count
+            column = BADGE_COLUMNS.get(badge)
+            if column:
+                setattr(entry, column, getattr(entry, column) + count)
+
+    session.query(LeaderboardEntry).delete()
+    session.add_all(entries.values())
+    return len(entries)
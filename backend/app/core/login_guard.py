@@ -0,0 +1,138 @@
+import time
+import threading
+from collections import Counter
+
+from app.core.cache import get_redis
+from app.core.rate_limit import sliding_window
+
+# Failed logins allowed inside the sliding window before the key is locked
+IP_FAILURE_LIMIT = 30
+IP_WINDOW_SECONDS = 5 * 60
+ACCOUNT_FAILURE_LIMIT = 5
+ACCOUNT_WINDOW_SECONDS = 15 * 60
+
+# Lockout doubles with every repeat offence: 30s, 60s, 120s ... capped at 1h
+LOCKOUT_BASE_SECONDS = 30
+LOCKOUT_MAX_SECONDS = 60 * 60
+STRIKE_MEMORY_SECONDS = 24 * 60 * 60  # repeat offences are forgotten after a quiet day
+
+
+def lockout_seconds(strikes: int) -> int:
+    return min(LOCKOUT_BASE_SECONDS * 2 ** max(strikes - 1, 0), LOCKOUT_MAX_SECONDS)
+
+
+class LocalLockouts:
+    def __init__(self):
+        self._locks = {}  # key -> (locked_until, strikes, last_strike)
+        self._lock = threading.Lock()
+
+    def locked_for(self, key: str) -> float:
+        entry = self._locks.get(key)
+        if entry is None:
+            return 0.0
+        return max(entry[0] - time.time(), 0.0)
+
+    def lock(self, key: str) -> int:
+        now = time.time()
+        with self._lock:
+            _, strikes, last_strike = self._locks.get(key, (0, 0, now))
+            if now - last_strike > STRIKE_MEMORY_SECONDS:
+                strikes = 0
+            strikes += 1
+            duration = lockout_seconds(strikes)
+            self._locks[key] = (now + duration, strikes, now)
+            # Forget long-expired offenders so the dict stays bounded
+            if len(self._locks) > 10000:
+                self._locks = {k: v for k, v in self._locks.items() if now - v[2] <= STRIKE_MEMORY_SECONDS}
+            return duration
+
+    def clear(self, key: str):
+        with self._lock:
+            self._locks.pop(key, None)
+
+
+class RedisLockouts:
+    def __init__(self, client):
+        self.client = client
+
+    def locked_for(self, key: str) -> float:
+        ttl = self.client.pttl(f"lockout:{key}")
+        return ttl / 1000 if ttl and ttl > 0 else 0.0
+
+    def lock(self, key: str) -> int:
+        pipe = self.client.pipeline()
+        pipe.incr(f"strikes:{key}")
+        pipe.expire(f"strikes:{key}", STRIKE_MEMORY_SECONDS)
+        strikes, _ = pipe.execute()
+        duration = lockout_seconds(int(strikes))
+        self.client.set(f"lockout:{key}", 1, ex=duration)
+        return duration
+
+    def clear(self, key: str):
+        self.client.delete(f"lockout:{key}", f"strikes:{key}")
+
+
+class LoginGuard:
+    """
+    Sits in front of /auth/login. check() only looks at lockout state, so
+    blocked attempts are rejected before any DB query or bcrypt work.
+    Failures are counted per IP and per account in sliding windows; crossing
+    a limit locks that key with an exponentially growing lockout.
+    """
+
+    def __init__(self):
+        client = get_redis()
+        self.ip_failures = sliding_window("login-ip", IP_WINDOW_SECONDS)
+        self.account_failures = sliding_window("login-account", ACCOUNT_WINDOW_SECONDS)
+        self.lockouts = RedisLockouts(client) if client is not None else LocalLockouts()
+        self._metrics = Counter()  # per worker
+        self._metrics_lock = threading.Lock()
+
+    def _count(self, name: str):
+        with self._metrics_lock:
+            self._metrics[name] += 1
+
+    def check(self, ip: str, account: str) -> float:
+        """Returns 0 if the attempt may proceed, else seconds until it may be retried."""
+        self._count("attempts")
+        retry_after = self.lockouts.locked_for(f"ip:{ip}")
+        if retry_after:
+            self._count("rejected_ip")
+            return retry_after
+        retry_after = self.lockouts.locked_for(f"account:{account}")
+        if retry_after:
+            self._count("rejected_account")
+            return retry_after
+        return 0.0
+
+    def record_failure(self, ip: str, account: str):
+        self._count("failures")
+        if self.ip_failures.hit(ip) >= IP_FAILURE_LIMIT:
+            self.lockouts.lock(f"ip:{ip}")
+            self.ip_failures.reset(ip)
+            self._count("lockouts_ip")
+        if self.account_failures.hit(account) >= ACCOUNT_FAILURE_LIMIT:
+            self.lockouts.lock(f"account:{account}")
+            self.account_failures.reset(account)
+            self._count("lockouts_account")
+
+    def record_success(self, ip: str, account: str):
+        # A good password resets the account; the IP keeps its history (shared NATs, stuffing hits)
+        self._count("successes")
+        self.account_failures.reset(account)
+        self.lockouts.clear(f"account:{account}")
+
+    def metrics(self) -> dict:
+        with self._metrics_lock:
+            data = dict(self._metrics)
+        rejected = data.get("rejected_ip", 0) + data.get("rejected_account", 0)
+        data["rejected"] = rejected
+        data["rejected_ratio"] = round(rejected / data["attempts"], 4) if data.get("attempts") else 0.0
+        return data
+
+    def reset_metrics(self):
+        with self._metrics_lock:
+            self._metrics.clear()
+
+
+login_guard = LoginGuard()
@@ -0,0 +1,133 @@
+import hmac
+import heapq
+import json
+import time
+import threading
+from dataclasses import dataclass, asdict
+
+from app.core.cache import get_redis
+
+OTP_TTL_SECONDS = 5 * 60
+MAX_VERIFY_ATTEMPTS = 5
+
+# verify() results
+VERIFIED = "verified"
+NOT_FOUND = "not_found"
+INVALID = "invalid"
+TOO_MANY_ATTEMPTS = "too_many_attempts"
+
+
+@dataclass
+class OTPRecord:
+    code: str
+    purpose: str
+    attempts: int = 0
+
+
+def _matches(record: OTPRecord, code: str) -> bool:
+    return hmac.compare_digest(record.code, code or "")
+
+
+class LocalOTPStore:
+    """
+    In-process OTP store. Entries expire on their own: reads ignore expired
+    entries and a min-heap of expiry times lets purge() drop them without scanning.
+    """
+
+    def __init__(self, ttl: int = OTP_TTL_SECONDS):
+        self.ttl = ttl
+        self._records = {}  # email -> (expires_at, OTPRecord)
+        self._expiry_heap = []  # (expires_at, email)
+        self._lock = threading.Lock()
+
+    def _purge(self, now: float):
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, email = heapq.heappop(self._expiry_heap)
+            entry = self._records.get(email)
+            # A newer code for the same email has its own heap entry
+            if entry and entry[0] == expires_at:
+                del self._records[email]
+
+    def put(self, email: str, code: str, purpose: str):
+        now = time.monotonic()
+        with self._lock:
+            self._purge(now)
+            expires_at = now + self.ttl
+            self._records[email] = (expires_at, OTPRecord(code=code, purpose=purpose))
+            heapq.heappush(self._expiry_heap, (expires_at, email))
+
+    def verify(self, email: str, code: str) -> str:
+        """Checks a code and consumes it on success. Wrong guesses count towards MAX_VERIFY_ATTEMPTS."""
+        with self._lock:
+            self._purge(time.monotonic())
+            entry = self._records.get(email)
+            if entry is None:
+                return NOT_FOUND
+            record = entry[1]
+            if _matches(record, code):
+                del self._records[email]
+                return VERIFIED
+            record.attempts += 1
+            if record.attempts >= MAX_VERIFY_ATTEMPTS:
+                del self._records[email]
+                return TOO_MANY_ATTEMPTS
+            return INVALID
+
+    def __len__(self):
+        with self._lock:
+            self._purge(time.monotonic())
+            return len(self._records)
+
+
+class RedisOTPStore:
+    """Shared OTP store for multiple workers; Redis key TTLs handle expiry."""
+
+    def __init__(self, client, ttl: int = OTP_TTL_SECONDS):
+        self.client = client
+        self.ttl = ttl
+
+    def _key(self, email: str) -> str:
+        return f"otp:{email}"
+
+    def _attempts_key(self, email: str) -> str:
+        return f"otp-attempts:{email}"
+
+    def put(self, email: str, code: str, purpose: str):
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self._key(email), json.dumps(asdict(OTPRecord(code=code, purpose=purpose))), ex=self.ttl)
+        pipe.delete(self._attempts_key(email))  # a new code gets a fresh set of attempts
+        pipe.execute()
+
+    def verify(self, email: str, code: str) -> str:
+        key, attempts_key = self._key(email), self._attempts_key(email)
+        # Count the attempt atomically *before* comparing: parallel guesses each
+        # get their own number, so at most MAX_VERIFY_ATTEMPTS codes are ever checked
+        pipe = self.client.pipeline(transaction=True)
+        pipe.get(key)
+        pipe.incr(attempts_key)
+        pipe.expire(attempts_key, self.ttl)
+        raw, attempts, _ = pipe.execute()
+        if raw is None:
+            self.client.delete(attempts_key)
+            return NOT_FOUND
+        if attempts > MAX_VERIFY_ATTEMPTS:
+            self.client.delete(key, attempts_key)
+            return TOO_MANY_ATTEMPTS
+        record = OTPRecord(**json.loads(raw))
+        if _matches(record, code):
+            # DELETE returns 0 if another worker consumed it first
+            consumed = self.client.delete(key)
+            self.client.delete(attempts_key)
+            return VERIFIED if consumed else NOT_FOUND
+        if attempts >= MAX_VERIFY_ATTEMPTS:
+            self.client.delete(key, attempts_key)
+            return TOO_MANY_ATTEMPTS
+        return INVALID
+
+
+def _build_store():
+    client = get_redis()
+    return RedisOTPStore(client) if client is not None else LocalOTPStore()
+
+
+otp_store = _build_store()
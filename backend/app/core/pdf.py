@@ -0,0 +1,91 @@
+"""
+Minimal single-page PDF writer for generated documents (certificates).
+
+Only what those need: the built-in Helvetica fonts (no embedding, so files
+stay a few KB), text, lines and rectangles. Text is encoded as WinAnsi, so
+Latin-1 names render; anything else falls back to "?".
+"""
+from typing import List, Tuple
+
+# Glyph widths (1/1000 em) for ASCII 32..126, from the standard Helvetica AFM files
+_HELVETICA = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+_HELVETICA_BOLD = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]
+FONTS = {
+    "regular": ("F1", "Helvetica", _HELVETICA),
+    "bold": ("F2", "Helvetica-Bold", _HELVETICA_BOLD),
+}
+
+A4_LANDSCAPE = (842, 595)
+
+
+def text_width(text: str, font: str, size: float) -> float:
+    widths = FONTS[font][2]
+    units = sum(widths[ord(c) - 32] if 32 <= ord(c) <= 126 else 556 for c in text)
+    return units * size / 1000
+
+
+def _escape(text: str) -> bytes:
+    raw = text.encode("cp1252", errors="replace")
+    return raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+class Page:
+    def __init__(self, size: Tuple[int, int] = A4_LANDSCAPE):
+        self.width, self.height = size
+        self._ops: List[bytes] = []
+
+    def rect(self, x: float, y: float, w: float, h: float, line_width: float = 1, color=(0, 0, 0)):
+        self._ops.append(b"%.3f %.3f %.3f RG %.2f w %.2f %.2f %.2f %.2f re S" % (*color, line_width, x, y, w, h))
+
+    def line(self, x1: float, y1: float, x2: float, y2: float, line_width: float = 1, color=(0, 0, 0)):
+        self._ops.append(b"%.3f %.3f %.3f RG %.2f w %.2f %.2f m %.2f %.2f l S" % (*color, line_width, x1, y1, x2, y2))
+
+    def text(self, x: float, y: float, text: str, font: str = "regular", size: float = 12, color=(0, 0, 0)):
+        name = FONTS[font][0].encode()
+        self._ops.append(b"BT %.3f %.3f %.3f rg /%s %.2f Tf %.2f %.2f Td (%s) Tj ET" % (*color, name, size, x, y, _escape(text)))
+
+    def centered_text(self, y: float, text: str, font: str = "regular", size: float = 12, color=(0, 0, 0), max_width: float = None):
+        """Centers one line, shrinking the font if it would not fit in max_width."""
+        max_width = max_width or self.width - 120
+        width = text_width(text, font, size)
+        if width > max_width:
+            size, width = size * max_width / width, max_width
+        self.text((self.width - width) / 2, y, text, font, size, color)
+
+    def to_bytes(self) -> bytes:
+        content = b"\n".join(self._ops)
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Contents 4 0 R "
+            b"/Resources << /Font << /F1 5 0 R /F2 6 0 R >> >> >>" % (self.width, self.height),
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+        ]
+        for _, base_font, _ in FONTS.values():
+            objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>" % base_font.encode())
+
+        out = bytearray(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        for offset in offsets:
+            out += b"%010d 00000 n \n" % offset
+        out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+        return bytes(out)
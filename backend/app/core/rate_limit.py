@@ -0,0 +1,185 @@
+import time
+import threading
+from typing import Tuple
+
+from app.core.cache import get_redis
+
+
+class TokenBucket:
+    """
+    In-process token bucket: `capacity` requests in a burst, refilled at
+    `refill_per_second`. Buckets are created on first use; a sweep drops the
+    ones that have refilled to capacity (they'd be recreated identically).
+    """
+
+    def __init__(self, capacity: int, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._buckets = {}  # key -> (tokens, last_refill)
+        self._lock = threading.Lock()
+        # Sweep at most once per full refill period: by then every idle bucket is full
+        self._sweep_every = capacity / refill_per_second
+        self._last_sweep = time.monotonic()
+
+    def _refilled(self, tokens: float, last: float, now: float) -> float:
+        return min(self.capacity, tokens + (now - last) * self.refill_per_second)
+
+    def _sweep(self, now: float):
+        full = [key for key, (tokens, last) in self._buckets.items()
+                if self._refilled(tokens, last, now) >= self.capacity]
+        for key in full:
+            del self._buckets[key]
+        self._last_sweep = now
+
+    def take(self, key: str) -> Tuple[bool, float]:
+        """Consumes one token. Returns (allowed, seconds until a token is available)."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_sweep >= self._sweep_every:
+                self._sweep(now)
+            tokens, last = self._buckets.get(key, (self.capacity, now))
+            tokens = self._refilled(tokens, last, now)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return True, 0.0
+            self._buckets[key] = (tokens, now)
+            return False, (1 - tokens) / self.refill_per_second
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+# Atomic refill-and-take so every worker shares one bucket per key
+_REDIS_TOKEN_BUCKET = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisTokenBucket:
+    def __init__(self, client, capacity: int, refill_per_second: float, prefix: str):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.prefix = prefix
+        self._script = client.register_script(_REDIS_TOKEN_BUCKET)
+
+    def take(self, key: str) -> Tuple[bool, float]:
+        allowed, tokens = self._script(
+            keys=[f"bucket:{self.prefix}:{key}"],
+            args=[self.capacity, self.refill_per_second, time.time()]
+        )
+        if allowed:
+            return True, 0.0
+        return False, (1 - float(tokens)) / self.refill_per_second
+
+
+def token_bucket(name: str, capacity: int, refill_per_second: float):
+    """Shared bucket when Redis is configured, in-process stand-in otherwise."""
+    client = get_redis()
+    if client is not None:
+        return RedisTokenBucket(client, capacity, refill_per_second, prefix=name)
+    return TokenBucket(capacity, refill_per_second)
+
+
+class SlidingWindowCounter:
+    """
+    In-process sliding-window counter (two fixed windows, the previous one
+    weighted by how much of it still overlaps the sliding window).
+    """
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._windows = {}  # key -> (window_index, current, previous)
+        self._last_sweep = 0
+        self._lock = threading.Lock()
+
+    def _estimate(self, index: int, entry, fraction: float) -> float:
+        window, current, previous = entry
+        if window == index:
+            return current + previous * (1 - fraction)
+        if window == index - 1:
+            return current * (1 - fraction)
+        return 0.0
+
+    def _sweep(self, index: int):
+        # Drop keys that have not been hit for two windows so the dict stays bounded
+        if index - self._last_sweep < 2:
+            return
+        self._last_sweep = index
+        stale = [key for key, entry in self._windows.items() if entry[0] < index - 1]
+        for key in stale:
+            del self._windows[key]
+
+    def hit(self, key: str) -> float:
+        """Counts one event and returns the count over the last window."""
+        index, fraction = divmod(time.time() / self.window_seconds, 1)
+        index = int(index)
+        with self._lock:
+            self._sweep(index)
+            window, current, previous = self._windows.get(key, (index, 0, 0))
+            if window == index - 1:
+                current, previous = 0, current
+            elif window != index:
+                current, previous = 0, 0
+            self._windows[key] = (index, current + 1, previous)
+            return self._estimate(index, self._windows[key], fraction)
+
+    def count(self, key: str) -> float:
+        index, fraction = divmod(time.time() / self.window_seconds, 1)
+        with self._lock:
+            entry = self._windows.get(key)
+            return self._estimate(int(index), entry, fraction) if entry else 0.0
+
+    def reset(self, key: str):
+        with self._lock:
+            self._windows.pop(key, None)
+
+
+class RedisSlidingWindowCounter:
+    def __init__(self, client, window_seconds: float, prefix: str):
+        self.client = client
+        self.window_seconds = window_seconds
+        self.prefix = prefix
+
+    def _keys(self, key: str, index: int):
+        return f"window:{self.prefix}:{key}:{index}", f"window:{self.prefix}:{key}:{index - 1}"
+
+    def hit(self, key: str) -> float:
+        index, fraction = divmod(time.time() / self.window_seconds, 1)
+        current_key, previous_key = self._keys(key, int(index))
+        pipe = self.client.pipeline()
+        pipe.incr(current_key)
+        pipe.expire(current_key, int(self.window_seconds * 2) + 1)
+        pipe.get(previous_key)
+        current, _, previous = pipe.execute()
+        return int(current) + int(previous or 0) * (1 - fraction)
+
+    def count(self, key: str) -> float:
+        index, fraction = divmod(time.time() / self.window_seconds, 1)
+        current, previous = self.client.mget(*self._keys(key, int(index)))
+        return int(current or 0) + int(previous or 0) * (1 - fraction)
+
+    def reset(self, key: str):
+        index = int(time.time() / self.window_seconds)
+        self.client.delete(*self._keys(key, index))
+
+
+def sliding_window(name: str, window_seconds: float):
+    """Shared counter when Redis is configured, in-process stand-in otherwise."""
+    client = get_redis()
+    if client is not None:
+        return RedisSlidingWindowCounter(client, window_seconds, prefix=name)
+    return SlidingWindowCounter(window_seconds)
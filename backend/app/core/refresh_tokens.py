@@ -0,0 +1,71 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.security import REFRESH_TOKEN_EXPIRE_DAYS, create_refresh_token, hash_token
+from app.models import RefreshToken, User
+
+
+def issue(session: Session, user: User, family_id: Optional[str] = None) -> Tuple[str, RefreshToken]:
+    """Creates a refresh token (new family on login, same family on rotation). Caller commits."""
+    token, token_hash = create_refresh_token()
+    row = RefreshToken(
+        user_id=user.id,
+        token_hash=token_hash,
+        family_id=family_id or uuid.uuid4().hex,
+        expires_at=datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    )
+    session.add(row)
+    session.flush()
+    return token, row
+
+
+def revoke_family(session: Session, family_id: str):
+    session.query(RefreshToken).filter(
+        RefreshToken.family_id == family_id,
+        RefreshToken.revoked_at.is_(None)
+    ).update({RefreshToken.revoked_at: datetime.utcnow()}, synchronize_session=False)
+
+
+def revoke_all(session: Session, user_id: int):
+    session.query(RefreshToken).filter(
+        RefreshToken.user_id == user_id,
+        RefreshToken.revoked_at.is_(None)
+    ).update({RefreshToken.revoked_at: datetime.utcnow()}, synchronize_session=False)
+
+
+def find(session: Session, token: str) -> Optional[RefreshToken]:
+    return session.query(RefreshToken).filter(RefreshToken.token_hash == hash_token(token)).first()
+
+
+def rotate(session: Session, token: str) -> Tuple[Optional[User], Optional[str]]:
+    """
+    Swaps a refresh token for a new one in the same family and returns (user, new token).
+    Presenting an already-rotated token means it was stolen (or replayed), so the
+    whole family is revoked and (None, None) returned. Commits.
+    """
+    row = find(session, token)
+    if row is None or row.expires_at <= datetime.utcnow():
+        return None, None
+    if row.revoked_at is not None:
+        revoke_family(session, row.family_id)
+        session.commit()
+        return None, None
+
+    user = row.user
+    if user is None or not user.is_active:
+        return None, None
+
+    # Conditional update so two concurrent refreshes with the same token can't both win
+    new_token, new_row = issue(session, user, family_id=row.family_id)
+    claimed = session.query(RefreshToken).filter(
+        RefreshToken.id == row.id,
+        RefreshToken.revoked_at.is_(None)
+    ).update({RefreshToken.revoked_at: datetime.utcnow(), RefreshToken.replaced_by_id: new_row.id}, synchronize_session=False)
+    if not claimed:
+        session.rollback()
+        return None, None
+    session.commit()
+    return user, new_token
@@ -0,0 +1,201 @@
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import and_, exists, insert, literal, select, union, update
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.email_utils import send_plain_emails
+from app.core.rate_limit import token_bucket
+from app.core.visibility import assignment_targets
+from app.models import Assignment, Event, EventRegistration, Reminder, Submission, TeamMember, User
+
+# Reminder emails for assignment deadlines (students who haven't submitted)
+# and events (students registered alone or on a team).
+#
+# Delivery is at-most-once, across restarts and any number of workers:
+#   - scans INSERT ... SELECT straight into `reminders`; the unique key on
+#     (kind, target_id, user_id, lead) makes a second scan a no-op
+#   - a worker claims a batch with one UPDATE ... WHERE status = 'pending',
+#     so two workers can never both get the same row
+#   - a claimed row ends as 'sent' or 'failed' and is never picked up again.
+#     A worker that dies mid-batch leaves its rows in 'sending': those
+#     students may miss a reminder, but nobody gets one twice.
+
+SCAN_SECONDS = 60
+BATCH_SIZE = 50
+MAX_BATCHES_PER_RUN = 20
+EMAILS_PER_MINUTE = int(os.getenv("REMINDER_EMAILS_PER_MINUTE", "60"))
+# Times are stored as naive UTC; emails show them in the campus zone
+CAMPUS_TIMEZONE = ZoneInfo(os.getenv("CAMPUS_TIMEZONE", "Asia/Kolkata"))
+
+# (label, lead time). Each lead covers (now + previous lead, now + lead], so
+# something due in 30 minutes gets the "1h" reminder only.
+DEADLINE_LEADS = (("1h", timedelta(hours=1)), ("24h", timedelta(hours=24)))
+EVENT_LEADS = (("1h", timedelta(hours=1)), ("24h", timedelta(hours=24)))
+
+COLUMNS = ["kind", "target_id", "user_id", "lead", "email", "title", "due_at", "status", "created_at"]
+
+# Shared across workers when Redis is configured
+_outbound = token_bucket("reminder-email", capacity=max(1, EMAILS_PER_MINUTE // 6), refill_per_second=EMAILS_PER_MINUTE / 60)
+
+
+def _windows(now: datetime, leads):
+    previous = timedelta(0)
+    for label, lead in leads:
+        yield label, now + previous, now + lead
+        previous = lead
+
+
+def _queued(kind: str, target_id, user_id, lead: str):
+    return exists().where(
+        Reminder.kind == kind, Reminder.target_id == target_id,
+        Reminder.user_id == user_id, Reminder.lead == lead,
+    )
+
+
+def _enqueue(session: Session, rows) -> int:
+    # IGNORE: a concurrent scan may have inserted the same reminder in between
+    stmt = insert(Reminder).from_select(COLUMNS, rows)\
+        .prefix_with("IGNORE", dialect="mysql")\
+        .prefix_with("OR IGNORE", dialect="sqlite")
+    return session.execute(stmt).rowcount or 0
+
+
+def deadline_reminders(lead: str, start: datetime, end: datetime, now: datetime):
+    """
+    Targeted students without a submission for every assignment due in
+    (start, end]: a range scan on the deadline index, joined to the students of
+    each branch/section ((role, branch, section) index) and anti-joined
+    against submissions ((student_id, assignment_id) index).
+    """
+    return select(
+        literal("deadline"), Assignment.id, User.id, literal(lead), User.email,
+        Assignment.title, Assignment.deadline, literal("pending"), literal(now),
+    ).select_from(Assignment).join(
+        User, and_(User.role == "student", User.is_active == True, assignment_targets(User))
+    ).where(
+        Assignment.deadline > start, Assignment.deadline <= end,
+        ~exists().where(Submission.assignment_id == Assignment.id, Submission.student_id == User.id),
+        ~_queued("deadline", Assignment.id, User.id, lead),
+    )
+
+
+def event_reminders(lead: str, start: datetime, end: datetime, now: datetime):
+    """Everyone registered for an event starting in (start, end], solo or on a team."""
+    upcoming = select(Event.id).where(Event.date > start, Event.date <= end)
+    attendees = union(
+        select(EventRegistration.event_id, EventRegistration.student_id.label("user_id"))
+        .where(EventRegistration.event_id.in_(upcoming)),
+        select(TeamMember.event_id, TeamMember.user_id)
+        .where(TeamMember.event_id.in_(upcoming)),
+    ).subquery()
+    return select(
+        literal("event"), Event.id, User.id, literal(lead), User.email,
+        Event.title, Event.date, literal("pending"), literal(now),
+    ).select_from(attendees).join(
+        Event, Event.id == attendees.c.event_id
+    ).join(
+        User, User.id == attendees.c.user_id
+    ).where(
+        User.is_active == True,
+        ~_queued("event", Event.id, User.id, lead),
+    )
+
+
+def enqueue_due(session: Session, now: datetime = None) -> int:
+    """Queues every reminder that is due and not queued yet. Safe to run from any number of workers."""
+    now = now or datetime.utcnow()
+    queued = 0
+    for lead, start, end in _windows(now, DEADLINE_LEADS):
+        queued += _enqueue(session, deadline_reminders(lead, start, end, now))
+    for lead, start, end in _windows(now, EVENT_LEADS):
+        queued += _enqueue(session, event_reminders(lead, start, end, now))
+    # Reminders the scheduler didn't get to before the deadline/event are pointless now
+    session.execute(
+        update(Reminder).where(Reminder.status == "pending", Reminder.due_at <= now).values(status="expired")
+    )
+    session.commit()
+    return queued
+
+
+def claim_batch(session: Session, limit: int = BATCH_SIZE) -> List[Reminder]:
+    """
+    Moves up to `limit` pending reminders to 'sending' under a fresh token and
+    returns them. The status check in the UPDATE is what makes the claim
+    exclusive: rows another worker claimed first just don't match.
+    """
+    ids = [row_id for (row_id,) in session.query(Reminder.id)
+           .filter(Reminder.status == "pending").order_by(Reminder.id).limit(limit)]
+    if not ids:
+        return []
+    token = uuid.uuid4().hex
+    session.execute(
+        update(Reminder).where(Reminder.id.in_(ids), Reminder.status == "pending")
+        .values(status="sending", claim_token=token)
+    )
+    session.commit()
+    return session.query(Reminder).filter(Reminder.claim_token == token).order_by(Reminder.id).all()
+
+
+def _message(reminder: Reminder):
+    local = reminder.due_at.replace(tzinfo=timezone.utc).astimezone(CAMPUS_TIMEZONE)
+    when = local.strftime("%d %b %Y, %I:%M %p %Z")  # e.g. "20 Oct 2026, 05:30 PM IST"
+    if reminder.kind == "deadline":
+        subject = f"Reminder: \"{reminder.title}\" is due {when}"
+        body = f"Your assignment \"{reminder.title}\" is due on {when} and we haven't received a submission yet.\n\nSTAMP - University Portal"
+    else:
+        subject = f"Reminder: \"{reminder.title}\" starts {when}"
+        body = f"You're registered for \"{reminder.title}\", starting on {when}. See you there!\n\nSTAMP - University Portal"
+    return reminder.email, subject, body
+
+
+def _wait_for_slot():
+    while True:
+        allowed, wait = _outbound.take("smtp")
+        if allowed:
+            return
+        time.sleep(wait)
+
+
+def send_batch(session: Session, batch: List[Reminder]) -> int:
+    results = send_plain_emails([_message(r) for r in batch], before_each=_wait_for_slot)
+    sent = [r.id for r, ok in zip(batch, results) if ok]
+    failed = [r.id for r, ok in zip(batch, results) if not ok]
+    if sent:
+        session.execute(update(Reminder).where(Reminder.id.in_(sent)).values(status="sent", sent_at=datetime.utcnow()))
+    if failed:
+        # Not retried: a failure after the server accepted the message would send it twice
+        session.execute(update(Reminder).where(Reminder.id.in_(failed)).values(status="failed"))
+    session.commit()
+    return len(sent)
+
+
+def run_once() -> dict:
+    session = SessionLocal()
+    try:
+        queued = enqueue_due(session)
+        sent = 0
+        for _ in range(MAX_BATCHES_PER_RUN):
+            batch = claim_batch(session)
+            if not batch:
+                break
+            sent += send_batch(session, batch)
+        return {"queued": queued, "sent": sent}
+    finally:
+        session.close()
+
+
+async def run_periodically():
+    """Background job started from the app lifespan; scans for due reminders and sends them."""
+    while True:
+        try:
+            await asyncio.to_thread(run_once)
+        except Exception as e:
+            print(f"Reminder run failed: {e}")
+        await asyncio.sleep(SCAN_SECONDS)
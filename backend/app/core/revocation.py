@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+import math
+import threading
+from datetime import datetime
+
+from sqlalchemy.exc import IntegrityError
+
+from app.core.database import SessionLocal
+from app.models import RevokedToken
+
+SYNC_SECONDS = 5  # how quickly a logout on one worker reaches the others
+COMPACT_SECONDS = 60 * 60  # drop expired entries (and rows) this often
+# Ids are handed out at insert but rows become visible at commit, so a lower id
+# can show up after a higher one was synced; each sync re-reads this many ids
+# below the high-water mark
+RESCAN_IDS = 1000
+DEFAULT_CAPACITY = 100_000
+FALSE_POSITIVE_RATE = 0.001
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings (double hashing on one blake2b digest)."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, error_rate: float = FALSE_POSITIVE_RATE):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationList:
+    """
+    Denylist of revoked access-token ids (jti), checked on every authenticated request.
+    Almost every token is not revoked, so the bloom filter answers without touching
+    the exact map; only filter hits (revoked or false positive) look the jti up.
+    The revoked_tokens table is the source of truth shared by all workers; each worker
+    pulls new rows every SYNC_SECONDS.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._capacity = capacity
+        self._bloom = BloomFilter(capacity)
+        self._exact = {}  # jti -> expires_at
+        self._last_id = 0
+        self._lock = threading.Lock()
+
+    def _add(self, jti: str, expires_at: datetime):
+        if len(self._exact) >= self._capacity:
+            self._rebuild(self._capacity * 2)
+        self._exact[jti] = expires_at
+        self._bloom.add(jti)
+
+    def _rebuild(self, capacity: int):
+        now = datetime.utcnow()
+        self._exact = {jti: exp for jti, exp in self._exact.items() if exp > now}
+        self._capacity = max(capacity, DEFAULT_CAPACITY)
+        self._bloom = BloomFilter(self._capacity)
+        for jti in self._exact:
+            self._bloom.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        if not self._exact or jti not in self._bloom:
+            return False
+        return jti in self._exact
+
+    def revoke(self, session, jti: str, expires_at: datetime):
+        """Persists the revocation and applies it to this worker immediately."""
+        session.add(RevokedToken(jti=jti, expires_at=expires_at))
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()  # already revoked
+        with self._lock:
+            self._add(jti, expires_at)
+
+    def sync(self, session):
+        """
+        Pulls revocations written by other workers since the last sync, plus a
+        trailing window of RESCAN_IDS ids for rows that committed out of order.
+        """
+        rows = (
+            session.query(RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at)
+            .filter(RevokedToken.id > self._last_id - RESCAN_IDS, RevokedToken.expires_at > datetime.utcnow())
+            .order_by(RevokedToken.id)
+            .all()
+        )
+        with self._lock:
+            for row_id, jti, expires_at in rows:
+                if jti not in self._exact:
+                    self._add(jti, expires_at)
+                self._last_id = max(self._last_id, row_id)
+
+    def compact(self, session):
+        """Forgets tokens that have expired anyway, in memory and in the table."""
+        with self._lock:
+            self._rebuild(self._capacity)
+        session.query(RevokedToken).filter(RevokedToken.expires_at <= datetime.utcnow()).delete(synchronize_session=False)
+        session.commit()
+
+    def __len__(self):
+        return len(self._exact)
+
+
+revocation_list = RevocationList()
+
+
+def _sync_once(compact: bool):
+    with SessionLocal() as session:
+        revocation_list.sync(session)
+        if compact:
+            revocation_list.compact(session)
+
+
+async def sync_periodically():
+    """Background job started from the app lifespan."""
+    elapsed = 0
+    while True:
+        try:
+            await asyncio.to_thread(_sync_once, elapsed >= COMPACT_SECONDS)
+            if elapsed >= COMPACT_SECONDS:
+                elapsed = 0
+        except Exception as e:
+            print(f"Token revocation sync failed: {e}")
+        await asyncio.sleep(SYNC_SECONDS)
+        elapsed += SYNC_SECONDS
@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import select, union
+from sqlalchemy.orm import Session
+
+from app.core.visibility import EVENT_AUDIENCE, ViewerContext, assignment_targets
+from app.models import Assignment, ClubMembership, Event, EventRegistration, TeamMember
+
+# Date-window reads for calendars. Every query is a range scan on an index
+# that ends in the date column: events (club_id, date), assignments
+# (branch, section, deadline) / (faculty_id, deadline).
+
+
+def in_window(column, start: datetime, end: datetime):
+    return column >= start, column < end
+
+
+def my_club_ids(user_id: int):
+    """Subquery of the clubs a user belongs to ((student_id, club_id) index)."""
+    return select(ClubMembership.club_id).where(ClubMembership.student_id == user_id)
+
+
+def my_event_ids(user_id: int):
+    """Subquery of events a user registered for, alone or as a team member."""
+    return union(
+        select(EventRegistration.event_id).where(EventRegistration.student_id == user_id),
+        select(TeamMember.event_id).where(TeamMember.user_id == user_id),
+    )
+
+
+def college_events(session: Session, viewer: ViewerContext, start: datetime, end: datetime) -> List[Event]:
+    events = session.query(Event).filter(
+        Event.club_id == None, *in_window(Event.date, start, end)
+    ).order_by(Event.date).all()
+    return EVENT_AUDIENCE.filter(viewer, events)
+
+
+def club_events(session: Session, user_id: int, start: datetime, end: datetime) -> List[Event]:
+    return session.query(Event).filter(
+        Event.club_id.in_(my_club_ids(user_id)), *in_window(Event.date, start, end)
+    ).order_by(Event.date).all()
+
+
+def registered_events(session: Session, user_id: int, start: datetime, end: datetime) -> List[Event]:
+    return session.query(Event).filter(
+        Event.id.in_(my_event_ids(user_id)), *in_window(Event.date, start, end)
+    ).order_by(Event.date).all()
+
+
+def deadline_filter(viewer: ViewerContext):
+    """Students see deadlines targeted at their branch/section, faculty their own; admins have none."""
+    if viewer.is_student:
+        return assignment_targets(viewer)
+    if viewer.role == "faculty":
+        return Assignment.faculty_id == viewer.user_id
+    return None
+
+
+def deadlines(session: Session, viewer: ViewerContext, start: datetime, end: datetime) -> List[Assignment]:
+    targets = deadline_filter(viewer)
+    if targets is None:
+        return []
+    return session.query(Assignment).filter(
+        targets, *in_window(Assignment.deadline, start, end)
+    ).order_by(Assignment.deadline).all()
@@ -0,0 +1,51 @@
+import os
+from pathlib import Path
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Engine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+class SchemaOutOfDate(RuntimeError):
+    pass
+
+
+def alembic_config() -> Config:
+    cfg = Config(str(ALEMBIC_INI))
+    cfg.set_main_option("script_location", str(ALEMBIC_INI.parent / "migrations"))
+    return cfg
+
+
+def head_revision(cfg: Config) -> str:
+    return ScriptDirectory.from_config(cfg).get_current_head()
+
+
+def check_schema_version(engine: Engine):
+    """
+    Startup check: one read of alembic_version compared with the migration head,
+    instead of introspecting every table. Set AUTO_MIGRATE=1 to upgrade in place
+    (single-instance/dev setups); otherwise run `alembic upgrade head` before deploying.
+    """
+    cfg = alembic_config()
+    head = head_revision(cfg)
+    with engine.connect() as conn:
+        current = MigrationContext.configure(conn).get_current_revision()
+
+    if current == head:
+        return
+
+    if os.getenv("AUTO_MIGRATE") == "1":
+        from alembic import command  # only needed when actually migrating
+        print(f"Database schema at {current}, upgrading to {head}...")
+        with engine.begin() as conn:
+            cfg.attributes["connection"] = conn
+            command.upgrade(cfg, "head")
+        return
+
+    raise SchemaOutOfDate(
+        f"Database schema is at revision {current}, but the code expects {head}. "
+        "Run `alembic upgrade head` from backend/ (existing pre-Alembic databases: "
+        "`alembic stamp 0001_baseline` first)."
+    )
@@ -1,5 +1,8 @@
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, Tuple, Union
+import hashlib
+import secrets
+import uuid
 import bcrypt 
 from jose import jwt
 
@@ -7,6 +10,7 @@ from jose import jwt
 SECRET_KEY = "UNSAFE_CHANGE_THIS_IN_PRODUCTION"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+REFRESH_TOKEN_EXPIRE_DAYS = 14
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     # bcrypt.checkpw requires bytes
@@ -26,9 +30,18 @@ def create_access_token(subject: Union[str, Any], expires_delta: timedelta = Non
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode = {"exp": expire, "sub": str(subject)}
+    # jti lets a single token be revoked (logout) before it expires
+    to_encode = {"exp": expire, "sub": str(subject), "jti": uuid.uuid4().hex}
     if additional_claims:
         to_encode.update(additional_claims)
         
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
+
+def create_refresh_token() -> Tuple[str, str]:
+    """Returns (token for the client, sha256 hash to store)."""
+    token = secrets.token_urlsafe(48)
+    return token, hash_token(token)
+
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
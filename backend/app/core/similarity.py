@@ -0,0 +1,259 @@
+import asyncio
+import hashlib
+import random
+import re
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session, aliased
+
+from app.core.database import SessionLocal
+from app.core.text_extract import UnsupportedFile, extract_text
+from app.core.uploads import UPLOAD_ROOT
+from app.core.workers import process_pool
+from app.models import Assignment, Submission, SubmissionFingerprint, SubmissionLshBucket, SubmissionSimilarity, User
+
+# Near-duplicate detection for submissions. Each file becomes a MinHash
+# signature over its 5-word shingles; the signature is cut into bands and
+# every band is a bucket in submission_lsh_buckets. A new submission is only
+# compared with the submissions sharing at least one bucket, so checking it
+# costs a handful of comparisons however large the class (no O(n^2) pass).
+#
+# With 32 bands of 4 rows, two submissions at 0.5 Jaccard similarity share a
+# bucket with probability ~0.87, at 0.7 practically always, at 0.2 ~0.05.
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 5
+REPORT_THRESHOLD = 0.5
+
+BATCH_SIZE = 20
+SWEEP_SECONDS = 30
+STALE_CLAIM = timedelta(minutes=10)  # a worker died mid-file; the row goes back to pending
+
+_PRIME = (1 << 61) - 1
+# Fixed seed: signatures must stay comparable across processes and restarts
+_rng = random.Random(20240601)
+PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+# --- Signatures (pure functions; run on the process pool) -----------------------
+
+def shingles(text: str) -> set:
+    tokens = re.findall(r"\w+", text.lower())
+    if not tokens:
+        return set()
+    windows = [tokens[i:i + SHINGLE_SIZE] for i in range(max(1, len(tokens) - SHINGLE_SIZE + 1))]
+    return {
+        int.from_bytes(hashlib.blake2b(" ".join(window).encode(), digest_size=8).digest(), "big") & _PRIME
+        for window in windows
+    }
+
+
+def minhash(hashes: set) -> List[int]:
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in PERMUTATIONS]
+
+
+def band_keys(signature: List[int]) -> List[str]:
+    keys = []
+    for band in range(BANDS):
+        values = ",".join(map(str, signature[band * ROWS:(band + 1) * ROWS]))
+        keys.append(f"{band}:{hashlib.blake2b(values.encode(), digest_size=8).hexdigest()}")
+    return keys
+
+
+def estimate(a: List[int], b: List[int]) -> float:
+    """Share of equal MinHash values = estimated Jaccard similarity of the shingle sets."""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
+
+
+def fingerprint_file(path: str) -> Tuple[Optional[List[int]], int]:
+    """(signature, shingle count) of a file; no signature when it has no text."""
+    hashes = shingles(extract_text(path))
+    return (minhash(hashes) if hashes else None), len(hashes)
+
+
+# --- Pipeline ----------------------------------------------------------------------
+
+def submission_path(file_url: str) -> Path:
+    """/static/assignments/... -> uploads/assignments/..., refusing anything outside uploads/."""
+    relative = file_url.split("/static/", 1)[-1].lstrip("/")
+    path = (UPLOAD_ROOT / relative).resolve()
+    if UPLOAD_ROOT.resolve() not in path.parents:
+        raise UnsupportedFile("File is outside the uploads directory")
+    return path
+
+
+def enqueue(session: Session, submission: Submission):
+    """Queues a new submission for fingerprinting; commits with the submission itself."""
+    session.add(SubmissionFingerprint(
+        submission_id=submission.id, assignment_id=submission.assignment_id,
+        student_id=submission.student_id, status="pending",
+    ))
+
+
+def claim_batch(session: Session, limit: int = BATCH_SIZE) -> List[SubmissionFingerprint]:
+    """Same claim as reminders: UPDATE guarded on status, so each row goes to one worker."""
+    now = datetime.utcnow()
+    session.execute(
+        update(SubmissionFingerprint)
+        .where(SubmissionFingerprint.status == "processing", SubmissionFingerprint.claimed_at < now - STALE_CLAIM)
+        .values(status="pending")
+    )
+    ids = [row_id for (row_id,) in session.query(SubmissionFingerprint.id)
+           .filter(SubmissionFingerprint.status == "pending").order_by(SubmissionFingerprint.id).limit(limit)]
+    if not ids:
+        session.commit()
+        return []
+    token = uuid.uuid4().hex
+    session.execute(
+        update(SubmissionFingerprint)
+        .where(SubmissionFingerprint.id.in_(ids), SubmissionFingerprint.status == "pending")
+        .values(status="processing", claim_token=token, claimed_at=now)
+    )
+    session.commit()
+    return session.query(SubmissionFingerprint).filter(SubmissionFingerprint.claim_token == token)\
+        .order_by(SubmissionFingerprint.id).all()
+
+
+def _finish(session: Session, fingerprint: SubmissionFingerprint, status: str, error: str = None):
+    fingerprint.status = status
+    fingerprint.error = error[:255] if error else None
+    fingerprint.processed_at = datetime.utcnow()
+    session.commit()
+
+
+def process(session: Session, fingerprint: SubmissionFingerprint) -> int:
+    """Fingerprints one claimed submission and records its similar pairs. Returns the number of pairs."""
+    file_url = session.query(Submission.file_url).filter(Submission.id == fingerprint.submission_id).scalar()
+    if file_url is None:
+        _finish(session, fingerprint, "failed", "Submission not found")
+        return 0
+    try:
+        signature, count = process_pool().submit(fingerprint_file, str(submission_path(file_url))).result()
+    except (UnsupportedFile, OSError) as e:
+        _finish(session, fingerprint, "failed", str(e))
+        return 0
+    fingerprint.shingles = count
+    if signature is None:
+        _finish(session, fingerprint, "empty")
+        return 0
+
+    # Index first and commit, then look for neighbours: of two submissions
+    # processed at the same time, at least one then sees the other
+    keys = band_keys(signature)
+    fingerprint.signature = signature
+    session.query(SubmissionLshBucket).filter(SubmissionLshBucket.submission_id == fingerprint.submission_id).delete()
+    session.execute(insert(SubmissionLshBucket), [
+        {"assignment_id": fingerprint.assignment_id, "bucket": key, "submission_id": fingerprint.submission_id}
+        for key in keys
+    ])
+    session.commit()
+
+    candidates = select(SubmissionLshBucket.submission_id).where(
+        SubmissionLshBucket.assignment_id == fingerprint.assignment_id,
+        SubmissionLshBucket.bucket.in_(keys),
+        SubmissionLshBucket.submission_id != fingerprint.submission_id,
+    ).distinct()
+    others = session.query(SubmissionFingerprint.submission_id, SubmissionFingerprint.signature).filter(
+        SubmissionFingerprint.submission_id.in_(candidates),
+        SubmissionFingerprint.signature != None,
+        # A student's own resubmissions are supposed to look alike
+        SubmissionFingerprint.student_id != fingerprint.student_id,
+    ).all()
+
+    pairs = []
+    for other_id, other_signature in others:
+        score = estimate(signature, other_signature)
+        if score >= REPORT_THRESHOLD:
+            low, high = sorted((fingerprint.submission_id, other_id))
+            pairs.append({"assignment_id": fingerprint.assignment_id, "submission_id": low,
+                          "other_submission_id": high, "score": score})
+    if pairs:
+        # IGNORE: the other side of a concurrent pair may have recorded it already
+        session.execute(
+            insert(SubmissionSimilarity).prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite"),
+            pairs,
+        )
+    _finish(session, fingerprint, "done")
+    return len(pairs)
+
+
+def process_pending() -> int:
+    """Works through the queue; called right after a submission and by the periodic sweep."""
+    session = SessionLocal()
+    processed = 0
+    try:
+        while True:
+            batch = claim_batch(session)
+            if not batch:
+                return processed
+            for fingerprint in batch:
+                try:
+                    process(session, fingerprint)
+                except Exception as e:
+                    session.rollback()
+                    _finish(session, fingerprint, "failed", str(e))
+                processed += 1
+    finally:
+        session.close()
+
+
+async def process_periodically():
+    """Background job started from the app lifespan; picks up anything the per-submission run missed."""
+    while True:
+        try:
+            await asyncio.to_thread(process_pending)
+        except Exception as e:
+            print(f"Similarity processing failed: {e}")
+        await asyncio.sleep(SWEEP_SECONDS)
+
+
+# --- Report ------------------------------------------------------------------------
+
+def report(session: Session, assignment: Assignment, min_score: float = REPORT_THRESHOLD, limit: int = 200) -> dict:
+    """Most similar pairs first, with who submitted what, plus how much of the class is fingerprinted."""
+    statuses = dict(
+        session.query(SubmissionFingerprint.status, func.count(SubmissionFingerprint.id))
+        .filter(SubmissionFingerprint.assignment_id == assignment.id)
+        .group_by(SubmissionFingerprint.status).all()
+    )
+
+    first, second = aliased(Submission), aliased(Submission)
+    first_user, second_user = aliased(User), aliased(User)
+    rows = session.query(SubmissionSimilarity.score, first, first_user.name, second, second_user.name)\
+        .join(first, first.id == SubmissionSimilarity.submission_id)\
+        .join(second, second.id == SubmissionSimilarity.other_submission_id)\
+        .outerjoin(first_user, first_user.id == first.student_id)\
+        .outerjoin(second_user, second_user.id == second.student_id)\
+        .filter(SubmissionSimilarity.assignment_id == assignment.id, SubmissionSimilarity.score >= min_score)\
+        .order_by(SubmissionSimilarity.score.desc(), SubmissionSimilarity.id.asc())\
+        .limit(limit).all()
+
+    def side(submission: Submission, name: Optional[str]) -> dict:
+        return {
+            "submission_id": submission.id, "student_id": submission.student_id, "student_name": name,
+            "registration_number": submission.registration_number, "file_url": submission.file_url,
+            "submitted_at": submission.submitted_at,
+        }
+
+    # Resubmissions pair up too; show each pair of students once, at their highest score
+    pairs, seen = [], set()
+    for score, a, a_name, b, b_name in rows:
+        students = frozenset((a.student_id, b.student_id))
+        if students in seen:
+            continue
+        seen.add(students)
+        pairs.append({"score": round(score, 3), "submissions": [side(a, a_name), side(b, b_name)]})
+
+    return {
+        "assignment_id": assignment.id,
+        "processed": statuses.get("done", 0),
+        "pending": statuses.get("pending", 0) + statuses.get("processing", 0),
+        "unreadable": statuses.get("failed", 0) + statuses.get("empty", 0),
+        "pairs": pairs,
+    }
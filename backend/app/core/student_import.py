@@ -0,0 +1,158 @@
+import csv
+import io
+import re
+import secrets
+from datetime import datetime
+from typing import IO, Iterator, List
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.security import get_password_hash
+from app.core.workers import process_pool
+from app.models import User
+
+BATCH_SIZE = 1000
+REQUIRED_COLUMNS = {"name", "email", "registration_number"}
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+MAX_REPORTED_ERRORS = 1000  # keep the response bounded for badly broken files
+
+
+class ImportReport:
+    def __init__(self):
+        self.rows = 0
+        self.created = 0
+        self.errors = []
+        self.error_count = 0
+
+    def error(self, line: int, row: dict, message: str):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": line, "email": row.get("email") or None, "error": message})
+
+    def as_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "created": self.created,
+            "failed": self.error_count,
+            "errors": sorted(self.errors, key=lambda error: error["row"]),
+        }
+
+
+def _clean(row: dict) -> dict:
+    return {(key or "").strip().lower(): (value or "").strip() for key, value in row.items()}
+
+
+def _validate(row: dict) -> str:
+    """Returns an error message, or "" if the row can be imported."""
+    for column in REQUIRED_COLUMNS:
+        if not row.get(column):
+            return f"Missing {column}"
+    if not EMAIL_PATTERN.match(row["email"]):
+        return "Invalid email"
+    if row.get("year"):
+        if not row["year"].isdigit() or not 1 <= int(row["year"]) <= 4:
+            return "Year must be 1-4"
+    return ""
+
+
+def _batches(reader, start_line: int) -> Iterator[List[tuple]]:
+    batch = []
+    for line, row in enumerate(reader, start=start_line):
+        batch.append((line, _clean(row)))
+        if len(batch) >= BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _existing(session: Session, column, values: set) -> set:
+    if not values:
+        return set()
+    return {value for (value,) in session.query(column).filter(column.in_(values))}
+
+
+def import_students(session: Session, file: IO[bytes]) -> dict:
+    """
+    Streams a CSV of students (name, email, registration_number, branch, section,
+    year, password) into the users table, BATCH_SIZE rows at a time:
+    duplicates are checked with one IN query per column, passwords are hashed
+    on a process pool and rows are inserted with a single executemany.
+    Rows without a password get a random one (students use "Forgot password").
+    """
+    report = ImportReport()
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    header = {(name or "").strip().lower() for name in (reader.fieldnames or [])}
+    missing = REQUIRED_COLUMNS - header
+    if missing:
+        raise ValueError(f"CSV is missing columns: {', '.join(sorted(missing))}")
+
+    seen_emails, seen_reg_numbers = set(), set()
+    for batch in _batches(reader, start_line=2):  # line 1 is the header
+        report.rows += len(batch)
+
+        valid = []
+        for line, row in batch:
+            row["email"] = row.get("email", "").lower()
+            message = _validate(row)
+            if not message and row["email"] in seen_emails:
+                message = "Duplicate email in file"
+            if not message and row["registration_number"] in seen_reg_numbers:
+                message = "Duplicate registration number in file"
+            if message:
+                report.error(line, row, message)
+                continue
+            seen_emails.add(row["email"])
+            seen_reg_numbers.add(row["registration_number"])
+            valid.append((line, row))
+
+        # Two IN queries per batch instead of two lookups per row
+        taken_emails = _existing(session, User.email, {row["email"] for _, row in valid})
+        taken_reg_numbers = _existing(session, User.registration_number, {row["registration_number"] for _, row in valid})
+        pending = []
+        for line, row in valid:
+            if row["email"] in taken_emails:
+                report.error(line, row, "Email already registered")
+            elif row["registration_number"] in taken_reg_numbers:
+                report.error(line, row, "Registration Number already registered")
+            else:
+                pending.append((line, row))
+        if not pending:
+            continue
+
+        passwords = [row.get("password") or secrets.token_urlsafe(12) for _, row in pending]
+        hashes = list(process_pool().map(get_password_hash, passwords, chunksize=32))
+
+        now = datetime.utcnow()
+        values = [{
+            "name": row["name"],
+            "email": row["email"],
+            "password_hash": password_hash,
+            "role": "student",
+            "is_active": True,
+            "registration_number": row["registration_number"],
+            "branch": row.get("branch") or None,
+            "section": row.get("section") or None,
+            "year": int(row["year"]) if row.get("year") else 1,
+            "created_at": now,
+        } for (_, row), password_hash in zip(pending, hashes)]
+
+        try:
+            session.execute(insert(User), values)  # executemany
+            session.commit()
+            report.created += len(values)
+        except IntegrityError:
+            # Someone registered one of these meanwhile; fall back to row by row for this batch
+            session.rollback()
+            for (line, row), value in zip(pending, values):
+                try:
+                    session.execute(insert(User), [value])
+                    session.commit()
+                    report.created += 1
+                except IntegrityError:
+                    session.rollback()
+                    report.error(line, row, "Email or Registration Number already registered")
+
+    return report.as_dict()
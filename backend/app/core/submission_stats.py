@@ -0,0 +1,154 @@
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import Assignment, Submission, SubmissionCount, User
+
+# Who has / hasn't submitted an assignment. A student counts once however
+# often they resubmit, and is late when their first submission came after
+# the deadline. Per-section counts live in assignment_section_counts and are
+# bumped on every first submission, so the summary never scans submissions.
+
+# Roster status -> list it is reported in
+LISTS = {"submitted": "on_time", "late": "late_students", "missing": "missing_students"}
+
+
+def targeted_students(assignment: Assignment):
+    """Active students an assignment is meant for (an empty branch/section targets everyone),
+    served by the (role, branch, section) index."""
+    filters = [User.role == "student", User.is_active == True]
+    if assignment.branch:
+        filters.append(User.branch == assignment.branch)
+    if assignment.section:
+        filters.append(User.section == assignment.section)
+    return filters
+
+
+def _is_late(assignment: Assignment, submitted_at: datetime) -> bool:
+    return bool(assignment.deadline and submitted_at and submitted_at > assignment.deadline)
+
+
+def _bump(assignment_id: int, section: str, late: int):
+    return update(SubmissionCount).where(
+        SubmissionCount.assignment_id == assignment_id, SubmissionCount.section == section
+    ).values(submitted=SubmissionCount.submitted + 1, late=SubmissionCount.late + late)
+
+
+def record_submission(session: Session, assignment: Assignment, student: User, submitted_at: datetime):
+    """
+    Counts a submission; call before adding it. Resubmissions don't count again.
+    Runs inside the caller's transaction, so it commits together with the submission.
+    """
+    already = session.query(Submission.id).filter(
+        Submission.assignment_id == assignment.id, Submission.student_id == student.id
+    ).first()
+    if already:
+        return
+    section = student.section or ""
+    late = int(_is_late(assignment, submitted_at))
+
+    # Atomic increment; the first submission of a section creates its row
+    if session.execute(_bump(assignment.id, section, late)).rowcount:
+        return
+    created = session.execute(
+        insert(SubmissionCount).values(assignment_id=assignment.id, section=section, submitted=1, late=late)
+        .prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+    ).rowcount
+    if not created:
+        # Another submission created the row in between
+        session.execute(_bump(assignment.id, section, late))
+
+
+def rebuild(session: Session, assignment_id: int) -> int:
+    """Recomputes one assignment's counts from its submissions. The caller commits."""
+    assignment = session.query(Assignment).filter(Assignment.id == assignment_id).first()
+    first = select(Submission.student_id, func.min(Submission.submitted_at).label("first_at"))\
+        .where(Submission.assignment_id == assignment_id)\
+        .group_by(Submission.student_id).subquery()
+    counts: Dict[str, list] = {}
+    for section, first_at in session.query(User.section, first.c.first_at).join(first, first.c.student_id == User.id):
+        entry = counts.setdefault(section or "", [0, 0])
+        entry[0] += 1
+        entry[1] += int(_is_late(assignment, first_at))
+
+    session.query(SubmissionCount).filter(SubmissionCount.assignment_id == assignment_id).delete()
+    if counts:
+        session.execute(insert(SubmissionCount), [
+            {"assignment_id": assignment_id, "section": section, "submitted": submitted, "late": late}
+            for section, (submitted, late) in counts.items()
+        ])
+    return len(counts)
+
+
+def _totals(sections: list) -> dict:
+    return {key: sum(s[key] for s in sections) for key in ("students", "submitted", "late", "missing")}
+
+
+def summary(session: Session, assignment: Assignment) -> dict:
+    """Per-section counts: roster sizes from one grouped index scan on users plus the stored counts."""
+    section_key = func.coalesce(User.section, "")
+    sizes = dict(
+        session.query(section_key, func.count(User.id))
+        .filter(*targeted_students(assignment)).group_by(section_key).all()
+    )
+    stored = {
+        row.section: row for row in
+        session.query(SubmissionCount).filter(SubmissionCount.assignment_id == assignment.id)
+    }
+    sections = []
+    for section in sorted(set(sizes) | set(stored)):
+        students = sizes.get(section, 0)
+        row = stored.get(section)
+        submitted, late = (row.submitted, row.late) if row else (0, 0)
+        sections.append({
+            "section": section, "students": students, "submitted": submitted, "late": late,
+            # Submissions from students who since left the roster don't make anyone else "done"
+            "missing": max(students - submitted, 0),
+        })
+    return {"assignment_id": assignment.id, "deadline": assignment.deadline, **_totals(sections), "sections": sections}
+
+
+def roster(session: Session, assignment: Assignment) -> dict:
+    """
+    Every targeted student, split into submitted / late / missing. One query:
+    the roster LEFT JOINed to this assignment's submissions grouped by
+    student; no match is the anti-join that yields "missing".
+    """
+    mine = select(
+        Submission.student_id,
+        func.min(Submission.submitted_at).label("first_at"),
+        func.max(Submission.submitted_at).label("last_at"),
+        func.count(Submission.id).label("attempts"),
+    ).where(Submission.assignment_id == assignment.id).group_by(Submission.student_id).subquery()
+
+    rows = session.query(
+        User.id, User.name, User.registration_number, User.section,
+        mine.c.first_at, mine.c.last_at, mine.c.attempts,
+    ).outerjoin(mine, mine.c.student_id == User.id)\
+     .filter(*targeted_students(assignment))\
+     .order_by(User.registration_number.asc(), User.id.asc())\
+     .all()
+
+    result = {"on_time": [], "late_students": [], "missing_students": []}
+    sections: Dict[str, dict] = {}
+    for user_id, name, registration_number, section, first_at, last_at, attempts in rows:
+        status = "missing" if first_at is None else "late" if _is_late(assignment, first_at) else "submitted"
+        result[LISTS[status]].append({
+            "user_id": user_id, "name": name, "registration_number": registration_number,
+            "section": section, "submitted_at": last_at, "attempts": attempts or 0,
+        })
+        counts = sections.setdefault(section or "", {"section": section or "", "students": 0, "submitted": 0, "late": 0, "missing": 0})
+        counts["students"] += 1
+        if status == "missing":
+            counts["missing"] += 1
+        else:
+            counts["submitted"] += 1  # late students did submit, like in the stored counts
+            counts["late"] += status == "late"
+
+    section_list = [sections[key] for key in sorted(sections)]
+    return {
+        "assignment_id": assignment.id, "deadline": assignment.deadline,
+        **_totals(section_list), "sections": section_list, **result,
+    }
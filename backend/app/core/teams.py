@@ -0,0 +1,128 @@
+import json
+import re
+from typing import List, Optional
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.models import Event, EventRegistration, TeamMember, User
+
+
+class TeamError(ValueError):
+    """A team registration that can't be accepted; the message is shown to the student."""
+
+
+# Older club-page registrations (and old clients) send free text, one member per line:
+# "1. John Doe (242FA04001, CSE, Sec-A)". A registration number is the first
+# 6+ character alphanumeric token with a digit, preferring the one in parentheses.
+_LIST_PREFIX = re.compile(r"^\s*(?:\d+[.)]|[-*•])\s*")
+_REG_NO = re.compile(r"\b(?=[A-Za-z0-9]*\d)[A-Za-z0-9]{6,}\b")
+
+
+def legacy_registration_numbers(text: str) -> List[str]:
+    numbers = []
+    for line in text.splitlines():
+        line = _LIST_PREFIX.sub("", line).strip()
+        if not line:
+            continue
+        inside = re.search(r"\(([^)]*)\)", line)
+        match = (inside and _REG_NO.search(inside.group(1))) or _REG_NO.search(line)
+        if not match:
+            raise TeamError(f"No registration number found for team member: {line}")
+        numbers.append(match.group())
+    return numbers
+
+
+def member_registration_numbers(member_details: Optional[str]) -> List[str]:
+    """
+    Registration numbers of the extra members in the form's member_details:
+    a JSON list of {name, reg_no, branch, section} objects (or plain strings),
+    or the legacy free-text list.
+    """
+    if not member_details or not member_details.strip():
+        return []
+    if not member_details.lstrip().startswith("["):
+        return legacy_registration_numbers(member_details)
+    try:
+        members = json.loads(member_details)
+    except (TypeError, ValueError):
+        raise TeamError("Team member details are not valid JSON")
+    if not isinstance(members, list):
+        raise TeamError("Team member details must be a list")
+
+    numbers = []
+    for member in members:
+        if isinstance(member, dict):
+            member = member.get("reg_no") or member.get("registration_number")
+        number = str(member or "").strip()
+        if not number:
+            raise TeamError("Every team member needs a registration number")
+        numbers.append(number)
+    return numbers
+
+
+def build_team(session: Session, event: Event, lead: User, member_details: Optional[str]) -> List[TeamMember]:
+    """
+    Validates a team (lead + members) for an event and returns its unsaved
+    TeamMember rows. Two queries whatever the team size: one resolving every
+    registration number against users, one for members already on a team.
+    The unique (event_id, registration_number) key catches concurrent signups.
+    """
+    if not lead.registration_number:
+        raise TeamError("Add your registration number to your profile before registering a team")
+    numbers = [lead.registration_number] + member_registration_numbers(member_details)
+
+    duplicates = sorted({number for number in numbers if numbers.count(number) > 1})
+    if duplicates:
+        raise TeamError(f"Listed more than once: {', '.join(duplicates)}")
+
+    min_size, max_size = event.min_team_size or 1, event.max_team_size or 1
+    if not min_size <= len(numbers) <= max_size:
+        raise TeamError(f"Team size must be between {min_size} and {max_size} (including you); got {len(numbers)}")
+
+    users = {user.registration_number: user for user in session.query(User).filter(
+        User.registration_number.in_(numbers),
+        User.role == "student"
+    )}
+    unknown = [number for number in numbers if number not in users]
+    if unknown:
+        raise TeamError(f"No student with registration number: {', '.join(unknown)}")
+
+    taken = [number for (number,) in session.query(TeamMember.registration_number).filter(
+        TeamMember.event_id == event.id,
+        TeamMember.registration_number.in_(numbers)
+    )]
+    if taken:
+        raise TeamError(f"Already on a team for this event: {', '.join(sorted(taken))}")
+
+    return [
+        TeamMember(
+            event_id=event.id,
+            user_id=users[number].id,
+            registration_number=number,
+            name=users[number].name,
+            is_lead=number == lead.registration_number,
+        )
+        for number in numbers
+    ]
+
+
+def my_teams(session: Session, user_id: int) -> List[dict]:
+    """Every team the user is on, newest event first: the (user_id, event_id) index plus one IN query for members."""
+    rows = session.query(TeamMember, EventRegistration, Event)\
+        .join(EventRegistration, TeamMember.registration_id == EventRegistration.id)\
+        .join(Event, TeamMember.event_id == Event.id)\
+        .options(selectinload(EventRegistration.members))\
+        .filter(TeamMember.user_id == user_id)\
+        .order_by(Event.date.desc())\
+        .all()
+    return [{
+        "registration_id": registration.id,
+        "event_id": event.id,
+        "event_title": event.title,
+        "event_date": event.date,
+        "club_id": event.club_id,
+        "team_name": registration.team_name,
+        "team_size": len(registration.members),
+        "is_lead": membership.is_lead,
+        "members": registration.members,
+    } for membership, registration, event in rows]
@@ -0,0 +1,127 @@
+"""
+Plain text out of submitted files, for similarity checks.
+
+Code and text files are read as UTF-8, DOCX from its document.xml. PDFs go
+through pypdf when it is installed; otherwise a small stdlib reader pulls the
+literal strings out of (Flate-compressed) content streams, which covers PDFs
+exported with standard fonts but not ones that embed CID fonts.
+"""
+import re
+import zipfile
+import zlib
+from pathlib import Path
+from xml.etree import ElementTree
+
+try:
+    import pypdf  # Optional: better PDF text extraction
+except ImportError:
+    pypdf = None
+
+CODE_EXTENSIONS = {
+    ".txt", ".md", ".csv", ".py", ".ipynb", ".c", ".h", ".cpp", ".hpp", ".cc", ".java", ".js", ".jsx",
+    ".ts", ".tsx", ".html", ".css", ".sql", ".go", ".rs", ".kt", ".cs", ".php", ".rb", ".sh", ".m", ".r",
+}
+MAX_BYTES = 20 * 1024 * 1024  # don't read huge uploads (videos renamed .txt and the like)
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+class UnsupportedFile(ValueError):
+    pass
+
+
+def extract_text(path) -> str:
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if path.stat().st_size > MAX_BYTES:
+        raise UnsupportedFile("File too large")
+    if suffix in CODE_EXTENSIONS:
+        return path.read_bytes().decode("utf-8", errors="ignore")
+    if suffix == ".docx":
+        return _docx_text(path)
+    if suffix == ".pdf":
+        return _pdf_text(path)
+    raise UnsupportedFile(f"Unsupported file type: {suffix or 'none'}")
+
+
+def _docx_text(path: Path) -> str:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            root = ElementTree.fromstring(archive.read("word/document.xml"))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        raise UnsupportedFile(f"Unreadable DOCX: {e}")
+    paragraphs = []
+    for paragraph in root.iter(f"{_WORD_NS}p"):
+        paragraphs.append("".join(node.text or "" for node in paragraph.iter(f"{_WORD_NS}t")))
+    return "\n".join(paragraphs)
+
+
+# --- PDF -------------------------------------------------------------------------
+
+_STREAM = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.S)
+_TEXT_BLOCK = re.compile(rb"\bBT\b(.*?)\bET\b", re.S)
+# (literal) and <hex> strings, plus the brackets of TJ arrays
+_TOKEN = re.compile(rb"\((?:\\.|[^\\)])*\)|<[0-9A-Fa-f\s]*>|\[|\]")
+_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+
+
+def _literal(raw: bytes) -> bytes:
+    out, i = bytearray(), 0
+    while i < len(raw):
+        char = raw[i:i + 1]
+        if char != b"\\":
+            out += char
+            i += 1
+            continue
+        following = raw[i + 1:i + 2]
+        octal = re.match(rb"[0-7]{1,3}", raw[i + 1:i + 4])
+        if octal:
+            out.append(int(octal.group(), 8) & 0xFF)
+            i += 1 + len(octal.group())
+        else:
+            out += _ESCAPES.get(following, following)
+            i += 2
+    return bytes(out)
+
+
+def _string(token: bytes) -> bytes:
+    if token.startswith(b"("):
+        return _literal(token[1:-1])
+    digits = re.sub(rb"\s", b"", token[1:-1])
+    return bytes.fromhex((digits + b"0" * (len(digits) % 2)).decode())
+
+
+def _pdf_strings(content: bytes):
+    for block in _TEXT_BLOCK.findall(content):
+        # Pieces of one TJ array are one run of text (split only for kerning)
+        runs, array = [], None
+        for token in _TOKEN.findall(block):
+            if token == b"[":
+                array = []
+            elif token == b"]":
+                runs.append(b"".join(array or []))
+                array = None
+            elif array is not None:
+                array.append(_string(token))
+            else:
+                runs.append(_string(token))
+        yield b" ".join(runs).decode("cp1252", errors="ignore")
+
+
+def _pdf_text(path: Path) -> str:
+    if pypdf is not None:
+        try:
+            return "\n".join(page.extract_text() or "" for page in pypdf.PdfReader(str(path)).pages)
+        except Exception as e:
+            raise UnsupportedFile(f"Unreadable PDF: {e}")
+    data = path.read_bytes()
+    if not data.startswith(b"%PDF"):
+        raise UnsupportedFile("Not a PDF")
+    texts = []
+    for stream in _STREAM.findall(data):
+        try:
+            stream = zlib.decompress(stream)
+        except zlib.error:
+            pass  # uncompressed (or a filter we can't read: no BT/ET blocks then)
+        texts.extend(_pdf_strings(stream))
+    return "\n".join(texts)
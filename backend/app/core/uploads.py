@@ -0,0 +1,15 @@
+from functools import lru_cache
+from pathlib import Path
+
+UPLOAD_ROOT = Path("uploads")
+
+
+@lru_cache(maxsize=None)
+def upload_dir(*parts: str) -> Path:
+    """
+    Returns uploads/<parts...>, creating it on first use.
+    Directories are created when something is first written, not at import time.
+    """
+    path = UPLOAD_ROOT.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional
+
+from sqlalchemy import or_, and_, true
+from app.models import Assignment, Note, User
+
+
+@dataclass(frozen=True)
+class ViewerContext:
+    """
+    Who is looking, computed once per request (see deps.get_viewer).
+    Only carries what visibility rules need, so it is cheap to hash and cache on.
+    """
+    user_id: int
+    role: str
+    branch: Optional[str] = None
+    section: Optional[str] = None
+    year: Optional[int] = None
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role == "admin"
+
+    @property
+    def is_student(self) -> bool:
+        return self.role == "student"
+
+    @property
+    def year_key(self) -> Optional[str]:
+        # Year targets are stored as strings in the JSON lists, e.g. ["1", "3"]
+        return str(self.year) if self.year else None
+
+
+def viewer_from_user(user: User) -> ViewerContext:
+    return ViewerContext(
+        user_id=user.id,
+        role=user.role,
+        branch=user.branch,
+        section=user.section,
+        year=user.year,
+    )
+
+
+def assignment_targets(user):
+    """Assignments with no branch/section target are for everyone."""
+    return and_(
+        or_(Assignment.branch == None, Assignment.branch == "", Assignment.branch == user.branch),
+        or_(Assignment.section == None, Assignment.section == "", Assignment.section == user.section),
+    )
+
+
+def note_targets(viewer: ViewerContext):
+    """Students only see notes for their year (or shared ones); pushed down to SQL."""
+    if not viewer.is_student:
+        return true()
+    return or_(Note.year == None, Note.year == viewer.year)
+
+
+def _everyone(item) -> bool:
+    return True
+
+
+@dataclass(frozen=True)
+class Audience:
+    """
+    Targeting rule for content that stores its audience as JSON lists
+    (empty / NULL list = everyone). Admins see everything, faculty are
+    matched on department only (they have no year), students on both.
+    """
+    departments: str  # attribute holding target departments (branches)
+    years: str  # attribute holding target years
+
+    def matcher(self, viewer: ViewerContext) -> Callable[[object], bool]:
+        """Predicate for one viewer; compiled once per audience segment and reused."""
+        return _compile(self, viewer.role, viewer.branch, viewer.year_key)
+
+    def filter(self, viewer: ViewerContext, items):
+        visible = self.matcher(viewer)
+        if visible is _everyone:
+            return list(items)
+        return [item for item in items if visible(item)]
+
+
+@lru_cache(maxsize=1024)
+def _compile(audience: Audience, role: str, branch: Optional[str], year_key: Optional[str]):
+    if role == "admin":
+        return _everyone
+
+    departments, years = audience.departments, audience.years
+    check_year = role == "student"
+
+    def visible(item) -> bool:
+        targets = getattr(item, departments)
+        if targets and branch not in targets:
+            return False
+        if check_year:
+            targets = getattr(item, years)
+            if targets and year_key not in targets:
+                return False
+        return True
+
+    return visible
+
+
+EVENT_AUDIENCE = Audience(departments="target_departments", years="eligibility")
+ANNOUNCEMENT_AUDIENCE = Audience(departments="target_departments", years="target_years")
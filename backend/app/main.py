@@ -1,17 +1,29 @@
+import asyncio
 from fastapi import FastAPI
-from dotenv import load_dotenv
-import os
-
-load_dotenv() # Load environment variables from .env file
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from app.core.database import engine, Base
+from app.core.database import engine
+from app.core.schema import check_schema_version
+from app.core import dashboard_stats, reminders, revocation, similarity
 from app.api import auth, assignments, announcements, events, users, resources, clubs, college_events, college_announcements
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    Base.metadata.create_all(bind=engine)
+    # Schema changes are applied with Alembic (backend/migrations); just verify the version
+    check_schema_version(engine)
+    # Keep admin dashboard aggregates warm in the background
+    stats_job = asyncio.create_task(dashboard_stats.refresh_periodically())
+    # Pull token revocations (logouts) made by other workers
+    revocation_job = asyncio.create_task(revocation.sync_periodically())
+    # Deadline / event reminder emails (safe to run on every worker)
+    reminder_job = asyncio.create_task(reminders.run_periodically())
+    # Submission fingerprints the per-upload run didn't get to (restarts, crashes)
+    similarity_job = asyncio.create_task(similarity.process_periodically())
     yield
+    stats_job.cancel()
+    revocation_job.cancel()
+    reminder_job.cancel()
+    similarity_job.cancel()
 
 app = FastAPI(
     title="Student Portal API",
@@ -47,12 +59,23 @@ app.include_router(achievements.router)
 from app.api import uploads
 app.include_router(uploads.router)
 
+from app.api import stream
+app.include_router(stream.router)
+
+from app.api import bundles
+app.include_router(bundles.router)
+
+from app.api import certificates
+app.include_router(certificates.router)
+
+from app.api import calendar
+app.include_router(calendar.router)
+
 # Mount uploads directory to serve files (e.g. http://localhost:8000/static/filename.pdf)
 # We mount 'uploads' root to '/static', so /static/general/foo.jpg works if stored in uploads/general/foo.jpg
 from fastapi.staticfiles import StaticFiles
-import os
-os.makedirs("uploads", exist_ok=True)
-app.mount("/static", StaticFiles(directory="uploads"), name="static")
+from app.core.uploads import upload_dir
+app.mount("/static", StaticFiles(directory=upload_dir()), name="static")
 
 @app.get("/")
 def read_root():
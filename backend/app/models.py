@@ -1,7 +1,8 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, Float, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.core.json_type import JSONColumn
 
 # -----------------------------------------------------------------------------
 # User Model
@@ -22,12 +23,18 @@ class User(Base):
     section = Column(String(50), nullable=True)
     year = Column(Integer, nullable=True) # 1-4 for students, NULL for others
     created_at = Column(DateTime, default=datetime.utcnow)
+    calendar_key = Column(String(32), nullable=True) # Signs the ICS feed URL; rotating it revokes old links
 
     # Relationships (Optional but good for access)
     assignments = relationship("Assignment", back_populates="faculty")
     submissions = relationship("Submission", back_populates="student")
     achievements = relationship("Achievement", back_populates="user")
 
+    __table_args__ = (
+        # Students of a branch/section (assignment targets, reminders, rosters)
+        Index("ix_users_role_branch_section", "role", "branch", "section"),
+    )
+
 class OTP(Base):
     __tablename__ = "otps"
     
@@ -58,6 +65,14 @@ class Assignment(Base):
     faculty = relationship("User", back_populates="assignments")
     submissions = relationship("Submission", back_populates="assignment")
 
+    __table_args__ = (
+        # Student feed: targeting filter + deadline ordering
+        Index("ix_assignments_branch_section_deadline", "branch", "section", "deadline"),
+        Index("ix_assignments_faculty_deadline", "faculty_id", "deadline"),
+        # Reminder scan: every deadline in the next day, whatever the target
+        Index("ix_assignments_deadline", "deadline"),
+    )
+
 class Submission(Base):
     __tablename__ = "submissions"
 
@@ -75,6 +90,27 @@ class Submission(Base):
     assignment = relationship("Assignment", back_populates="submissions")
     student = relationship("User", back_populates="submissions")
 
+    __table_args__ = (
+        Index("ix_submissions_student_assignment", "student_id", "assignment_id"),
+        # Faculty submission lists ordered by registration number
+        Index("ix_submissions_assignment_regno", "assignment_id", "registration_number"),
+    )
+
+class SubmissionCount(Base):
+    """Per-section submission counts of an assignment, kept up to date on every first submission."""
+    __tablename__ = "assignment_section_counts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    assignment_id = Column(Integer, ForeignKey("assignments.id", ondelete="CASCADE"), nullable=False)
+    section = Column(String(50), nullable=False, default="") # student's section, "" when unset
+    submitted = Column(Integer, nullable=False, default=0) # students with at least one submission
+    late = Column(Integer, nullable=False, default=0) # ...whose first submission came after the deadline
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("assignment_id", "section", name="uq_assignment_section_counts"),
+    )
+
 # -----------------------------------------------------------------------------
 # Content & Events
 # -----------------------------------------------------------------------------
@@ -102,15 +138,15 @@ class Event(Base):
     # College Event Scope Fields
     registration_deadline = Column(DateTime, nullable=True)
     is_open = Column(Boolean, default=True)
-    eligibility = Column(Text, nullable=True) # JSON: List[str]
+    eligibility = Column(JSONColumn, nullable=True) # List[str]
     venue = Column(String(255), nullable=True)
     contact_phone = Column(String(50), nullable=True)
     contact_email = Column(String(255), nullable=True)
     image_poster = Column(String(500), nullable=True)
-    attachments = Column(Text, nullable=True) # JSON
+    attachments = Column(JSONColumn, nullable=True) # List[{name, url}]
     
     # New Coordinator & Dept Fields
-    target_departments = Column(Text, nullable=True) # JSON: List[str] e.g. ["CSE", "ECE"]
+    target_departments = Column(JSONColumn, nullable=True) # List[str] e.g. ["CSE", "ECE"]
     coordinator_name = Column(String(100), nullable=True)
     coordinator_details = Column(Text, nullable=True) # Extra text info
 
@@ -118,6 +154,13 @@ class Event(Base):
     registrations = relationship("EventRegistration", back_populates="event")
     achievements = relationship("Achievement", back_populates="event")
 
+    __table_args__ = (
+        # Club / college event listings ordered by date
+        Index("ix_events_club_date", "club_id", "date"),
+        # Reminder scan: every event starting in the next day
+        Index("ix_events_date", "date"),
+    )
+
 class EventRegistration(Base):
     __tablename__ = "event_registrations"
     
@@ -145,6 +188,40 @@ class EventRegistration(Base):
 
     event = relationship("Event", back_populates="registrations")
     student = relationship("User")
+    members = relationship("TeamMember", back_populates="registration", cascade="all, delete-orphan", order_by="TeamMember.id")
+
+    __table_args__ = (
+        # Registration counts and "am I registered" checks
+        Index("ix_event_registrations_event_student", "event_id", "student_id"),
+        Index("ix_event_registrations_student_registered", "student_id", "registered_at"),
+    )
+
+class TeamMember(Base):
+    """
+    One row per student on a team registration, the lead included.
+    member_details keeps the raw JSON the form sent; this is what gets queried.
+    """
+    __tablename__ = "team_members"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # Rows go with their event/registration (events are deleted without touching registrations)
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    registration_id = Column(Integer, ForeignKey("event_registrations.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    registration_number = Column(String(50), nullable=False)
+    name = Column(String(255), nullable=True) # Snapshot at registration time
+    is_lead = Column(Boolean, default=False)
+
+    registration = relationship("EventRegistration", back_populates="members")
+    user = relationship("User")
+
+    __table_args__ = (
+        # A student can be on at most one team per event
+        UniqueConstraint("event_id", "registration_number", name="uq_team_members_event_reg_no"),
+        # "My teams"
+        Index("ix_team_members_user_event", "user_id", "event_id"),
+        Index("ix_team_members_registration", "registration_id"),
+    )
 
 class Announcement(Base):
     __tablename__ = "announcements"
@@ -154,16 +231,21 @@ class Announcement(Base):
     content = Column(Text, nullable=False)
     published_at = Column(DateTime, default=datetime.utcnow)
     created_by = Column(Integer, ForeignKey("users.id"))
-    attachments = Column(Text, nullable=True) # JSON string of [{name, url}]
+    attachments = Column(JSONColumn, nullable=True) # List[{name, url}]
     priority = Column(String(50), default="normal") # normal, urgent, circular
     club_id = Column(Integer, ForeignKey("clubs.id"), nullable=True)
     
     # Official Announcement Fields
     category = Column(String(100), default="Notice")
     is_pinned = Column(Boolean, default=False)
-    target_departments = Column(Text, nullable=True) # JSON
-    target_years = Column(Text, nullable=True) # JSON: List[int] or List[str]
-    images = Column(Text, nullable=True) # JSON
+    target_departments = Column(JSONColumn, nullable=True) # List[str]
+    target_years = Column(JSONColumn, nullable=True) # List[int] or List[str]
+    images = Column(JSONColumn, nullable=True) # List[str]
+
+    __table_args__ = (
+        # Pinned-first, newest-first feeds per club (club_id NULL = college)
+        Index("ix_announcements_club_pinned_published", "club_id", "is_pinned", "published_at"),
+    )
 
 class Note(Base):
     __tablename__ = "notes"
@@ -218,6 +300,13 @@ class ClubMembership(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Membership / lead checks on every club endpoint
+        Index("ix_club_memberships_club_student", "club_id", "student_id"),
+        # "My clubs" (calendar feeds)
+        Index("ix_club_memberships_student_club", "student_id", "club_id"),
+    )
+
 # -----------------------------------------------------------------------------
 # Achievement Model
 # -----------------------------------------------------------------------------
@@ -245,3 +334,150 @@ class Achievement(Base):
 
     event = relationship("Event", back_populates="achievements")
     user = relationship("User", back_populates="achievements")
+
+    __table_args__ = (
+        # Duplicate check on create + per-event listings
+        Index("ix_achievements_event_user", "event_id", "user_id"),
+        Index("ix_achievements_user_created", "user_id", "created_at"),
+    )
+
+# -----------------------------------------------------------------------------
+# Leaderboard (maintained incrementally from achievements)
+# -----------------------------------------------------------------------------
+class LeaderboardEntry(Base):
+    __tablename__ = "achievement_leaderboard"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    club_id = Column(Integer, nullable=False, default=0) # 0 = overall, else achievements from that club's events
+
+    # Snapshot of student details so rankings never need a join to filter
+    branch = Column(String(50), nullable=True)
+    year = Column(Integer, nullable=True)
+
+    score = Column(Integer, nullable=False, default=0)
+    gold = Column(Integer, nullable=False, default=0)
+    silver = Column(Integer, nullable=False, default=0)
+    bronze = Column(Integer, nullable=False, default=0)
+    participate = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    user = relationship("User")
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "club_id", name="uq_leaderboard_user_club"),
+        Index("ix_leaderboard_club_score", "club_id", "score"),
+        Index("ix_leaderboard_club_branch_year_score", "club_id", "branch", "year", "score"),
+    )
+
+# -----------------------------------------------------------------------------
+# Auth: refresh tokens (rotated on every use) and revoked access tokens
+# -----------------------------------------------------------------------------
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    token_hash = Column(String(64), unique=True, nullable=False) # sha256 of the token; the token itself is never stored
+    family_id = Column(String(32), nullable=False) # all rotations of one login share a family
+    expires_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    revoked_at = Column(DateTime, nullable=True) # set when rotated, logged out or reuse is detected
+    replaced_by_id = Column(Integer, nullable=True)
+
+    user = relationship("User")
+
+    __table_args__ = (
+        Index("ix_refresh_tokens_user_revoked", "user_id", "revoked_at"),
+        Index("ix_refresh_tokens_family", "family_id"),
+    )
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    jti = Column(String(32), unique=True, nullable=False)
+    expires_at = Column(DateTime, nullable=False) # rows can be purged once the access token would have expired anyway
+
+    __table_args__ = (
+        Index("ix_revoked_tokens_expires", "expires_at"),
+    )
+
+# -----------------------------------------------------------------------------
+# Reminder emails: one row per (thing, student, lead time), claimed before sending
+# -----------------------------------------------------------------------------
+class Reminder(Base):
+    __tablename__ = "reminders"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(20), nullable=False) # "deadline" or "event"
+    target_id = Column(Integer, nullable=False) # assignment or event id
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    lead = Column(String(10), nullable=False) # "24h", "1h": how long before due_at it was meant to go out
+    email = Column(String(255), nullable=False)
+    title = Column(String(255), nullable=False) # snapshot, so sending needs no joins
+    due_at = Column(DateTime, nullable=False)
+    status = Column(String(20), nullable=False, default="pending") # pending -> sending -> sent / failed
+    claim_token = Column(String(32), nullable=True) # set by the worker that claimed the row
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Enqueueing is idempotent: a reminder exists at most once, whoever scans
+        UniqueConstraint("kind", "target_id", "user_id", "lead", name="uq_reminders_target_user_lead"),
+        Index("ix_reminders_status_id", "status", "id"),
+        Index("ix_reminders_claim", "claim_token"),
+    )
+
+# -----------------------------------------------------------------------------
+# Submission similarity: MinHash signatures and their LSH buckets, per assignment
+# -----------------------------------------------------------------------------
+class SubmissionFingerprint(Base):
+    __tablename__ = "submission_fingerprints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    submission_id = Column(Integer, ForeignKey("submissions.id", ondelete="CASCADE"), unique=True, nullable=False)
+    assignment_id = Column(Integer, ForeignKey("assignments.id", ondelete="CASCADE"), nullable=False)
+    student_id = Column(Integer, nullable=True)
+    status = Column(String(20), nullable=False, default="pending") # pending -> processing -> done / empty / failed
+    claim_token = Column(String(32), nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
+    signature = Column(JSONColumn, nullable=True) # MinHash values, one per permutation
+    shingles = Column(Integer, nullable=False, default=0)
+    error = Column(String(255), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    processed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_submission_fingerprints_status_id", "status", "id"),
+        Index("ix_submission_fingerprints_assignment_status", "assignment_id", "status"),
+    )
+
+class SubmissionLshBucket(Base):
+    __tablename__ = "submission_lsh_buckets"
+
+    id = Column(Integer, primary_key=True, index=True)
+    assignment_id = Column(Integer, ForeignKey("assignments.id", ondelete="CASCADE"), nullable=False)
+    bucket = Column(String(24), nullable=False) # "<band>:<hash of the band's values>"
+    submission_id = Column(Integer, ForeignKey("submissions.id", ondelete="CASCADE"), nullable=False)
+
+    __table_args__ = (
+        # Candidate lookup: every submission of the assignment sharing a bucket
+        Index("ix_submission_lsh_buckets_lookup", "assignment_id", "bucket"),
+        Index("ix_submission_lsh_buckets_submission", "submission_id"),
+    )
+
+class SubmissionSimilarity(Base):
+    __tablename__ = "submission_similarities"
+
+    id = Column(Integer, primary_key=True, index=True)
+    assignment_id = Column(Integer, ForeignKey("assignments.id", ondelete="CASCADE"), nullable=False)
+    submission_id = Column(Integer, ForeignKey("submissions.id", ondelete="CASCADE"), nullable=False) # the lower id of the pair
+    other_submission_id = Column(Integer, ForeignKey("submissions.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False) # estimated Jaccard similarity of the two texts, 0..1
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("submission_id", "other_submission_id", name="uq_submission_similarities_pair"),
+        Index("ix_submission_similarities_assignment_score", "assignment_id", "score"),
+    )
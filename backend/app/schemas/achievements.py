@@ -29,3 +29,16 @@ class AchievementOut(AchievementBase):
 
     class Config:
         from_attributes = True
+
+class LeaderboardEntryOut(BaseModel):
+    rank: int
+    user_id: int
+    student_name: Optional[str] = None
+    registration_number: Optional[str] = None
+    branch: Optional[str] = None
+    year: Optional[int] = None
+    score: int = 0
+    gold: int = 0
+    silver: int = 0
+    bronze: int = 0
+    participate: int = 0
@@ -27,6 +27,12 @@ class AssignmentRead(AssignmentBase):
     class Config:
         from_attributes = True
 
+class AssignmentFeedItem(AssignmentRead):
+    # Caller-specific annotations
+    is_submitted: bool = False
+    submitted_at: Optional[datetime] = None
+    is_overdue: bool = False
+
 class SubmissionCreate(BaseModel):
     file_url: str
 
@@ -43,3 +49,52 @@ class SubmissionRead(BaseModel):
     
     class Config:
         from_attributes = True
+
+class RosterStudent(BaseModel):
+    user_id: int
+    name: str
+    registration_number: Optional[str] = None
+    section: Optional[str] = None
+    submitted_at: Optional[datetime] = None # latest submission
+    attempts: int = 0
+
+class SectionCount(BaseModel):
+    section: str
+    students: int
+    submitted: int # includes late
+    late: int
+    missing: int
+
+class RosterSummary(BaseModel):
+    assignment_id: int
+    deadline: datetime
+    students: int
+    submitted: int
+    late: int
+    missing: int
+    sections: List[SectionCount] = []
+
+class AssignmentRoster(RosterSummary):
+    # "submitted" above is the count; these are the on-time / late / missing students
+    on_time: List[RosterStudent] = []
+    late_students: List[RosterStudent] = []
+    missing_students: List[RosterStudent] = []
+
+class SimilarSubmission(BaseModel):
+    submission_id: int
+    student_id: Optional[int] = None
+    student_name: Optional[str] = None
+    registration_number: Optional[str] = None
+    file_url: str
+    submitted_at: Optional[datetime] = None
+
+class SimilarPair(BaseModel):
+    score: float # estimated share of common 5-word sequences, 0..1
+    submissions: List[SimilarSubmission]
+
+class SimilarityReport(BaseModel):
+    assignment_id: int
+    processed: int
+    pending: int
+    unreadable: int # unsupported / unreadable files and files without text
+    pairs: List[SimilarPair] = []
@@ -81,6 +81,15 @@ class EventRegistrationCreate(BaseModel):
     id_proof_url: Optional[str] = None
     payment_screenshot_url: Optional[str] = None
 
+class TeamMemberRead(BaseModel):
+    user_id: int
+    registration_number: str
+    name: Optional[str] = None
+    is_lead: bool = False
+
+    class Config:
+        from_attributes = True
+
 class EventRegistrationRead(BaseModel):
     id: int
     student_id: int
@@ -93,6 +102,7 @@ class EventRegistrationRead(BaseModel):
     team_name: Optional[str] = None
     team_size: int = 1
     member_details: Optional[str] = None
+    members: List[TeamMemberRead] = []
     
     student_phone: Optional[str] = None
     student_email: Optional[str] = None
@@ -101,3 +111,17 @@ class EventRegistrationRead(BaseModel):
 
     class Config:
         from_attributes = True
+
+class TeamRead(BaseModel):
+    registration_id: int
+    event_id: int
+    event_title: str
+    event_date: datetime
+    club_id: Optional[int] = None
+    team_name: Optional[str] = None
+    team_size: int
+    is_lead: bool
+    members: List[TeamMemberRead]
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,73 @@
+"""
+Dev tool: replays the hot read endpoints, captures every SELECT they run,
+EXPLAINs each one and flags full table scans.
+
+Usage: python index_advisor.py [student_email] [faculty_email] [admin_email]
+(defaults are the accounts from seed.py / create_test_users.py)
+"""
+import sys
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.database import engine, SessionLocal
+from app.core.security import create_access_token
+from app.core.index_advisor import StatementRecorder, analyze
+from app.models import User, Club, Assignment
+
+DEFAULT_USERS = ["student@university.edu", "faculty@university.edu", "admin@university.edu"]
+
+# Endpoints hit for every user; {club_id}/{assignment_id} are filled from the first rows found
+WORKLOAD = [
+    "/auth/me",
+    "/dashboard/stats",
+    "/assignments/",
+    "/assignments/feed",
+    "/college/events",
+    "/college/announcements",
+    "/events/",
+    "/announcements/",
+    "/notes/",
+    "/clubs/",
+    "/clubs/{club_id}",
+    "/clubs/{club_id}/members",
+    "/clubs/{club_id}/events",
+    "/clubs/{club_id}/announcements",
+    "/assignments/{assignment_id}/submissions",
+    "/achievements/all",
+    "/achievements/my",
+    "/achievements/leaderboard",
+]
+
+def run_workload(client: TestClient, emails):
+    session = SessionLocal()
+    try:
+        club = session.query(Club).first()
+        assignment = session.query(Assignment).first()
+        users = session.query(User).filter(User.email.in_(emails)).all()
+    finally:
+        session.close()
+
+    ids = {"club_id": club.id if club else 1, "assignment_id": assignment.id if assignment else 1}
+    for user in users:
+        token = create_access_token(subject=user.email, additional_claims={"role": user.role, "id": user.id})
+        headers = {"Authorization": f"Bearer {token}"}
+        for path in WORKLOAD:
+            client.get(path.format(**ids), headers=headers)
+
+def main():
+    emails = sys.argv[1:] or DEFAULT_USERS
+    recorder = StatementRecorder()
+    with recorder.capture(engine):
+        # Broken endpoints should not abort the capture
+        run_workload(TestClient(app, raise_server_exceptions=False), emails)
+
+    report = analyze(engine, recorder)
+    flagged = [r for r in report if r[1]]
+    print(f"Captured {len(report)} distinct statements, {len(flagged)} with full scans.\n")
+    for statement, scans, _ in flagged:
+        print("-" * 80)
+        print(" ".join(statement.split()))
+        for scan in scans:
+            print(f"  FULL SCAN: {scan}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Login guard benchmark under a simulated credential-stuffing run.
+
+Replays the /auth/login decision flow (guard check -> user lookup -> bcrypt)
+against in-memory users, once without and once with the login guard, while
+legitimate users keep logging in from their own IPs. Reports bcrypt work,
+wall time and legitimate login success / latency for both runs.
+
+Usage: python login_guard_benchmark.py [--attack 600] [--legit 60] [--attacker-ips 5] [--workers 16]
+"""
+import argparse
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+from app.core.login_guard import LoginGuard
+
+
+def build_users(count: int, rounds: int):
+    salt = bcrypt.gensalt(rounds)
+    # One shared salt keeps setup fast; checkpw cost is the same per attempt
+    return {
+        f"student{i}@university.edu": bcrypt.hashpw(f"pass-{i}".encode(), salt)
+        for i in range(count)
+    }
+
+
+def build_traffic(users, attack: int, legit: int, attacker_ips: int):
+    emails = list(users)
+    traffic = []
+    for i in range(attack):
+        # Stuffing list: mostly real accounts, some unknown, always a wrong password
+        email = random.choice(emails) if random.random() < 0.7 else f"leaked{i}@example.com"
+        traffic.append(("attack", f"203.0.113.{i % attacker_ips}", email, "hunter2"))
+    for i in range(legit):
+        email = random.choice(emails)
+        traffic.append(("legit", f"10.0.{i // 250}.{i % 250}", email, f"pass-{email[7:].split('@')[0]}"))
+    random.shuffle(traffic)
+    return traffic
+
+
+def run(users, traffic, guard, workers: int):
+    bcrypt_checks = 0
+    legit_ok = 0
+    legit_latency = []
+
+    def attempt(item):
+        kind, ip, email, password = item
+        started = time.perf_counter()
+        if guard is not None and guard.check(ip, email):
+            outcome = "rejected"
+        else:
+            hashed = users.get(email)
+            ok = hashed is not None and bcrypt.checkpw(password.encode(), hashed)
+            if guard is not None:
+                (guard.record_success if ok else guard.record_failure)(ip, email)
+            outcome = "ok" if ok else ("bcrypt" if hashed is not None else "unknown")
+        return kind, outcome, time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(attempt, traffic))
+    elapsed = time.perf_counter() - started
+
+    for kind, outcome, latency in results:
+        if outcome in ("ok", "bcrypt"):
+            bcrypt_checks += 1
+        if kind == "legit":
+            legit_latency.append(latency)
+            legit_ok += outcome == "ok"
+
+    legit_latency.sort()
+    return {
+        "elapsed": elapsed,
+        "bcrypt_checks": bcrypt_checks,
+        "legit_ok": legit_ok,
+        "legit_total": len(legit_latency),
+        "legit_p50_ms": statistics.median(legit_latency) * 1000 if legit_latency else 0,
+        "legit_p95_ms": legit_latency[int(len(legit_latency) * 0.95) - 1] * 1000 if legit_latency else 0,
+    }
+
+
+def report(label, result, guard=None):
+    print(f"\n{label}")
+    print(f"  wall time:        {result['elapsed']:.2f}s")
+    print(f"  bcrypt checks:    {result['bcrypt_checks']}")
+    print(f"  legit logins ok:  {result['legit_ok']}/{result['legit_total']}")
+    print(f"  legit latency:    p50 {result['legit_p50_ms']:.0f} ms, p95 {result['legit_p95_ms']:.0f} ms")
+    if guard is not None:
+        print(f"  guard metrics:    {guard.metrics()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--attack", type=int, default=600)
+    parser.add_argument("--legit", type=int, default=60)
+    parser.add_argument("--attacker-ips", type=int, default=5)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    random.seed(7)
+    users = build_users(args.users, args.rounds)
+    traffic = build_traffic(users, args.attack, args.legit, args.attacker_ips)
+    print(f"{len(traffic)} login attempts ({args.attack} attack from {args.attacker_ips} IPs, {args.legit} legitimate)")
+
+    report("Without guard", run(users, traffic, None, args.workers))
+    guard = LoginGuard()
+    report("With guard", run(users, traffic, guard, args.workers), guard)
@@ -0,0 +1,37 @@
+from alembic import context
+from app.core.database import engine
+from app.models import Base
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    # `alembic upgrade head --sql`: emit the DDL instead of running it
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    # Reuse a connection handed over by app.core.schema (auto-migrate on startup), else open one
+    connection = context.config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
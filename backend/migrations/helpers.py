@@ -0,0 +1,43 @@
+"""
+Helpers for migrations that must stay safe on large tables during term:
+indexes are built in place without blocking writes, and backfills run in
+small committed batches instead of one long table-locking UPDATE.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def is_mysql() -> bool:
+    return op.get_bind().dialect.name == "mysql"
+
+
+def create_index_online(name: str, table: str, columns, unique: bool = False):
+    if is_mysql():
+        # InnoDB builds secondary indexes in place; LOCK=NONE keeps the table writable
+        unique_sql = "UNIQUE " if unique else ""
+        op.execute(f"CREATE {unique_sql}INDEX {name} ON {table} ({', '.join(columns)}) ALGORITHM=INPLACE, LOCK=NONE")
+    else:
+        op.create_index(name, table, columns, unique=unique)
+
+
+def batched_update(table: str, set_sql: str, where_sql: str = "1=1", batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Runs `UPDATE table SET set_sql WHERE where_sql` in primary-key ranges,
+    committing after every batch so row locks are only held briefly.
+    """
+    bind = op.get_bind()
+    low, high = bind.execute(sa.text(f"SELECT MIN(id), MAX(id) FROM {table}")).one()
+    if low is None:
+        return
+
+    with op.get_context().autocommit_block():
+        start = low
+        while start <= high:
+            end = start + batch_size - 1
+            bind.execute(
+                sa.text(f"UPDATE {table} SET {set_sql} WHERE id BETWEEN :start AND :end AND ({where_sql})"),
+                {"start": start, "end": end},
+            )
+            start = end + 1
@@ -0,0 +1,231 @@
+"""Baseline: schema as built by the legacy update_*_schema.py scripts
+
+Existing databases that were set up with those scripts are already at this
+revision: run `alembic stamp 0001_baseline` once, then `alembic upgrade head`.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('otps',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('otp', sa.String(length=6), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('is_verified', sa.Boolean(), nullable=True),
+    sa.Column('purpose', sa.String(length=50), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_otps_email'), 'otps', ['email'], unique=False)
+    op.create_index(op.f('ix_otps_id'), 'otps', ['id'], unique=False)
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('password_hash', sa.String(length=255), nullable=False),
+    sa.Column('role', sa.String(length=50), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('registration_number', sa.String(length=50), nullable=True),
+    sa.Column('branch', sa.String(length=50), nullable=True),
+    sa.Column('section', sa.String(length=50), nullable=True),
+    sa.Column('year', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('registration_number')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_table('assignments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('faculty_id', sa.Integer(), nullable=True),
+    sa.Column('deadline', sa.DateTime(), nullable=False),
+    sa.Column('attachment_url', sa.String(length=255), nullable=True),
+    sa.Column('branch', sa.String(length=50), nullable=True),
+    sa.Column('section', sa.String(length=50), nullable=True),
+    sa.ForeignKeyConstraint(['faculty_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assignments_id'), 'assignments', ['id'], unique=False)
+    op.create_table('clubs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('category', sa.String(length=100), nullable=False),
+    sa.Column('color', sa.String(length=100), nullable=False),
+    sa.Column('icon', sa.String(length=50), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('highlights', sa.Text(), nullable=True),
+    sa.Column('banner_image', sa.String(length=500), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_clubs_id'), 'clubs', ['id'], unique=False)
+    op.create_table('notes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('subject', sa.String(length=100), nullable=False),
+    sa.Column('file_url', sa.String(length=255), nullable=False),
+    sa.Column('uploaded_by_id', sa.Integer(), nullable=True),
+    sa.Column('uploaded_at', sa.DateTime(), nullable=True),
+    sa.Column('is_approved', sa.Boolean(), nullable=True),
+    sa.Column('branch', sa.String(length=50), nullable=True),
+    sa.Column('year', sa.Integer(), nullable=True),
+    sa.Column('tag', sa.String(length=100), nullable=True),
+    sa.Column('section', sa.String(length=50), nullable=True),
+    sa.ForeignKeyConstraint(['uploaded_by_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_notes_id'), 'notes', ['id'], unique=False)
+    op.create_table('announcements',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('published_at', sa.DateTime(), nullable=True),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('attachments', sa.Text(), nullable=True),
+    sa.Column('priority', sa.String(length=50), nullable=True),
+    sa.Column('club_id', sa.Integer(), nullable=True),
+    sa.Column('category', sa.String(length=100), nullable=True),
+    sa.Column('is_pinned', sa.Boolean(), nullable=True),
+    sa.Column('target_departments', sa.Text(), nullable=True),
+    sa.Column('target_years', sa.Text(), nullable=True),
+    sa.Column('images', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_announcements_id'), 'announcements', ['id'], unique=False)
+    op.create_table('club_memberships',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=True),
+    sa.Column('club_id', sa.Integer(), nullable=True),
+    sa.Column('joined_at', sa.DateTime(), nullable=True),
+    sa.Column('role', sa.String(length=50), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_club_memberships_id'), 'club_memberships', ['id'], unique=False)
+    op.create_table('events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('date', sa.DateTime(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('club_id', sa.Integer(), nullable=True),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('image_banner', sa.String(length=500), nullable=True),
+    sa.Column('requires_registration', sa.Boolean(), nullable=True),
+    sa.Column('event_type', sa.String(length=100), nullable=True),
+    sa.Column('participation_type', sa.String(length=50), nullable=True),
+    sa.Column('min_team_size', sa.Integer(), nullable=True),
+    sa.Column('max_team_size', sa.Integer(), nullable=True),
+    sa.Column('registration_deadline', sa.DateTime(), nullable=True),
+    sa.Column('is_open', sa.Boolean(), nullable=True),
+    sa.Column('eligibility', sa.Text(), nullable=True),
+    sa.Column('venue', sa.String(length=255), nullable=True),
+    sa.Column('contact_phone', sa.String(length=50), nullable=True),
+    sa.Column('contact_email', sa.String(length=255), nullable=True),
+    sa.Column('image_poster', sa.String(length=500), nullable=True),
+    sa.Column('attachments', sa.Text(), nullable=True),
+    sa.Column('target_departments', sa.Text(), nullable=True),
+    sa.Column('coordinator_name', sa.String(length=100), nullable=True),
+    sa.Column('coordinator_details', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_events_id'), 'events', ['id'], unique=False)
+    op.create_table('submissions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('assignment_id', sa.Integer(), nullable=True),
+    sa.Column('student_id', sa.Integer(), nullable=True),
+    sa.Column('file_url', sa.String(length=255), nullable=False),
+    sa.Column('submitted_at', sa.DateTime(), nullable=True),
+    sa.Column('registration_number', sa.String(length=50), nullable=True),
+    sa.Column('branch', sa.String(length=50), nullable=True),
+    sa.Column('section', sa.String(length=10), nullable=True),
+    sa.ForeignKeyConstraint(['assignment_id'], ['assignments.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_submissions_id'), 'submissions', ['id'], unique=False)
+    op.create_table('achievements',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=True),
+    sa.Column('external_event_name', sa.String(length=255), nullable=True),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('category', sa.String(length=100), nullable=True),
+    sa.Column('badge', sa.String(length=50), nullable=True),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('certificate_url', sa.String(length=500), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_achievements_id'), 'achievements', ['id'], unique=False)
+    op.create_table('event_registrations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=True),
+    sa.Column('student_id', sa.Integer(), nullable=True),
+    sa.Column('registered_at', sa.DateTime(), nullable=True),
+    sa.Column('team_name', sa.String(length=100), nullable=True),
+    sa.Column('team_size', sa.Integer(), nullable=True),
+    sa.Column('member_details', sa.Text(), nullable=True),
+    sa.Column('student_phone', sa.String(length=20), nullable=True),
+    sa.Column('student_email', sa.String(length=255), nullable=True),
+    sa.Column('id_proof_url', sa.String(length=500), nullable=True),
+    sa.Column('payment_screenshot_url', sa.String(length=500), nullable=True),
+    sa.Column('student_name', sa.String(length=255), nullable=True),
+    sa.Column('registration_number', sa.String(length=50), nullable=True),
+    sa.Column('branch', sa.String(length=50), nullable=True),
+    sa.Column('section', sa.String(length=50), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_event_registrations_id'), 'event_registrations', ['id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_event_registrations_id'), table_name='event_registrations')
+    op.drop_table('event_registrations')
+    op.drop_index(op.f('ix_achievements_id'), table_name='achievements')
+    op.drop_table('achievements')
+    op.drop_index(op.f('ix_submissions_id'), table_name='submissions')
+    op.drop_table('submissions')
+    op.drop_index(op.f('ix_events_id'), table_name='events')
+    op.drop_table('events')
+    op.drop_index(op.f('ix_club_memberships_id'), table_name='club_memberships')
+    op.drop_table('club_memberships')
+    op.drop_index(op.f('ix_announcements_id'), table_name='announcements')
+    op.drop_table('announcements')
+    op.drop_index(op.f('ix_notes_id'), table_name='notes')
+    op.drop_table('notes')
+    op.drop_index(op.f('ix_clubs_id'), table_name='clubs')
+    op.drop_table('clubs')
+    op.drop_index(op.f('ix_assignments_id'), table_name='assignments')
+    op.drop_table('assignments')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_otps_id'), table_name='otps')
+    op.drop_index(op.f('ix_otps_email'), table_name='otps')
+    op.drop_table('otps')
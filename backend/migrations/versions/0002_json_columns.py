@@ -0,0 +1,64 @@
+"""Store JSON list columns as native MySQL JSON
+
+On MySQL each column is copied into a new JSON column in batches (invalid
+legacy JSON becomes NULL) and then swapped in; SQLite keeps TEXT.
+
+Needs a maintenance window: stop the app (all workers) before upgrading or
+downgrading past this revision. Writes made after a row was copied would be
+lost, and between dropping the old column and renaming the new one the
+column doesn't exist at all. The batches only keep row locks short.
+
+Revision ID: 0002_json_columns
+Revises: 0001_baseline
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from migrations.helpers import is_mysql, batched_update
+
+revision = "0002_json_columns"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = [
+    ("events", "eligibility"),
+    ("events", "attachments"),
+    ("events", "target_departments"),
+    ("announcements", "attachments"),
+    ("announcements", "target_departments"),
+    ("announcements", "target_years"),
+    ("announcements", "images"),
+]
+
+
+def _swap_column(table, source, target, column_type, copy_sql):
+    # Not online-safe (see the module docstring): run with the app stopped
+    op.add_column(table, sa.Column(target, column_type, nullable=True))
+    batched_update(table, copy_sql)
+    op.drop_column(table, source)
+    op.alter_column(table, target, new_column_name=source, existing_type=column_type, existing_nullable=True)
+
+
+def upgrade():
+    if not is_mysql():
+        return
+    for table, column in JSON_COLUMNS:
+        target = f"{column}__json"
+        _swap_column(
+            table, column, target, mysql.JSON(),
+            f"{target} = CASE WHEN JSON_VALID({column}) THEN {column} ELSE NULL END",
+        )
+
+
+def downgrade():
+    if not is_mysql():
+        return
+    for table, column in JSON_COLUMNS:
+        target = f"{column}__text"
+        _swap_column(
+            table, column, target, sa.Text(),
+            f"{target} = CAST({column} AS CHAR)",
+        )
@@ -0,0 +1,69 @@
+"""Achievement leaderboard table, backfilled from achievements
+
+Revision ID: 0003_achievement_leaderboard
+Revises: 0002_json_columns
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_achievement_leaderboard"
+down_revision = "0002_json_columns"
+branch_labels = None
+depends_on = None
+
+# Frozen copy of app.core.leaderboard.BADGE_WEIGHTS at the time of this migration
+SCORE_SQL = """
+    SUM(CASE a.badge WHEN 'Gold' THEN 10 WHEN 'Silver' THEN 6 WHEN 'Bronze' THEN 3 WHEN 'Participate' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN a.badge = 'Gold' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN a.badge = 'Silver' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN a.badge = 'Bronze' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN a.badge = 'Participate' THEN 1 ELSE 0 END)
+"""
+
+
+def upgrade():
+    op.create_table('achievement_leaderboard',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('branch', sa.String(length=50), nullable=True),
+    sa.Column('year', sa.Integer(), nullable=True),
+    sa.Column('score', sa.Integer(), nullable=False),
+    sa.Column('gold', sa.Integer(), nullable=False),
+    sa.Column('silver', sa.Integer(), nullable=False),
+    sa.Column('bronze', sa.Integer(), nullable=False),
+    sa.Column('participate', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'club_id', name='uq_leaderboard_user_club')
+    )
+    op.create_index(op.f('ix_achievement_leaderboard_id'), 'achievement_leaderboard', ['id'], unique=False)
+    op.create_index('ix_leaderboard_club_score', 'achievement_leaderboard', ['club_id', 'score'], unique=False)
+    op.create_index('ix_leaderboard_club_branch_year_score', 'achievement_leaderboard', ['club_id', 'branch', 'year', 'score'], unique=False)
+
+    # New table, so a single INSERT ... SELECT per scope only reads achievements
+    columns = "user_id, club_id, branch, year, score, gold, silver, bronze, participate"
+    op.execute(f"""
+        INSERT INTO achievement_leaderboard ({columns})
+        SELECT a.user_id, 0, u.branch, u.year, {SCORE_SQL}
+        FROM achievements a JOIN users u ON u.id = a.user_id
+        GROUP BY a.user_id, u.branch, u.year
+    """)
+    op.execute(f"""
+        INSERT INTO achievement_leaderboard ({columns})
+        SELECT a.user_id, e.club_id, u.branch, u.year, {SCORE_SQL}
+        FROM achievements a
+        JOIN users u ON u.id = a.user_id
+        JOIN events e ON e.id = a.event_id
+        WHERE e.club_id IS NOT NULL
+        GROUP BY a.user_id, e.club_id, u.branch, u.year
+    """)
+
+
+def downgrade():
+    op.drop_index('ix_leaderboard_club_branch_year_score', table_name='achievement_leaderboard')
+    op.drop_index('ix_leaderboard_club_score', table_name='achievement_leaderboard')
+    op.drop_index(op.f('ix_achievement_leaderboard_id'), table_name='achievement_leaderboard')
+    op.drop_table('achievement_leaderboard')
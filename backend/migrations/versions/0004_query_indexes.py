@@ -0,0 +1,40 @@
+"""Composite indexes for the hot query shapes (see index_advisor.py)
+
+Built online on MySQL (ALGORITHM=INPLACE, LOCK=NONE).
+
+Revision ID: 0004_query_indexes
+Revises: 0003_achievement_leaderboard
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+from migrations.helpers import create_index_online
+
+revision = "0004_query_indexes"
+down_revision = "0003_achievement_leaderboard"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_assignments_branch_section_deadline", "assignments", ["branch", "section", "deadline"]),
+    ("ix_assignments_faculty_deadline", "assignments", ["faculty_id", "deadline"]),
+    ("ix_submissions_student_assignment", "submissions", ["student_id", "assignment_id"]),
+    ("ix_submissions_assignment_regno", "submissions", ["assignment_id", "registration_number"]),
+    ("ix_events_club_date", "events", ["club_id", "date"]),
+    ("ix_event_registrations_event_student", "event_registrations", ["event_id", "student_id"]),
+    ("ix_event_registrations_student_registered", "event_registrations", ["student_id", "registered_at"]),
+    ("ix_announcements_club_pinned_published", "announcements", ["club_id", "is_pinned", "published_at"]),
+    ("ix_club_memberships_club_student", "club_memberships", ["club_id", "student_id"]),
+    ("ix_achievements_event_user", "achievements", ["event_id", "user_id"]),
+    ("ix_achievements_user_created", "achievements", ["user_id", "created_at"]),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        create_index_online(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
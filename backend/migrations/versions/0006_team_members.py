@@ -0,0 +1,141 @@
+"""Team members table, backfilled from event_registrations.member_details
+
+Existing team registrations are copied in: the lead plus every member whose
+registration number matches a student, read from the JSON list or from the
+club page's older free-text list. Members that can't be resolved, or that
+already sit on another team for the same event, stay only in member_details
+and are printed during the upgrade.
+
+Revision ID: 0006_team_members
+Revises: 0005_refresh_tokens
+Create Date: 2026-10-19
+"""
+import json
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_team_members"
+down_revision = "0005_refresh_tokens"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+# Same parsing as app.core.teams.member_registration_numbers (kept here so the
+# migration doesn't depend on app code): a JSON list, or the club page's old
+# free text, one member per line like "1. John Doe (242FA04001, CSE, Sec-A)".
+_LIST_PREFIX = re.compile(r"^\s*(?:\d+[.)]|[-*•])\s*")
+_REG_NO = re.compile(r"\b(?=[A-Za-z0-9]*\d)[A-Za-z0-9]{6,}\b")
+
+
+def _legacy_numbers(text):
+    numbers = []
+    for line in text.splitlines():
+        line = _LIST_PREFIX.sub("", line).strip()
+        inside = re.search(r"\(([^)]*)\)", line)
+        match = (inside and _REG_NO.search(inside.group(1))) or _REG_NO.search(line)
+        if match:
+            numbers.append(match.group())
+    return numbers
+
+
+def _member_numbers(member_details):
+    if not member_details or not member_details.strip():
+        return []
+    if not member_details.lstrip().startswith("["):
+        return _legacy_numbers(member_details)
+    try:
+        members = json.loads(member_details)
+    except ValueError:
+        return []
+    if not isinstance(members, list):
+        return []
+    numbers = []
+    for member in members:
+        if isinstance(member, dict):
+            member = member.get("reg_no") or member.get("registration_number")
+        if member and str(member).strip():
+            numbers.append(str(member).strip())
+    return numbers
+
+
+def _backfill():
+    bind = op.get_bind()
+    registrations = bind.execute(sa.text("""
+        SELECT r.id, r.event_id, r.member_details, u.registration_number
+        FROM event_registrations r
+        JOIN events e ON e.id = r.event_id
+        JOIN users u ON u.id = r.student_id
+        WHERE e.participation_type = 'team'
+        ORDER BY r.id
+    """)).all()
+    if not registrations:
+        return
+    students = {
+        number: (user_id, name)
+        for user_id, number, name in bind.execute(sa.text(
+            "SELECT id, registration_number, name FROM users WHERE role = 'student' AND registration_number IS NOT NULL"
+        ))
+    }
+
+    team_members = sa.table(
+        "team_members",
+        sa.column("event_id"), sa.column("registration_id"), sa.column("user_id"),
+        sa.column("registration_number"), sa.column("name"), sa.column("is_lead"),
+    )
+    seen, rows, skipped = set(), [], []
+    for registration_id, event_id, member_details, lead_number in registrations:
+        members = _member_numbers(member_details)
+        numbers = ([lead_number] if lead_number else []) + members
+        if member_details and member_details.strip() and not members:
+            skipped.append((registration_id, "no member registration numbers in member_details"))
+        for number in numbers:
+            if number not in students:
+                skipped.append((registration_id, f"unknown registration number {number}"))
+                continue
+            if (event_id, number) in seen:
+                skipped.append((registration_id, f"{number} already on another team"))
+                continue
+            seen.add((event_id, number))
+            user_id, name = students[number]
+            rows.append({
+                "event_id": event_id, "registration_id": registration_id, "user_id": user_id,
+                "registration_number": number, "name": name, "is_lead": number == lead_number,
+            })
+    for start in range(0, len(rows), BATCH_SIZE):
+        op.bulk_insert(team_members, rows[start:start + BATCH_SIZE])
+    # Skipped members stay in member_details only; list them so they can be fixed by hand
+    for registration_id, reason in skipped:
+        print(f"team_members backfill: registration {registration_id}: {reason}")
+
+
+def upgrade():
+    op.create_table('team_members',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('registration_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('registration_number', sa.String(length=50), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=True),
+    sa.Column('is_lead', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['registration_id'], ['event_registrations.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id', 'registration_number', name='uq_team_members_event_reg_no')
+    )
+    op.create_index(op.f('ix_team_members_id'), 'team_members', ['id'], unique=False)
+    op.create_index('ix_team_members_user_event', 'team_members', ['user_id', 'event_id'], unique=False)
+    op.create_index('ix_team_members_registration', 'team_members', ['registration_id'], unique=False)
+
+    _backfill()
+
+
+def downgrade():
+    op.drop_index('ix_team_members_registration', table_name='team_members')
+    op.drop_index('ix_team_members_user_event', table_name='team_members')
+    op.drop_index(op.f('ix_team_members_id'), table_name='team_members')
+    op.drop_table('team_members')
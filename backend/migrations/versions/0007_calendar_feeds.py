@@ -0,0 +1,26 @@
+"""Calendar feed key on users, "my clubs" index
+
+Revision ID: 0007_calendar_feeds
+Revises: 0006_team_members
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_online
+
+revision = "0007_calendar_feeds"
+down_revision = "0006_team_members"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Nullable with no default: instant on MySQL 8, no table rebuild
+    op.add_column('users', sa.Column('calendar_key', sa.String(length=32), nullable=True))
+    create_index_online("ix_club_memberships_student_club", "club_memberships", ["student_id", "club_id"])
+
+
+def downgrade():
+    op.drop_index("ix_club_memberships_student_club", table_name="club_memberships")
+    op.drop_column('users', 'calendar_key')
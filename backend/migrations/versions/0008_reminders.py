@@ -0,0 +1,52 @@
+"""Reminder delivery table, date indexes for the reminder scan
+
+Revision ID: 0008_reminders
+Revises: 0007_calendar_feeds
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_online
+
+revision = "0008_reminders"
+down_revision = "0007_calendar_feeds"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('reminders',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('target_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('lead', sa.String(length=10), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('due_at', sa.DateTime(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('claim_token', sa.String(length=32), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('kind', 'target_id', 'user_id', 'lead', name='uq_reminders_target_user_lead')
+    )
+    op.create_index(op.f('ix_reminders_id'), 'reminders', ['id'], unique=False)
+    op.create_index('ix_reminders_status_id', 'reminders', ['status', 'id'], unique=False)
+    op.create_index('ix_reminders_claim', 'reminders', ['claim_token'], unique=False)
+
+    create_index_online("ix_assignments_deadline", "assignments", ["deadline"])
+    create_index_online("ix_events_date", "events", ["date"])
+    create_index_online("ix_users_role_branch_section", "users", ["role", "branch", "section"])
+
+
+def downgrade():
+    op.drop_index("ix_users_role_branch_section", table_name="users")
+    op.drop_index("ix_events_date", table_name="events")
+    op.drop_index("ix_assignments_deadline", table_name="assignments")
+    op.drop_index('ix_reminders_claim', table_name='reminders')
+    op.drop_index('ix_reminders_status_id', table_name='reminders')
+    op.drop_index(op.f('ix_reminders_id'), table_name='reminders')
+    op.drop_table('reminders')
@@ -0,0 +1,50 @@
+"""Per-section submission counts, backfilled from submissions
+
+Revision ID: 0009_submission_counts
+Revises: 0008_reminders
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009_submission_counts"
+down_revision = "0008_reminders"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('assignment_section_counts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('assignment_id', sa.Integer(), nullable=False),
+    sa.Column('section', sa.String(length=50), nullable=False),
+    sa.Column('submitted', sa.Integer(), nullable=False),
+    sa.Column('late', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['assignment_id'], ['assignments.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('assignment_id', 'section', name='uq_assignment_section_counts')
+    )
+    op.create_index(op.f('ix_assignment_section_counts_id'), 'assignment_section_counts', ['id'], unique=False)
+
+    # Same rules as app.core.submission_stats.rebuild: a student counts once,
+    # late when their first submission came after the deadline
+    op.execute("""
+        INSERT INTO assignment_section_counts (assignment_id, section, submitted, late, updated_at)
+        SELECT f.assignment_id, COALESCE(u.section, ''), COUNT(*),
+               SUM(CASE WHEN f.first_at > a.deadline THEN 1 ELSE 0 END), CURRENT_TIMESTAMP
+        FROM (
+            SELECT assignment_id, student_id, MIN(submitted_at) AS first_at
+            FROM submissions
+            WHERE assignment_id IS NOT NULL AND student_id IS NOT NULL
+            GROUP BY assignment_id, student_id
+        ) f
+        JOIN users u ON u.id = f.student_id
+        JOIN assignments a ON a.id = f.assignment_id
+        GROUP BY f.assignment_id, COALESCE(u.section, '')
+    """)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_assignment_section_counts_id'), table_name='assignment_section_counts')
+    op.drop_table('assignment_section_counts')
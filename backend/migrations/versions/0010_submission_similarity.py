@@ -0,0 +1,92 @@
+"""Submission fingerprints, LSH buckets and similar pairs
+
+Existing submissions are queued (status 'pending'), so the similarity
+sweep fingerprints them after the upgrade.
+
+Revision ID: 0010_submission_similarity
+Revises: 0009_submission_counts
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from sqlalchemy.dialects import mysql
+
+revision = "0010_submission_similarity"
+down_revision = "0009_submission_counts"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('submission_fingerprints',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('submission_id', sa.Integer(), nullable=False),
+    sa.Column('assignment_id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('claim_token', sa.String(length=32), nullable=True),
+    sa.Column('claimed_at', sa.DateTime(), nullable=True),
+    sa.Column('signature', sa.Text().with_variant(mysql.JSON(), 'mysql'), nullable=True),
+    sa.Column('shingles', sa.Integer(), nullable=False),
+    sa.Column('error', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('processed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['assignment_id'], ['assignments.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['submission_id'], ['submissions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('submission_id')
+    )
+    op.create_index(op.f('ix_submission_fingerprints_id'), 'submission_fingerprints', ['id'], unique=False)
+    op.create_index('ix_submission_fingerprints_status_id', 'submission_fingerprints', ['status', 'id'], unique=False)
+    op.create_index('ix_submission_fingerprints_assignment_status', 'submission_fingerprints', ['assignment_id', 'status'], unique=False)
+
+    op.create_table('submission_lsh_buckets',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('assignment_id', sa.Integer(), nullable=False),
+    sa.Column('bucket', sa.String(length=24), nullable=False),
+    sa.Column('submission_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['assignment_id'], ['assignments.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['submission_id'], ['submissions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_submission_lsh_buckets_id'), 'submission_lsh_buckets', ['id'], unique=False)
+    op.create_index('ix_submission_lsh_buckets_lookup', 'submission_lsh_buckets', ['assignment_id', 'bucket'], unique=False)
+    op.create_index('ix_submission_lsh_buckets_submission', 'submission_lsh_buckets', ['submission_id'], unique=False)
+
+    op.create_table('submission_similarities',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('assignment_id', sa.Integer(), nullable=False),
+    sa.Column('submission_id', sa.Integer(), nullable=False),
+    sa.Column('other_submission_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['assignment_id'], ['assignments.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['submission_id'], ['submissions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['other_submission_id'], ['submissions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('submission_id', 'other_submission_id', name='uq_submission_similarities_pair')
+    )
+    op.create_index(op.f('ix_submission_similarities_id'), 'submission_similarities', ['id'], unique=False)
+    op.create_index('ix_submission_similarities_assignment_score', 'submission_similarities', ['assignment_id', 'score'], unique=False)
+
+    op.execute("""
+        INSERT INTO submission_fingerprints (submission_id, assignment_id, student_id, status, shingles, created_at)
+        SELECT id, assignment_id, student_id, 'pending', 0, CURRENT_TIMESTAMP
+        FROM submissions
+        WHERE assignment_id IS NOT NULL
+    """)
+
+
+def downgrade():
+    op.drop_index('ix_submission_similarities_assignment_score', table_name='submission_similarities')
+    op.drop_index(op.f('ix_submission_similarities_id'), table_name='submission_similarities')
+    op.drop_table('submission_similarities')
+    op.drop_index('ix_submission_lsh_buckets_submission', table_name='submission_lsh_buckets')
+    op.drop_index('ix_submission_lsh_buckets_lookup', table_name='submission_lsh_buckets')
+    op.drop_index(op.f('ix_submission_lsh_buckets_id'), table_name='submission_lsh_buckets')
+    op.drop_table('submission_lsh_buckets')
+    op.drop_index('ix_submission_fingerprints_assignment_status', table_name='submission_fingerprints')
+    op.drop_index('ix_submission_fingerprints_status_id', table_name='submission_fingerprints')
+    op.drop_index(op.f('ix_submission_fingerprints_id'), table_name='submission_fingerprints')
+    op.drop_table('submission_fingerprints')
@@ -0,0 +1,18 @@
+from app.core.database import SessionLocal
+from app.core import leaderboard
+
+def rebuild_leaderboard():
+    db = SessionLocal()
+    try:
+        print("Rebuilding achievement leaderboard from achievements...")
+        count = leaderboard.rebuild(db)
+        db.commit()
+        print(f"[OK] Wrote {count} leaderboard rows.")
+    except Exception as e:
+        db.rollback()
+        print(f"[ERROR] Rebuild failed: {e}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    rebuild_leaderboard()
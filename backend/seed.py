@@ -1,10 +1,12 @@
 from sqlalchemy.orm import Session
-from app.core.database import engine, Base, SessionLocal
+from alembic import command
+from app.core.database import SessionLocal
+from app.core.schema import alembic_config
 from app.models import User
 from app.core.security import get_password_hash
 
 def seed():
-    Base.metadata.create_all(bind=engine)
+    command.upgrade(alembic_config(), "head")
     db = SessionLocal()
     try:
         # Check if admin exists
@@ -0,0 +1,148 @@
+"""
+Load test for the SSE feed (/stream/feed) with thousands of idle connections.
+
+HTTP mode (default) needs a running server and existing users:
+    1. opens --connections idle streams as --student-email,
+    2. posts one college announcement as --admin-email,
+    3. reports connect time and how long the push takes to reach every stream.
+    Raise the open-file limit first (ulimit -n 10000).
+
+In-process mode (--in-process) skips HTTP and measures the broker alone:
+subscribers spread over visibility segments, fan-out latency and memory.
+
+Usage:
+    python sse_load_test.py --connections 5000 --student-email s@univ.edu --admin-email admin@univ.edu
+    python sse_load_test.py --in-process --connections 20000
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+import tracemalloc
+import urllib.request
+from urllib.parse import urlsplit
+
+
+async def open_stream(host, port, path, ready):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n".encode())
+    await writer.drain()
+    status = await reader.readline()
+    if b" 200 " not in status:
+        raise RuntimeError(f"Stream rejected: {status.decode().strip()}")
+    await reader.readuntil(b"retry: 5000\n\n")
+    ready()
+    return reader, writer
+
+
+async def wait_for_push(reader):
+    await reader.readuntil(b"event: announcement\n")
+    return time.perf_counter()
+
+
+def post_announcement(base_url, token):
+    body = json.dumps({"title": "Load test", "content": "SSE fan-out check", "category": "General"}).encode()
+    request = urllib.request.Request(
+        f"{base_url}/college/announcements", data=body, method="POST",
+        headers={"Content-Type": "application/json", "Authorization": f"Bearer {token}"}
+    )
+    with urllib.request.urlopen(request) as response:
+        response.read()
+
+
+def make_token(email):
+    from app.core.database import SessionLocal
+    from app.core.security import create_access_token
+    from app.models import User
+    with SessionLocal() as session:
+        user = session.query(User).filter(User.email == email).first()
+        if user is None:
+            raise SystemExit(f"No user {email}")
+        return create_access_token(subject=user.email, additional_claims={"role": user.role, "id": user.id})
+
+
+async def http_mode(args):
+    parts = urlsplit(args.url)
+    student_token, admin_token = make_token(args.student_email), make_token(args.admin_email)
+    path = f"/stream/feed?token={student_token}"
+
+    connected = 0
+    def ready():
+        nonlocal connected
+        connected += 1
+
+    started = time.perf_counter()
+    semaphore = asyncio.Semaphore(200)  # don't SYN-flood the server while connecting
+    async def connect():
+        async with semaphore:
+            return await open_stream(parts.hostname, parts.port or 80, path, ready)
+    streams = await asyncio.gather(*(connect() for _ in range(args.connections)))
+    print(f"{connected} streams open in {time.perf_counter() - started:.1f}s")
+
+    await asyncio.sleep(args.idle)
+    waiters = [asyncio.create_task(wait_for_push(reader)) for reader, _ in streams]
+    published = time.perf_counter()
+    await asyncio.to_thread(post_announcement, args.url, admin_token)
+    received = await asyncio.gather(*waiters)
+    latencies = sorted(t - published for t in received)
+    print(f"push reached {len(latencies)} streams: "
+          f"p50 {latencies[len(latencies) // 2] * 1000:.0f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.0f} ms, "
+          f"max {latencies[-1] * 1000:.0f} ms")
+
+    for _, writer in streams:
+        writer.close()
+
+
+async def in_process_mode(args):
+    from app.core.broker import Broker
+    from app.core.visibility import ViewerContext
+
+    branches = ["CSE", "ECE", "EEE", "MECH", "CIVIL", "IT"]
+    broker = Broker()
+    tracemalloc.start()
+    subscribers = []
+    for i in range(args.connections):
+        viewer = ViewerContext(user_id=i, role="student", branch=branches[i % len(branches)], year=i % 4 + 1)
+        subscribers.append(broker.subscribe(viewer))
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{len(broker)} subscribers, ~{memory / len(broker):.0f} bytes each")
+
+    # Targets one branch + year, so 1/24 of subscribers should get it
+    message = {"kind": "announcement", "data": {"title": "x", "target_departments": ["CSE"], "target_years": ["1"]}}
+    expected = sum(1 for i in range(args.connections) if i % len(branches) == 0 and i % 4 == 0)
+
+    started = time.perf_counter()
+    thread = threading.Thread(target=broker.deliver, args=(message,))  # publishers run in the threadpool
+    thread.start()
+    await asyncio.to_thread(thread.join)
+    while sum(q.qsize() for q in subscribers) < expected:
+        await asyncio.sleep(0)
+    print(f"targeted push delivered to {expected} subscribers in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    message = {"kind": "announcement", "data": {"title": "y", "target_departments": None, "target_years": None}}
+    started = time.perf_counter()
+    broker.deliver(message)
+    while sum(q.qsize() for q in subscribers) < expected + args.connections:
+        await asyncio.sleep(0)
+    print(f"broadcast delivered to {args.connections} subscribers in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=2000)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--student-email")
+    parser.add_argument("--admin-email")
+    parser.add_argument("--idle", type=float, default=5.0, help="seconds to hold the streams idle before publishing")
+    parser.add_argument("--in-process", action="store_true")
+    args = parser.parse_args()
+
+    if args.in_process:
+        asyncio.run(in_process_mode(args))
+    else:
+        if not args.student_email or not args.admin_email:
+            parser.error("--student-email and --admin-email are required in HTTP mode")
+        asyncio.run(http_mode(args))
@@ -0,0 +1,73 @@
+"""
+Startup profile report.
+
+1. Import time per module for `import app.main` (python -X importtime), slowest first.
+2. Time to first request: boots uvicorn in a subprocess and polls GET / until it answers
+   (includes the lifespan schema check, so the database must be reachable).
+
+Usage: python startup_profile.py [--top 25] [--port 8765]
+"""
+import argparse
+import subprocess
+import sys
+import time
+import urllib.request
+
+
+def import_profile(top: int):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True, text=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+
+    total = next((c for c, _, n in rows if n == "app.main"), 0)
+    print(f"import app.main: {total / 1000:.0f} ms\n")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for cumulative, self_time, name in sorted(rows, reverse=True)[:top]:
+        print(f"{cumulative / 1000:>10.1f}ms {self_time / 1000:>8.1f}ms  {name}")
+
+    app_rows = [r for r in rows if r[2].startswith("app.")]
+    print(f"\nApplication modules ({len(app_rows)}):")
+    for cumulative, self_time, name in sorted(app_rows, reverse=True):
+        print(f"{cumulative / 1000:>10.1f}ms {self_time / 1000:>8.1f}ms  {name}")
+
+
+def time_to_first_request(port: int, timeout: float = 30.0):
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                last_lines = server.stderr.read().strip().splitlines()[-3:]
+                print("\nServer exited before answering:\n" + "\n".join(last_lines))
+                return
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1) as response:
+                    if response.status == 200:
+                        print(f"\nTime to first request: {(time.perf_counter() - started) * 1000:.0f} ms")
+                        return
+            except OSError:
+                time.sleep(0.02)
+        print(f"\nNo response within {timeout:.0f}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    import_profile(args.top)
+    time_to_first_request(args.port)
@@ -16,6 +16,7 @@ export const AuthProvider = ({ children }) => {
           setUser(response.data);
         } catch (error) {
           localStorage.removeItem('token');
+          localStorage.removeItem('refresh_token');
         }
       }
       setLoading(false);
@@ -35,8 +36,9 @@ export const AuthProvider = ({ children }) => {
         }
     });
     
-    const { access_token } = response.data;
+    const { access_token, refresh_token } = response.data;
     localStorage.setItem('token', access_token);
+    localStorage.setItem('refresh_token', refresh_token);
     
     // Refresh user
     const meResponse = await api.get('/auth/me');
@@ -61,8 +63,15 @@ export const AuthProvider = ({ children }) => {
     return response.data;
   };
 
-  const logout = () => {
+  const logout = async () => {
+    try {
+      // Revoke the tokens server-side; a failure here still logs the user out locally
+      await api.post('/auth/logout', { refresh_token: localStorage.getItem('refresh_token') });
+    } catch (error) {
+      console.error("Logout request failed", error);
+    }
     localStorage.removeItem('token');
+    localStorage.removeItem('refresh_token');
     setUser(null);
   };
 
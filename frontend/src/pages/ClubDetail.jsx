@@ -20,6 +20,7 @@ const ClubDetail = () => {
     const [showAnnouncementModal, setShowAnnouncementModal] = useState(false);
     const [viewRegistrationsId, setViewRegistrationsId] = useState(null); // ID of event to view regs for
     const [registerEventId, setRegisterEventId] = useState(null); // ID of event to register for
+    const [teamMembers, setTeamMembers] = useState([]); // Extra members (besides you) for a team registration
     const [confirmDialog, setConfirmDialog] = useState({ isOpen: false, title: '', message: '', onConfirm: null, isAlert: false });
     const [roleModal, setRoleModal] = useState({ isOpen: false, member: null });
     const [formAttachments, setFormAttachments] = useState([{ name: '', url: '' }]); // New State for attachments
@@ -88,11 +89,17 @@ const ClubDetail = () => {
         }
     }, [showEditModal, club]);
 
+    // The first load comes from the page bundle; later tab switches refresh just that tab.
+    // Holds the club id the bundle was loaded for, so moving to another club waits for its bundle.
+    const [bundleId, setBundleId] = useState(null);
+
     useEffect(() => {
+        setBundleId(null);
         fetchClubDetails();
     }, [id]);
 
     useEffect(() => {
+        if (bundleId !== id) return;
         if (activeTab === 'members' && id) fetchMembers();
         if (activeTab === 'events' && id) fetchEvents();
         if (activeTab === 'discussions' && id) fetchAnnouncements();
@@ -101,8 +108,13 @@ const ClubDetail = () => {
     // ... fetchClubDetails, fetchMembers, fetchEvents ...
     const fetchClubDetails = async () => {
         try {
-            const res = await api.get(`/clubs/${id}`);
-            setClub(res.data);
+            // Club + members + events + announcements in one round trip
+            const res = await api.get(`/bundles/clubs/${id}`);
+            setClub(res.data.club);
+            setMembers(res.data.members);
+            setEvents(res.data.events);
+            setAnnouncements(res.data.announcements);
+            setBundleId(id);
         } catch (err) {
             console.error(err);
             navigate('/explore'); // Redirect if not found
@@ -206,11 +218,13 @@ const ClubDetail = () => {
     };
 
     const handleRegisterEvent = async (event, formData = {}) => {
+        const isTeam = event.participation_type === 'team';
         try {
+            // Same member format as college events: [{ name, reg_no, branch, section }]
             await api.post(`/clubs/${id}/events/${event.id}/register`, {
                 team_name: formData.team_name || null,
-                team_size: formData.team_size ? parseInt(formData.team_size) : 1,
-                member_details: formData.member_details || null
+                team_size: isTeam ? 1 + teamMembers.length : 1,
+                member_details: isTeam ? JSON.stringify(teamMembers) : null
             });
             showAlert("Success", "Registered successfully!");
             fetchEvents();
@@ -277,7 +291,7 @@ const ClubDetail = () => {
             reg.section || '',
             reg.team_name || '',
             reg.team_size || '',
-            reg.member_details ? `"${reg.member_details.replace(/"/g, '""')}"` : ''
+            reg.member_details ? `"${formatMembers(reg.member_details).replace(/"/g, '""')}"` : ''
         ]);
         const csvContent = [headers.join(','), ...rows.map(row => row.join(','))].join('\n');
         const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
@@ -574,6 +588,7 @@ const ClubDetail = () => {
                                                                          <button 
                                                                             onClick={() => {
                                                                                 if (ev.participation_type === 'team') {
+                                                                                    setTeamMembers([]);
                                                                                     setRegisterEventId(ev);
                                                                                 } else {
                                                                                     handleRegisterEvent(ev);
@@ -1132,15 +1147,33 @@ const ClubDetail = () => {
                             <label className="block text-sm font-medium text-slate-700 mb-1">Team Name</label>
                             <input name="team_name" className="w-full p-2 border rounded-lg" required placeholder="e.g. Code Blasters" />
                         </div>
-                         <div className="grid grid-cols-2 gap-4">
-                            <div>
-                                <label className="block text-sm font-medium text-slate-700 mb-1">Team Size</label>
-                                <input type="number" name="team_size" min="1" defaultValue="2" className="w-full p-2 border rounded-lg" required />
-                            </div>
+                        <div className="text-sm text-slate-600">
+                            Team size: <strong>{1 + teamMembers.length}</strong> (you + {teamMembers.length})
+                            {registerEventId.max_team_size && <span className="text-slate-400"> · allowed {registerEventId.min_team_size || 1} - {registerEventId.max_team_size}</span>}
                         </div>
-                        <div>
-                            <label className="block text-sm font-medium text-slate-700 mb-1">Team Members (Name, Reg No, Branch, Section)</label>
-                            <textarea name="member_details" className="w-full p-2 border rounded-lg" rows="4" placeholder="1. John Doe (242FA0..., CSE, Sec-A)&#10;2. Jane Smith (242FA0..., ECE, Sec-B)" required />
+                        <div className="space-y-2">
+                            <div className="flex items-center justify-between">
+                                <label className="block text-sm font-medium text-slate-700">Team Members</label>
+                                {(!registerEventId.max_team_size || 1 + teamMembers.length < registerEventId.max_team_size) && (
+                                    <button type="button" onClick={() => setTeamMembers([...teamMembers, { name: '', reg_no: '', branch: '', section: '' }])} className="text-xs font-bold text-indigo-600 hover:underline">+ Add Member</button>
+                                )}
+                            </div>
+                            {teamMembers.map((member, idx) => (
+                                <div key={idx} className="p-3 bg-slate-50 rounded-xl border border-slate-100 space-y-2">
+                                    <div className="flex justify-between items-center text-xs font-bold text-slate-400 uppercase">
+                                        <span>Member {idx + 1}</span>
+                                        <button type="button" onClick={() => setTeamMembers(teamMembers.filter((_, i) => i !== idx))} className="text-red-400 hover:text-red-600"><Trash2 className="w-3 h-3" /></button>
+                                    </div>
+                                    <div className="grid grid-cols-2 gap-2">
+                                        {[['name', 'Name'], ['reg_no', 'Regd. No'], ['branch', 'Branch'], ['section', 'Section (e.g. A)']].map(([field, placeholder]) => (
+                                            <input key={field} placeholder={placeholder} className="w-full p-2 border rounded-lg text-sm" value={member[field]} onChange={e => { const updated = [...teamMembers]; updated[idx] = { ...updated[idx], [field]: e.target.value }; setTeamMembers(updated); }} required />
+                                        ))}
+                                    </div>
+                                </div>
+                            ))}
+                            {teamMembers.length === 0 && (
+                                <div className="text-center py-3 text-xs text-slate-400 italic">No additional members added yet.</div>
+                            )}
                         </div>
                         <button className="w-full py-3 bg-indigo-600 text-white rounded-xl font-bold hover:bg-indigo-700">Complete Registration</button>
                      </form>
@@ -1235,7 +1268,7 @@ const ClubDetail = () => {
                                                     {reg.team_name ? (
                                                         <div>
                                                             <div className="font-bold text-indigo-600">{reg.team_name}</div>
-                                                            <div className="text-xs whitespace-pre-wrap">{reg.member_details}</div>
+                                                            <div className="text-xs whitespace-pre-wrap">{formatMembers(reg.member_details)}</div>
                                                         </div>
                                                     ) : <span className="text-slate-300">-</span>}
                                                 </td>
@@ -1252,6 +1285,18 @@ const ClubDetail = () => {
     );
 };
 
+// member_details is a JSON list of { name, reg_no, branch, section }; older registrations hold free text
+const formatMembers = (details) => {
+    if (!details) return '';
+    try {
+        const members = JSON.parse(details);
+        if (Array.isArray(members)) {
+            return members.map(m => (typeof m === 'object' && m ? `${m.name || ''} (${m.reg_no || m.registration_number || ''})` : String(m))).join('\n');
+        }
+    } catch (e) { /* legacy free text */ }
+    return details;
+};
+
 const Modal = ({ title, onClose, children, action }) => (
     <div className="fixed inset-0 z-50 flex items-center justify-center p-4 bg-slate-900/40 backdrop-blur-sm">
         <div className="bg-white rounded-3xl w-full max-w-xl max-h-[90vh] flex flex-col shadow-2xl animate-in fade-in zoom-in duration-200">